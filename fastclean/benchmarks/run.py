@@ -0,0 +1,171 @@
+"""Run the generator benchmarks and compare them with a baseline
+
+Usage::
+
+    python -m benchmarks.run --quick -o results.json
+    python -m benchmarks.run --quick --baseline benchmarks/baseline.json
+
+Times are reported both in seconds and normalized by a fixed CPU
+calibration loop, and baselines are compared on the normalized values so a
+baseline recorded on one machine stays meaningful on another.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from .scenarios import Scenario, Workspace, all_scenarios
+
+DEFAULT_TOLERANCE = 0.5
+DEFAULT_MEMORY_TOLERANCE = 0.25
+
+
+def calibrate(rounds: int = 5) -> float:
+    """Best time of a fixed pure-Python workload"""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        total = 0
+        for i in range(300_000):
+            total += i % 7
+        "".join(str(i) for i in range(50_000))
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(scenario: Scenario, backend: str, repeat: int) -> dict:
+    """Time a scenario, then measure its peak memory in a separate run"""
+    with Workspace(backend) as (file_system, output):
+        # Warm up template caches
+        files = scenario.run(file_system, output)
+
+    times = []
+    for _ in range(repeat):
+        with Workspace(backend) as (file_system, output):
+            gc.collect()
+            start = time.perf_counter()
+            scenario.run(file_system, output)
+            times.append(time.perf_counter() - start)
+
+    # tracemalloc slows execution, so it never overlaps the timed runs
+    with Workspace(backend) as (file_system, output):
+        gc.collect()
+        tracemalloc.start()
+        scenario.run(file_system, output)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "params": scenario.params,
+        "files": files,
+        "seconds": min(times),
+        "mean_seconds": statistics.fmean(times),
+        "peak_bytes": peak,
+    }
+
+
+def run(quick: bool, backend: str, repeat: int, only: str | None) -> dict:
+    """Run every selected scenario"""
+    calibration = calibrate()
+    results = {}
+    for scenario in all_scenarios(quick):
+        if only and only not in scenario.name:
+            continue
+        result = measure(scenario, backend, repeat)
+        result["normalized"] = result["seconds"] / calibration
+        results[scenario.name] = result
+        print(
+            f"{scenario.name:<50} {result['seconds'] * 1000:>10.1f} ms"
+            f" {result['peak_bytes'] / 1024:>10.0f} KB {result['files']:>7} files",
+            file=sys.stderr,
+        )
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backend": backend,
+            "quick": quick,
+            "repeat": repeat,
+            "calibration_seconds": calibration,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    current: dict, baseline: dict, tolerance: float, memory_tolerance: float
+) -> list[str]:
+    """Regressions of current against baseline, as messages"""
+    regressions = []
+    for name, base in baseline["results"].items():
+        result = current["results"].get(name)
+        if result is None:
+            continue
+
+        time_ratio = result["normalized"] / base["normalized"]
+        if time_ratio > 1 + tolerance:
+            regressions.append(f"{name}: {time_ratio:.2f}x slower")
+
+        memory_ratio = result["peak_bytes"] / max(base["peak_bytes"], 1)
+        if memory_ratio > 1 + memory_tolerance:
+            regressions.append(f"{name}: {memory_ratio:.2f}x more memory")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="fastclean generator benchmarks")
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Skip the 100/1000 entity and 50 field runs",
+    )
+    parser.add_argument(
+        "--backend",
+        default="memory",
+        choices=["memory", "disk"],
+        help="File system to generate into",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case")
+    parser.add_argument("-k", dest="only", help="Only run scenarios matching this")
+    parser.add_argument("-o", "--output", help="Write results as JSON")
+    parser.add_argument("--baseline", help="Fail on regressions against this JSON")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Allowed relative slowdown (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=DEFAULT_MEMORY_TOLERANCE,
+        help="Allowed relative peak memory growth (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    current = run(args.quick, args.backend, args.repeat, args.only)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(current, indent=2) + "\n")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare(current, baseline, args.tolerance, args.memory_tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("No regressions against baseline", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""Synthetic generator workloads"""
+
+import io
+import shutil
+import tempfile
+from collections.abc import Callable
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastclean.application.interfaces.file_system import IFileSystemService
+from fastclean.application.use_cases.create_project.create_project import (
+    CreateProjectUseCase,
+)
+from fastclean.application.use_cases.create_project.dto import CreateProjectRequest
+from fastclean.application.use_cases.generate_crud.dto import (
+    FieldDefinition,
+    GenerateCRUDRequest,
+)
+from fastclean.application.use_cases.generate_crud.generate_crud import (
+    GenerateCRUDUseCase,
+)
+from fastclean.core.value_objects.auth_type import AuthType
+from fastclean.core.value_objects.project_config import ProjectConfig
+from fastclean.infrastructure.file_system.in_memory_file_system import (
+    InMemoryFileSystemService,
+)
+from fastclean.infrastructure.file_system.local_file_system import (
+    LocalFileSystemService,
+)
+from fastclean.infrastructure.templates.jinja_engine import JinjaTemplateEngine
+from fastclean.infrastructure.validators.project_validator import ProjectValidator
+from fastclean.presentation.cli.base import BaseCommand
+
+ENTITY_COUNTS = [1, 10, 100, 1000]
+FIELD_COUNTS = [1, 10, 50]
+QUICK_ENTITY_COUNTS = [1, 10]
+QUICK_FIELD_COUNTS = [1, 10]
+
+FIELD_TYPES = ["str", "int", "float", "bool", "datetime"]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One benchmark workload
+
+    ``run`` generates into the given file system and output directory and
+    returns the number of files written.
+    """
+
+    name: str
+    run: Callable[[IFileSystemService, Path], int]
+    params: dict
+
+
+def create_project_scenarios() -> list[Scenario]:
+    """CreateProjectUseCase.execute with docker and auth on and off"""
+    scenarios = []
+    for docker in (False, True):
+        for auth in (AuthType.NONE, AuthType.JWT):
+            config = ProjectConfig(auth=auth, include_docker=docker)
+            scenarios.append(
+                Scenario(
+                    name=f"create_project[docker={docker},auth={auth.value}]",
+                    run=_create_project(config),
+                    params={"docker": docker, "auth": auth.value},
+                )
+            )
+    return scenarios
+
+
+def generate_crud_scenarios(quick: bool = False) -> list[Scenario]:
+    """GenerateCRUDUseCase.execute over many entities and fields"""
+    entity_counts = QUICK_ENTITY_COUNTS if quick else ENTITY_COUNTS
+    field_counts = QUICK_FIELD_COUNTS if quick else FIELD_COUNTS
+    return [
+        Scenario(
+            name=f"generate_crud[entities={entities},fields={fields}]",
+            run=_generate_crud(entities, fields),
+            params={"entities": entities, "fields": fields},
+        )
+        for entities in entity_counts
+        for fields in field_counts
+    ]
+
+
+def progress_scenarios() -> list[Scenario]:
+    """generate_crud[entities=10,fields=10] through the CLI's progress bar
+
+    Next to the same case run by execute(), it shows what per-file events
+    and redrawing the progress line add to a run.
+    """
+    return [
+        Scenario(
+            name="generate_crud_progress[entities=10,fields=10]",
+            run=_generate_crud(10, 10, progress=True),
+            params={"entities": 10, "fields": 10},
+        )
+    ]
+
+
+def all_scenarios(quick: bool = False) -> list[Scenario]:
+    return (
+        create_project_scenarios()
+        + generate_crud_scenarios(quick)
+        + progress_scenarios()
+    )
+
+
+def make_fields(count: int) -> list[FieldDefinition]:
+    """Synthetic fields cycling through the supported types"""
+    return [
+        FieldDefinition(name=f"field_{i}", type=FIELD_TYPES[i % len(FIELD_TYPES)])
+        for i in range(count)
+    ]
+
+
+def _create_project(config: ProjectConfig):
+    def run(file_system: IFileSystemService, output: Path) -> int:
+        usecase = CreateProjectUseCase(file_system, _engine(), ProjectValidator())
+        response = usecase.execute(
+            CreateProjectRequest(name="bench_project", path=output, config=config)
+        )
+        return response.files_created
+
+    return run
+
+
+def _generate_crud(entities: int, fields: int, progress: bool = False):
+    field_definitions = make_fields(fields)
+
+    def run(file_system: IFileSystemService, output: Path) -> int:
+        file_system.create_directory(output)
+        usecase = GenerateCRUDUseCase(file_system, _engine())
+        written = 0
+        for i in range(entities):
+            request = GenerateCRUDRequest(
+                entity_name=f"Entity{i}",
+                project_path=output,
+                fields=field_definitions,
+            )
+            if progress:
+                with redirect_stdout(io.StringIO()):
+                    response = _ProgressCommand().run_with_progress(
+                        "Generating CRUD files...", usecase.stream(request)
+                    )
+            else:
+                response = usecase.execute(request)
+            written += len(response.files_created)
+        return written
+
+    return run
+
+
+class _ProgressCommand(BaseCommand):
+    """A command that only reports progress, as crud and init do"""
+
+    def execute(self, args: dict) -> int:
+        return 0
+
+
+_ENGINE: JinjaTemplateEngine | None = None
+
+
+def _engine() -> JinjaTemplateEngine:
+    # Shared so repeats measure generation, not template compilation
+    global _ENGINE
+    if _ENGINE is None:
+        _ENGINE = JinjaTemplateEngine()
+    return _ENGINE
+
+
+class Workspace:
+    """A fresh file system and output directory for one measured run"""
+
+    def __init__(self, backend: str):
+        self._backend = backend
+        self._tmp: str | None = None
+
+    def __enter__(self) -> tuple[IFileSystemService, Path]:
+        if self._backend == "memory":
+            return InMemoryFileSystemService(), Path("/bench")
+        self._tmp = tempfile.mkdtemp(prefix="fastclean-bench-")
+        return LocalFileSystemService(), Path(self._tmp) / "out"
+
+    def __exit__(self, *exc) -> None:
+        if self._tmp:
+            shutil.rmtree(self._tmp, ignore_errors=True)
@@ -390,12 +390,49 @@ def create_templates(base_path: Path = Path("templates")):
         print(f"  ✅ Created: {template_path}")
         created_count += 1
 
+    # Ship a prebuilt index so the CLI doesn't rescan templates on startup
+    write_template_index(base_path)
+
+    # Ship compiled modules so the CLI doesn't recompile templates either
+    compile_templates()
+
     print(f"\n✨ Successfully created {created_count} template files!")
     print(f"📁 Location: {base_path.absolute()}")
     print("\n📝 Directory structure:")
     print_tree(base_path)
 
 
+def write_template_index(base_path: Path):
+    """Write the template index manifest (index.json)"""
+    from fastclean.infrastructure.templates.jinja_engine import JinjaTemplateEngine
+    from fastclean.infrastructure.templates.template_index import TemplateIndex
+
+    index = TemplateIndex.build(base_path, JinjaTemplateEngine.PATH_MAPPINGS)
+    manifest_path = index.write_manifest()
+    print(f"  ✅ Indexed {len(index)} templates: {manifest_path.name}")
+
+
+def compile_templates(base_path: Path = None, target_path: Path = None):
+    """Precompile templates to Python modules loaded via ModuleLoader
+
+    Both paths default to the package directories the engine reads, so the
+    output is picked up wherever the script is run from.
+    """
+    from jinja2 import FileSystemLoader
+
+    from fastclean.infrastructure.file_system.path_resolver import PathResolver
+    from fastclean.infrastructure.templates.jinja_engine import JinjaTemplateEngine
+    from fastclean.infrastructure.templates.precompile import precompile_templates
+
+    base_path = base_path or PathResolver.get_templates_dir()
+    target_path = target_path or PathResolver.get_compiled_templates_dir()
+    environment = JinjaTemplateEngine.create_environment(
+        FileSystemLoader(str(base_path))
+    )
+    count = precompile_templates(base_path, target_path, environment)
+    print(f"  ✅ Precompiled {count} templates: {target_path}")
+
+
 def print_tree(directory: Path, prefix: str = "", is_last: bool = True):
     """Print directory tree"""
     if directory.name.startswith("."):
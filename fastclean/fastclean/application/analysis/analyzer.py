@@ -0,0 +1,48 @@
+import ast
+from collections.abc import Iterable
+
+from fastclean.application.analysis.findings import Finding
+from fastclean.application.analysis.rules import RULES, Module, ProjectIndex, Rule
+
+# Longest code excerpt kept with a finding
+MAX_CODE_LENGTH = 120
+
+
+class ProjectAnalyzer:
+    """Run anti-pattern rules over the parsed modules of a project
+
+    Findings are ranked by estimated impact, most costly first.
+    """
+
+    def __init__(self, rules: Iterable[Rule] = RULES):
+        self._rules = tuple(rules)
+
+    def analyze(self, modules: list[Module]) -> list[Finding]:
+        """Find every rule match in the modules"""
+        index = ProjectIndex.build(modules)
+        findings = [
+            self._finding(rule, module, node)
+            for module in modules
+            for rule in self._rules
+            for node in rule.check(module, index)
+        ]
+        return sorted(
+            findings, key=lambda f: (-f.impact, str(f.path), f.line, f.column)
+        )
+
+    @staticmethod
+    def _finding(rule: Rule, module: Module, node: ast.AST) -> Finding:
+        code = " ".join(ast.unparse(node).split())
+        if len(code) > MAX_CODE_LENGTH:
+            code = code[: MAX_CODE_LENGTH - 1] + "…"
+        return Finding(
+            rule=rule.id,
+            severity=rule.severity,
+            impact=rule.impact,
+            path=module.path,
+            line=node.lineno,
+            column=node.col_offset + 1,
+            message=rule.message,
+            suggestion=rule.suggestion,
+            code=code,
+        )
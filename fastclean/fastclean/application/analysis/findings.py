@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+HIGH = "high"
+MEDIUM = "medium"
+LOW = "low"
+
+# Severities from most to least severe
+SEVERITIES = (HIGH, MEDIUM, LOW)
+
+
+@dataclass(frozen=True)
+class Finding:
+    """One occurrence of an anti-pattern in a project file
+
+    ``impact`` is the rule's estimated relative cost, from 1 (minor) to 10
+    (severe), which findings are ranked by.
+    """
+
+    rule: str
+    severity: str
+    impact: int
+    path: Path
+    line: int
+    column: int
+    message: str
+    suggestion: str
+    code: str = ""
+
+    def to_dict(self, root: Path) -> dict:
+        """Plain data, with the path relative to the project root"""
+        return {
+            "rule": self.rule,
+            "severity": self.severity,
+            "impact": self.impact,
+            "path": self.path.relative_to(root).as_posix(),
+            "line": self.line,
+            "column": self.column,
+            "message": self.message,
+            "suggestion": self.suggestion,
+            "code": self.code,
+        }
+
+
+def at_least(severity: str, threshold: str) -> bool:
+    """Whether a severity is as severe as a threshold or more"""
+    return SEVERITIES.index(severity) <= SEVERITIES.index(threshold)
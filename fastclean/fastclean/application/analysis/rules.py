@@ -0,0 +1,288 @@
+import ast
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from fastclean.application.analysis.findings import HIGH, LOW, MEDIUM
+
+# Receivers whose async methods a sync caller is likely to forget to await
+ASYNC_RECEIVERS = ("repositor", "session", "service", "client", "gateway")
+
+# Calls that block the thread they run on
+BLOCKING_CALLS = {
+    "time.sleep",
+    "requests.get",
+    "requests.post",
+    "requests.put",
+    "requests.patch",
+    "requests.delete",
+    "requests.request",
+    "urllib.request.urlopen",
+    "urlopen",
+    "subprocess.run",
+    "subprocess.call",
+    "subprocess.check_output",
+}
+
+# Session methods that send pending writes to the database
+WRITES = ("flush", "commit")
+
+_FUNCTIONS = (ast.FunctionDef, ast.AsyncFunctionDef)
+_SCOPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)
+
+
+@dataclass
+class Module:
+    """A parsed project file"""
+
+    path: Path
+    tree: ast.Module
+
+
+@dataclass
+class ProjectIndex:
+    """Facts about the whole project that rules look up"""
+
+    # Method names only ever defined as async
+    async_methods: set[str] = field(default_factory=set)
+
+    @classmethod
+    def build(cls, modules: Iterable[Module]) -> "ProjectIndex":
+        """Index a project's modules"""
+        async_names, sync_names = set(), set()
+        for module in modules:
+            for node in ast.walk(module.tree):
+                if not isinstance(node, ast.ClassDef):
+                    continue
+                for item in node.body:
+                    if isinstance(item, ast.AsyncFunctionDef):
+                        async_names.add(item.name)
+                    elif isinstance(item, ast.FunctionDef):
+                        sync_names.add(item.name)
+        return cls(async_names - sync_names)
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A hot-path anti-pattern, its estimated impact and its fix"""
+
+    id: str
+    severity: str
+    # Estimated relative cost, from 1 (minor) to 10 (severe)
+    impact: int
+    message: str
+    suggestion: str
+    check: Callable[[Module, ProjectIndex], Iterator[ast.AST]]
+
+
+def _functions(tree: ast.AST, is_async: bool) -> Iterator[ast.AST]:
+    for node in ast.walk(tree):
+        if isinstance(node, _FUNCTIONS) and (
+            isinstance(node, ast.AsyncFunctionDef) == is_async
+        ):
+            yield node
+
+
+def _body(node: ast.AST) -> Iterator[ast.AST]:
+    """Nodes below a function or statement, not those of nested scopes"""
+    stack = list(ast.iter_child_nodes(node))
+    while stack:
+        child = stack.pop()
+        yield child
+        if not isinstance(child, _SCOPES):
+            stack.extend(ast.iter_child_nodes(child))
+
+
+def _in_order(nodes: Iterable[ast.AST]) -> list[ast.AST]:
+    return sorted(nodes, key=lambda node: (node.lineno, node.col_offset))
+
+
+def _method_call(node: ast.AST) -> str | None:
+    """Name of the method a call invokes, e.g. "execute" for s.execute()"""
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    return None
+
+
+def sync_call_to_async(module: Module, index: ProjectIndex) -> Iterator[ast.AST]:
+    for function in _functions(module.tree, is_async=False):
+        nodes = list(_body(function))
+        # A coroutine handed to another call (asyncio.run(...)) is consumed
+        arguments = {
+            id(argument)
+            for node in nodes
+            if isinstance(node, ast.Call)
+            for argument in node.args
+        }
+        for node in nodes:
+            if (
+                _method_call(node) in index.async_methods
+                and id(node) not in arguments
+                and isinstance(node.func.value, ast.Attribute)
+                and any(
+                    name in node.func.value.attr.lower() for name in ASYNC_RECEIVERS
+                )
+            ):
+                yield node
+
+
+def blocking_call_in_async(module: Module, index: ProjectIndex) -> Iterator[ast.AST]:
+    for function in _functions(module.tree, is_async=True):
+        for node in _body(function):
+            if isinstance(node, ast.Call) and ast.unparse(node.func) in BLOCKING_CALLS:
+                yield node
+
+
+def offset_pagination(module: Module, index: ProjectIndex) -> Iterator[ast.AST]:
+    for node in ast.walk(module.tree):
+        if _method_call(node) == "offset" and node.args:
+            yield node
+
+
+def await_in_loop(module: Module, index: ProjectIndex) -> Iterator[ast.AST]:
+    for function in _functions(module.tree, is_async=True):
+        seen = set()
+        for loop in _body(function):
+            if not isinstance(loop, (ast.For, ast.While)):
+                continue
+            for statement in loop.body:
+                for node in [statement, *_body(statement)]:
+                    if (
+                        isinstance(node, ast.Await)
+                        and _method_call(node.value)
+                        and id(node) not in seen
+                    ):
+                        seen.add(id(node))
+                        yield node
+
+
+def sql_echo(module: Module, index: ProjectIndex) -> Iterator[ast.AST]:
+    for node in ast.walk(module.tree):
+        if not isinstance(node, ast.Call):
+            continue
+        if not ast.unparse(node.func).endswith(
+            ("create_engine", "create_async_engine")
+        ):
+            continue
+        for keyword in node.keywords:
+            if keyword.arg == "echo" and not (
+                isinstance(keyword.value, ast.Constant) and keyword.value.value is False
+            ):
+                yield node
+
+
+def debug_default_true(module: Module, index: ProjectIndex) -> Iterator[ast.AST]:
+    for node in ast.walk(module.tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for item in node.body:
+            if isinstance(item, ast.AnnAssign):
+                targets, value = [item.target], item.value
+            elif isinstance(item, ast.Assign):
+                targets, value = item.targets, item.value
+            else:
+                continue
+            if (
+                any(isinstance(t, ast.Name) and t.id == "DEBUG" for t in targets)
+                and isinstance(value, ast.Constant)
+                and value.value is True
+            ):
+                yield item
+
+
+def create_all_at_startup(module: Module, index: ProjectIndex) -> Iterator[ast.AST]:
+    for node in ast.walk(module.tree):
+        if isinstance(node, ast.Attribute) and node.attr == "create_all":
+            yield node
+
+
+def refresh_after_write(module: Module, index: ProjectIndex) -> Iterator[ast.AST]:
+    for function in _functions(module.tree, is_async=True):
+        awaited = _in_order(
+            node
+            for node in _body(function)
+            if isinstance(node, ast.Await) and _method_call(node.value)
+        )
+        written = False
+        for node in awaited:
+            method = _method_call(node.value)
+            if method in WRITES:
+                written = True
+            elif method == "refresh" and written:
+                yield node
+
+
+RULES = (
+    Rule(
+        "sync-call-to-async",
+        HIGH,
+        9,
+        "Sync function calls an async method without awaiting it, so it "
+        "returns a coroutine instead of the result",
+        "Make the caller async and await the call",
+        sync_call_to_async,
+    ),
+    Rule(
+        "blocking-call-in-async",
+        HIGH,
+        8,
+        "Blocking call inside an async function stalls the event loop for "
+        "every request",
+        "Use an async client (httpx.AsyncClient, asyncio.sleep) or move the "
+        "call to a thread with asyncio.to_thread",
+        blocking_call_in_async,
+    ),
+    Rule(
+        "offset-pagination",
+        HIGH,
+        7,
+        "OFFSET pagination reads and discards every skipped row, so deep "
+        "pages get slower",
+        "Paginate by key: filter on the last seen id, order by id and limit",
+        offset_pagination,
+    ),
+    Rule(
+        "await-in-loop",
+        MEDIUM,
+        6,
+        "Awaiting inside a loop costs one round trip per iteration",
+        "Batch the work into one query (IN, bulk insert) or gather independent "
+        "calls with asyncio.gather",
+        await_in_loop,
+    ),
+    Rule(
+        "sql-echo",
+        MEDIUM,
+        5,
+        "Engine echo logs every SQL statement on the request path when enabled",
+        "Pass echo=False and enable the sqlalchemy.engine logger only when needed",
+        sql_echo,
+    ),
+    Rule(
+        "debug-default-true",
+        MEDIUM,
+        5,
+        "DEBUG defaults to True, so production runs in debug mode unless the "
+        "environment overrides it",
+        "Default DEBUG to False and turn it on in the development .env",
+        debug_default_true,
+    ),
+    Rule(
+        "create-all-at-startup",
+        MEDIUM,
+        4,
+        "metadata.create_all inspects the schema on every start and races "
+        "between workers",
+        "Apply schema changes with migrations (alembic upgrade head) at deploy",
+        create_all_at_startup,
+    ),
+    Rule(
+        "refresh-after-write",
+        LOW,
+        3,
+        "Refreshing after a flush or commit adds a SELECT round trip per write",
+        "Fetch generated values with RETURNING or eager_defaults, or build the "
+        "response from the written object",
+        refresh_after_write,
+    ),
+)
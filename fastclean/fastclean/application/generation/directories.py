@@ -0,0 +1,104 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastclean.application.generation.profiler import NULL_PROFILER, Profiler
+from fastclean.application.interfaces.file_system import IFileSystemService
+
+PACKAGE_MARKER = "__init__.py"
+
+
+@dataclass(frozen=True)
+class DirectoryStats:
+    """What a directory pass created and the mkdir calls it avoided"""
+
+    directories: int
+    markers: int
+    mkdir_calls: int
+    mkdir_calls_saved: int
+
+
+@dataclass(frozen=True)
+class DirectoryPlan:
+    """Deepest directories of a generation run and its package markers"""
+
+    directories: tuple[Path, ...]
+    markers: tuple[Path, ...]
+    # Calls of mkdir(parents=True) made without a plan: one per declared
+    # package directory and one per file written, markers included
+    unplanned_mkdir_calls: int
+
+    def apply(
+        self, file_system: IFileSystemService, profiler: Profiler | None = None
+    ) -> DirectoryStats:
+        """Create every directory in one pass and the missing markers"""
+        file_system.create_directories(self.directories)
+
+        markers = 0
+        for marker in self.markers:
+            # Left untouched when it exists, e.g. when updating a project
+            if not file_system.file_exists(marker):
+                file_system.create_file(marker, "")
+                markers += 1
+
+        stats = DirectoryStats(
+            directories=len(self.directories),
+            markers=markers,
+            mkdir_calls=len(self.directories),
+            mkdir_calls_saved=max(
+                self.unplanned_mkdir_calls - len(self.directories), 0
+            ),
+        )
+        profiler = profiler or NULL_PROFILER
+        profiler.count("directories", stats.directories)
+        profiler.count("package_markers", stats.markers)
+        profiler.count("mkdir_calls", stats.mkdir_calls)
+        profiler.count("mkdir_calls_saved", stats.mkdir_calls_saved)
+        return stats
+
+
+class DirectoryPlanner:
+    """Plan the directories of a generation run from its declared outputs
+
+    Collects the files a run writes and the directories that are Python
+    packages, then plans the minimal set of directories: those no other
+    planned directory lies in. Creating them creates everything else, and
+    file systems remember which directories exist, so writing the files
+    afterwards needs no further mkdir or stat calls.
+    """
+
+    def __init__(self, root: Path):
+        self._root = root
+        self._files: set[Path] = set()
+        self._packages: set[Path] = set()
+
+    def add_files(self, paths: Iterable[Path]) -> "DirectoryPlanner":
+        """Add files to be written, relative to the root or absolute"""
+        self._files.update(self._root / path for path in paths)
+        return self
+
+    def add_packages(self, paths: Iterable[Path]) -> "DirectoryPlanner":
+        """Add directories that get an empty ``__init__.py``"""
+        self._packages.update(self._root / path for path in paths)
+        return self
+
+    def plan(self) -> DirectoryPlan:
+        """The deepest directories to create, and the markers"""
+        markers = {package / PACKAGE_MARKER for package in self._packages}
+        needed = {self._root, *self._packages}
+        needed.update(path.parent for path in self._files | markers)
+
+        # Creating a directory creates its parents, so only the deepest
+        # directories are planned
+        ancestors: set[Path] = set()
+        for directory in needed:
+            for parent in directory.parents:
+                if parent in ancestors:
+                    break
+                ancestors.add(parent)
+
+        return DirectoryPlan(
+            directories=tuple(sorted(needed - ancestors)),
+            markers=tuple(sorted(markers)),
+            unplanned_mkdir_calls=len(self._packages) + len(self._files | markers),
+        )
@@ -0,0 +1,97 @@
+import asyncio
+from collections.abc import Callable, Generator
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TypeVar
+
+# Kinds of generation events, in the order a file goes through them
+PLANNED = "planned"
+RENDERED = "rendered"
+WRITTEN = "written"
+SKIPPED = "skipped"
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class GenerationEvent:
+    """Progress of one file of a generation run
+
+    ``index`` is the file's 1-based position among the ``total`` files of
+    the run and ``elapsed`` the seconds since the run started. Written and
+    skipped events end a file: they carry the bytes written and the render
+    status (created, updated or unchanged) with its reason.
+    """
+
+    kind: str
+    path: Path
+    index: int
+    total: int
+    elapsed: float
+    bytes_written: int = 0
+    status: str = ""
+    reason: str = ""
+
+    @property
+    def done(self) -> bool:
+        """Whether this event finishes its file"""
+        return self.kind in (WRITTEN, SKIPPED)
+
+
+def drain(
+    events: Generator[GenerationEvent, None, T],
+    on_event: Callable[[GenerationEvent], None] | None = None,
+) -> T:
+    """Consume an event stream and return the stream's result"""
+    while True:
+        try:
+            event = next(events)
+        except StopIteration as stop:
+            return stop.value
+        if on_event is not None:
+            on_event(event)
+
+
+async def drain_async(
+    events: Generator[GenerationEvent, None, T],
+    on_event: Callable[[GenerationEvent], None] | None = None,
+    executor: Executor | None = None,
+) -> T:
+    """Consume an event stream in worker threads without blocking the loop
+
+    The stream advances one step at a time in ``executor`` (the loop's
+    default executor when None). If the awaiting task is cancelled or
+    ``on_event`` raises, the stream is closed once its current step is
+    done, which rolls its run back.
+    """
+    loop = asyncio.get_running_loop()
+    step = None
+    try:
+        while True:
+            step = loop.run_in_executor(executor, _advance, events)
+            finished, value = await asyncio.shield(step)
+            if finished:
+                return value
+            if on_event is not None:
+                on_event(value)
+    except BaseException:
+        await asyncio.shield(_close(events, step, executor))
+        raise
+
+
+def _advance(events: Generator) -> tuple[bool, object]:
+    # StopIteration cannot cross a future, so the result is returned instead
+    try:
+        return False, next(events)
+    except StopIteration as stop:
+        return True, stop.value
+
+
+async def _close(
+    events: Generator, step: asyncio.Future | None, executor: Executor | None
+) -> None:
+    if step is not None:
+        # A generator cannot be closed while a worker is running it
+        await asyncio.wait([step])
+    await asyncio.get_running_loop().run_in_executor(executor, events.close)
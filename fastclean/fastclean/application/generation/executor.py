@@ -0,0 +1,335 @@
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from fastclean.application.generation.events import (
+    RENDERED,
+    SKIPPED,
+    WRITTEN,
+    GenerationEvent,
+)
+from fastclean.application.generation.hashing import hash_context, hash_text
+from fastclean.application.generation.lock import GenerationLock, LockEntry
+from fastclean.application.generation.profiler import (
+    COMPILE,
+    FORMAT,
+    LOAD,
+    NULL_PROFILER,
+    RENDER,
+    WRITE,
+    Profiler,
+)
+from fastclean.application.interfaces.file_system import IFileSystemService
+from fastclean.application.interfaces.post_processor import IPostProcessor
+from fastclean.application.interfaces.render_cache import IRenderCache
+from fastclean.application.interfaces.template_engine import ITemplateEngine
+from fastclean.core.entities.template import Template
+from fastclean.core.exceptions.base import DomainException
+from fastclean.core.exceptions.validation import TemplateRenderException
+
+if TYPE_CHECKING:
+    from fastclean.application.generation.plan import GenerationPlan, PlannedJob
+
+CREATED = "created"
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """A template to render into one output file"""
+
+    template_name: str
+    category: str
+    # Relative to the output root; taken from the template when None
+    output_path: Path | None = None
+
+    @property
+    def qualified_name(self) -> str:
+        return f"{self.category}/{self.template_name}"
+
+
+@dataclass(frozen=True)
+class RenderResult:
+    """Outcome of one render job"""
+
+    path: Path
+    status: str
+    reason: str = ""
+
+    @property
+    def written(self) -> bool:
+        return self.status != UNCHANGED
+
+
+@dataclass(frozen=True)
+class _Rendered:
+    job: RenderJob
+    path: Path
+    entry: LockEntry
+    content: str | None
+    reason: str
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Number of workers for a --jobs value (0 means one per CPU)"""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+class RenderExecutor:
+    """Render templates and write the results to the file system
+
+    With more than one worker, templates are rendered in a thread pool while
+    the calling thread writes finished files in job order, so output is the
+    same as a sequential run and writes overlap with rendering. ``stream``
+    yields an event as each file is rendered and written, so callers can
+    report progress without holding every result.
+
+    Given a GenerationLock, renders whose template and context are unchanged
+    are skipped, and files whose rendered bytes are identical are left
+    untouched. Given an IRenderCache, renders are looked up by template,
+    template hash and context hash first, so a cached file is written
+    without compiling or rendering its template.
+
+    Given an IPostProcessor, each render is formatted before it is hashed,
+    cached and written. Its fingerprint is part of the context hash, so
+    switching formatters re-renders every file.
+    """
+
+    def __init__(
+        self,
+        file_system: IFileSystemService,
+        template_engine: ITemplateEngine,
+        jobs: int = 1,
+        lock: GenerationLock | None = None,
+        profiler: Profiler | None = None,
+        render_cache: IRenderCache | None = None,
+        post_processor: IPostProcessor | None = None,
+    ):
+        self._file_system = file_system
+        self._template_engine = template_engine
+        self._jobs = resolve_jobs(jobs)
+        self._lock = lock
+        self._profiler = profiler or NULL_PROFILER
+        self._render_cache = render_cache
+        self._post_processor = post_processor
+
+    def run(
+        self, jobs: list[RenderJob], context: dict[str, Any], root: Path
+    ) -> list[RenderResult]:
+        """Render and write all jobs, returning their results in job order"""
+        return [
+            RenderResult(event.path, event.status, event.reason)
+            for event in self.stream(jobs, context, root)
+            if event.done
+        ]
+
+    def stream(
+        self,
+        jobs: list[RenderJob],
+        context: dict[str, Any],
+        root: Path,
+        started: float | None = None,
+    ) -> Iterator[GenerationEvent]:
+        """Render and write all jobs, yielding an event per step in job order
+
+        Each file yields a rendered event (unless its render was skipped)
+        and then a written or skipped event. ``started`` is the
+        ``time.perf_counter()`` that elapsed times are measured from.
+        """
+        started = time.perf_counter() if started is None else started
+        context_hash = hash_context(context)
+        if self._post_processor is not None and self._post_processor.fingerprint:
+            context_hash = hash_text(
+                f"{context_hash}\0{self._post_processor.fingerprint}"
+            )
+
+        if self._jobs == 1 or len(jobs) < 2:
+            rendered = (self._render(job, context, context_hash, root) for job in jobs)
+            yield from self._events(rendered, len(jobs), started)
+            return
+
+        with ThreadPoolExecutor(max_workers=self._jobs) as pool:
+            futures = [
+                pool.submit(self._render, job, context, context_hash, root)
+                for job in jobs
+            ]
+            try:
+                yield from self._events(
+                    (future.result() for future in futures), len(jobs), started
+                )
+            except BaseException:
+                self._cancel(futures)
+                raise
+
+    def _events(
+        self, rendered: Iterator[_Rendered], total: int, started: float
+    ) -> Iterator[GenerationEvent]:
+        for index, item in enumerate(rendered, 1):
+            if item.content is not None:
+                yield GenerationEvent(
+                    RENDERED, item.path, index, total, time.perf_counter() - started
+                )
+            result = self._write(item)
+            yield GenerationEvent(
+                WRITTEN if result.written else SKIPPED,
+                result.path,
+                index,
+                total,
+                time.perf_counter() - started,
+                bytes_written=_utf8_size(item.content) if result.written else 0,
+                status=result.status,
+                reason=result.reason,
+            )
+
+    def plan(
+        self, plan: "GenerationPlan", context: dict[str, Any]
+    ) -> "list[PlannedJob]":
+        """Schedule a plan for a context without rendering anything"""
+        return plan.schedule(context, lambda job: self.locate(job, context))
+
+    def run_plan(
+        self, plan: "GenerationPlan", context: dict[str, Any], root: Path
+    ) -> list[RenderResult]:
+        """Render and write every job of a plan, in plan order"""
+        return self.run(
+            [planned.job for planned in self.plan(plan, context)], context, root
+        )
+
+    def compile(self, paths: list[Path]) -> None:
+        """Compile written files to bytecode, once they are published
+
+        Each file is timed as a stage of the template it was rendered from.
+        With more than one worker, files are compiled concurrently.
+        """
+        if self._post_processor is None:
+            return
+        if self._jobs == 1 or len(paths) < 2:
+            for path in paths:
+                self._compile(path)
+            return
+        with ThreadPoolExecutor(max_workers=self._jobs) as pool:
+            list(pool.map(self._compile, paths))
+
+    def locate(self, job: RenderJob, context: dict[str, Any]) -> Path:
+        """Output path of a job relative to the root"""
+        if job.output_path is not None:
+            return job.output_path
+        template = self._template_engine.load_template(job.template_name, job.category)
+        return template.render_path(context)
+
+    def _render(
+        self, job: RenderJob, context: dict[str, Any], context_hash: str, root: Path
+    ) -> _Rendered:
+        try:
+            with self._profiler.template(job.qualified_name, LOAD):
+                template = self._template_engine.load_template(
+                    job.template_name, job.category
+                )
+            path = root / (job.output_path or template.render_path(context))
+            template_hash = hash_text(template.content)
+
+            previous = self._lock.get(path) if self._lock else None
+            if (
+                previous is not None
+                and previous.template_hash == template_hash
+                and previous.context_hash == context_hash
+                and self._file_system.file_exists(path)
+            ):
+                return _Rendered(job, path, previous, None, "")
+
+            content = self._render_content(
+                job, path, template, context, template_hash, context_hash
+            )
+        except DomainException:
+            raise
+        except Exception as e:
+            raise TemplateRenderException(job.qualified_name, str(e)) from e
+
+        entry = LockEntry(
+            template=job.qualified_name,
+            template_hash=template_hash,
+            context_hash=context_hash,
+            output_hash=hash_text(content),
+        )
+        return _Rendered(job, path, entry, content, self._reason(previous, entry))
+
+    def _render_content(
+        self,
+        job: RenderJob,
+        path: Path,
+        template: Template,
+        context: dict[str, Any],
+        template_hash: str,
+        context_hash: str,
+    ) -> str:
+        key = None
+        with self._profiler.template(job.qualified_name, RENDER):
+            if self._render_cache is not None:
+                key = hash_text(
+                    f"{job.qualified_name}\0{template_hash}\0{context_hash}"
+                )
+                content = self._render_cache.get(key)
+                if content is not None:
+                    return content
+            content = self._template_engine.render(template, context)
+
+        if self._post_processor is not None:
+            with self._profiler.template(job.qualified_name, FORMAT):
+                content = self._post_processor.format(path, content)
+        if key is not None:
+            self._render_cache.set(key, content)
+        return content
+
+    def _compile(self, path: Path) -> None:
+        entry = self._lock.get(path) if self._lock else None
+        with self._profiler.template(entry.template if entry else path.name, COMPILE):
+            self._post_processor.compile(path)
+
+    def _write(self, rendered: _Rendered) -> RenderResult:
+        with self._profiler.template(rendered.job.qualified_name, WRITE):
+            return self._write_file(rendered)
+
+    def _write_file(self, rendered: _Rendered) -> RenderResult:
+        path = rendered.path
+        if rendered.content is None:
+            result = RenderResult(path, UNCHANGED)
+        elif not self._file_system.file_exists(path):
+            self._file_system.create_file(path, rendered.content)
+            result = RenderResult(path, CREATED, rendered.reason)
+        elif hash_text(self._file_system.read_file(path)) == rendered.entry.output_hash:
+            result = RenderResult(path, UNCHANGED, rendered.reason)
+        else:
+            self._file_system.create_file(path, rendered.content)
+            result = RenderResult(path, UPDATED, rendered.reason)
+
+        if self._lock is not None:
+            self._lock.record(path, rendered.entry)
+        return result
+
+    @staticmethod
+    def _reason(previous: LockEntry | None, entry: LockEntry) -> str:
+        if previous is None:
+            return "new file"
+        changed = []
+        if previous.template_hash != entry.template_hash:
+            changed.append("template")
+        if previous.context_hash != entry.context_hash:
+            changed.append("context")
+        return f"{' and '.join(changed)} changed" if changed else "file missing"
+
+    @staticmethod
+    def _cancel(futures: list[Future]) -> None:
+        for future in futures:
+            future.cancel()
+
+
+def _utf8_size(content: str) -> int:
+    # Generated code is mostly ASCII, whose size needs no encoded copy
+    return len(content) if content.isascii() else len(content.encode("utf-8"))
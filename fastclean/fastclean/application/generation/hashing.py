@@ -0,0 +1,37 @@
+import dataclasses
+import hashlib
+import json
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+
+def hash_text(text: str) -> str:
+    """Content hash of a template source or rendered output"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def hash_context(context: dict[str, Any]) -> str:
+    """Canonical hash of a render context
+
+    Keys are sorted and dataclasses, enums and paths are reduced to plain
+    values, so equal contexts hash equally across runs and processes.
+    """
+    payload = json.dumps(
+        context, sort_keys=True, separators=(",", ":"), default=_canonical
+    )
+    return hash_text(payload)
+
+
+def _canonical(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        # Shallow: the encoder comes back here for nested values, where
+        # asdict() would deep-copy every field first
+        return {f.name: getattr(value, f.name) for f in dataclasses.fields(value)}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Path):
+        return value.as_posix()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
@@ -0,0 +1,145 @@
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from fastclean.application.interfaces.file_system import IFileSystemService
+
+LOCK_FILE_NAME = ".fastclean.lock"
+
+
+@dataclass(frozen=True)
+class LockEntry:
+    """What a generated file was last rendered from"""
+
+    template: str
+    template_hash: str
+    context_hash: str
+    output_hash: str
+
+
+class GenerationLock:
+    """The ``.fastclean.lock`` manifest of a generated project
+
+    Records, for each generated path relative to the project root, the
+    template, context and output hashes of its last render. Later runs use
+    it to skip renders whose inputs did not change. It also records the
+    entities generated so far, by class name, which the route registry is
+    rebuilt from.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        root: Path,
+        entries: dict[str, LockEntry] | None = None,
+        entities: dict[str, str] | None = None,
+    ):
+        self._root = root
+        # Keys are cut from path strings; relative_to parses both paths
+        self._prefix = f"{root.as_posix().rstrip('/')}/"
+        self._entries = dict(entries or {})
+        # Entity class name -> snake_case name
+        self._entities = dict(entities or {})
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, file_system: IFileSystemService, root: Path) -> "GenerationLock":
+        """Load the lock file of a project, or start an empty one"""
+        path = root / LOCK_FILE_NAME
+        if not file_system.file_exists(path):
+            return cls(root)
+
+        try:
+            data = json.loads(file_system.read_file(path))
+            entries = {key: LockEntry(**value) for key, value in data["files"].items()}
+            entities = dict(data.get("entities", {}))
+        except (ValueError, KeyError, TypeError):
+            # A corrupt lock only costs a full regeneration
+            return cls(root)
+        return cls(root, entries, entities)
+
+    def save(self, file_system: IFileSystemService) -> None:
+        """Write the lock file if anything changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "version": self.VERSION,
+                "files": {
+                    key: vars(self._entries[key]) for key in sorted(self._entries)
+                },
+            }
+            if self._entities:
+                data["entities"] = dict(sorted(self._entities.items()))
+            self._dirty = False
+        file_system.create_file(self._root / LOCK_FILE_NAME, _dumps(data))
+
+    def get(self, path: Path) -> LockEntry | None:
+        """Get the entry for a generated path"""
+        return self._entries.get(self._key(path))
+
+    def record(self, path: Path, entry: LockEntry) -> None:
+        """Record the render of a generated path"""
+        key = self._key(path)
+        with self._lock:
+            if self._entries.get(key) != entry:
+                self._entries[key] = entry
+                self._dirty = True
+
+    def record_entity(self, name: str, snake_name: str) -> None:
+        """Record a generated entity"""
+        with self._lock:
+            if self._entities.get(name) != snake_name:
+                self._entities[name] = snake_name
+                self._dirty = True
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def entities(self) -> dict[str, str]:
+        """Generated entities, class name to snake_case name"""
+        with self._lock:
+            return dict(self._entities)
+
+    def paths(self) -> list[str]:
+        """Generated paths relative to the root, sorted"""
+        with self._lock:
+            return sorted(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _key(self, path: Path) -> str:
+        key = path.as_posix()
+        if key.startswith(self._prefix):
+            return key[len(self._prefix) :]
+        return key
+
+
+def _dumps(data: dict[str, Any]) -> str:
+    """JSON of the lock, one line per file and entity
+
+    ``json.dumps(indent=2)`` encodes in pure Python; each line here is
+    encoded in C, and the lock still diffs one path at a time.
+    """
+    lines = []
+    for name, value in data.items():
+        if isinstance(value, dict) and value:
+            members = [f"    {_member(key, item)}," for key, item in value.items()]
+            members[-1] = members[-1][:-1]
+            lines += [f"  {json.dumps(name)}: {{", *members, "  },"]
+        else:
+            lines.append(f"  {_member(name, value)},")
+    lines[-1] = lines[-1][:-1]
+    return "\n".join(["{", *lines, "}", ""])
+
+
+def _member(key: str, value: Any) -> str:
+    # One encoder call for the pair, without the enclosing braces
+    return json.dumps({key: value})[1:-1]
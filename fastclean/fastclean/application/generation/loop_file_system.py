@@ -0,0 +1,81 @@
+import asyncio
+from collections.abc import Coroutine, Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, TypeVar
+
+from fastclean.application.interfaces.async_file_system import (
+    IAsyncFileSystemService,
+)
+from fastclean.application.interfaces.file_system import IFileSystemService
+
+T = TypeVar("T")
+
+
+class LoopFileSystem(IFileSystemService):
+    """Synchronous view of an async file system, for worker threads
+
+    Every call is awaited on ``loop`` and blocks the calling thread until it
+    is done, so a synchronous pipeline running beside the loop writes
+    through the async file system and its bound on pending writes. Never
+    call it from the loop's own thread.
+    """
+
+    def __init__(
+        self, file_system: IAsyncFileSystemService, loop: asyncio.AbstractEventLoop
+    ):
+        self._file_system = file_system
+        self._loop = loop
+
+    def create_directory(self, path: Path) -> None:
+        """Create a directory"""
+        self._await(self._file_system.create_directory(path))
+
+    def create_directories(self, paths: Iterable[Path]) -> None:
+        """Create directories and their parents"""
+        self._await(self._file_system.create_directories(list(paths)))
+
+    def create_file(self, path: Path, content: str) -> None:
+        """Create a file with content"""
+        self._await(self._file_system.create_file(path, content))
+
+    def directory_exists(self, path: Path) -> bool:
+        """Check if directory exists"""
+        return self._await(self._file_system.directory_exists(path))
+
+    def file_exists(self, path: Path) -> bool:
+        """Check if file exists"""
+        return self._await(self._file_system.file_exists(path))
+
+    def read_file(self, path: Path) -> str:
+        """Read file content"""
+        return self._await(self._file_system.read_file(path))
+
+    def list_files(self, path: Path, pattern: str = "*") -> list[Path]:
+        """List files in directory"""
+        return self._await(self._file_system.list_files(path, pattern))
+
+    def session(self) -> "LoopFileSystem":
+        """A session of the async file system, on the same loop"""
+        return LoopFileSystem(self._file_system.session(), self._loop)
+
+    @contextmanager
+    def exclusive(self, path: Path) -> Iterator[None]:
+        """Hold the async file system's lock on a directory"""
+        lock = self._file_system.exclusive(path)
+        self._await(lock.__aenter__())
+        try:
+            yield
+        finally:
+            self._await(lock.__aexit__(None, None, None))
+
+    def commit(self) -> None:
+        """Commit the async file system"""
+        self._await(self._file_system.commit())
+
+    def rollback(self) -> None:
+        """Roll back the async file system"""
+        self._await(self._file_system.rollback())
+
+    def _await(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
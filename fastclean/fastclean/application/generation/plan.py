@@ -0,0 +1,153 @@
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+
+from fastclean.application.generation.executor import RenderJob
+from fastclean.core.exceptions.validation import InvalidPlanException
+
+
+@dataclass(frozen=True)
+class PlanNode:
+    """A template rendered into one output file of a generation plan"""
+
+    name: str
+    template: str
+    category: str
+    # Relative to the output root, with ``{key}`` fields filled from the
+    # context; taken from the template when None
+    output: str | None = None
+    # Context key that must be truthy for the node to be generated
+    condition: str | None = None
+    # Nodes whose files are written before this one
+    depends_on: tuple[str, ...] = ()
+
+    def applies(self, context: dict[str, Any]) -> bool:
+        return self.condition is None or bool(context.get(self.condition))
+
+
+@dataclass(frozen=True)
+class PlannedJob:
+    """A scheduled node with its resolved output path"""
+
+    name: str
+    job: RenderJob
+    path: Path
+    depends_on: tuple[str, ...] = ()
+
+
+class GenerationPlan:
+    """Declarative set of files to generate and the order between them
+
+    ``schedule`` turns the plan into render jobs for a context: nodes whose
+    condition is false are dropped, nodes writing the same file with the same
+    template are merged, and jobs are returned in a dependency-respecting
+    order that otherwise keeps the order nodes were added in. RenderExecutor
+    renders all jobs concurrently and writes them in that order, so
+    dependencies only constrain writes, never rendering.
+
+    ``packages`` are directory patterns, filled like output patterns, that
+    are Python packages and get an empty ``__init__.py``.
+    """
+
+    def __init__(self, nodes: Iterable[PlanNode] = (), packages: Iterable[str] = ()):
+        self._nodes: dict[str, PlanNode] = {}
+        self._packages = list(packages)
+        for node in nodes:
+            self.add(node)
+
+    @property
+    def nodes(self) -> list[PlanNode]:
+        return list(self._nodes.values())
+
+    def add(self, node: PlanNode) -> None:
+        """Add a node, rejecting duplicate names"""
+        if node.name in self._nodes:
+            raise InvalidPlanException(f"Duplicate plan node '{node.name}'")
+        self._nodes[node.name] = node
+
+    def __add__(self, other: "GenerationPlan") -> "GenerationPlan":
+        return GenerationPlan(
+            [*self.nodes, *other.nodes], [*self._packages, *other._packages]
+        )
+
+    def packages(self, context: dict[str, Any]) -> list[Path]:
+        """Package directories for a context, relative to the output root"""
+        return [Path(package.format_map(context)) for package in self._packages]
+
+    def schedule(
+        self, context: dict[str, Any], locate: Callable[[RenderJob], Path]
+    ) -> list[PlannedJob]:
+        """Render jobs for a context, deduplicated and in dependency order
+
+        ``locate`` gives the output path of a job whose node has no output
+        pattern, usually from the template itself.
+        """
+        active = [node for node in self._nodes.values() if node.applies(context)]
+        active_names = {node.name for node in active}
+
+        # Merge nodes writing the same file; later names alias the first
+        planned: dict[Path, PlannedJob] = {}
+        alias: dict[str, str] = {}
+        for node in active:
+            missing = set(node.depends_on) - self._nodes.keys()
+            if missing:
+                raise InvalidPlanException(
+                    f"Plan node '{node.name}' depends on unknown "
+                    f"{', '.join(sorted(missing))}"
+                )
+            job = RenderJob(node.template, node.category)
+            path = Path(node.output.format_map(context)) if node.output else locate(job)
+            # Dependencies on nodes switched off by their condition are dropped
+            depends_on = tuple(d for d in node.depends_on if d in active_names)
+
+            existing = planned.get(path)
+            if existing is None:
+                planned[path] = PlannedJob(
+                    node.name,
+                    RenderJob(node.template, node.category, path),
+                    path,
+                    depends_on,
+                )
+            elif existing.job.qualified_name != job.qualified_name:
+                raise InvalidPlanException(
+                    f"Plan nodes '{existing.name}' and '{node.name}' "
+                    f"both write {path}"
+                )
+            else:
+                alias[node.name] = existing.name
+                planned[path] = replace(
+                    existing, depends_on=(*existing.depends_on, *depends_on)
+                )
+
+        jobs = {}
+        for job in planned.values():
+            depends_on = tuple(dict.fromkeys(alias.get(d, d) for d in job.depends_on))
+            # Jobs nothing was merged into are kept as they are
+            if depends_on != job.depends_on:
+                job = replace(job, depends_on=depends_on)
+            jobs[job.name] = job
+        return self._order(jobs)
+
+    @staticmethod
+    def _order(jobs: dict[str, PlannedJob]) -> list[PlannedJob]:
+        # Depth-first topological sort, visiting jobs in insertion order
+        ordered: list[PlannedJob] = []
+        state: dict[str, bool] = {}
+
+        def visit(name: str, chain: tuple[str, ...]) -> None:
+            if state.get(name):
+                return
+            if name in state:
+                cycle = " -> ".join((*chain[chain.index(name) :], name))
+                raise InvalidPlanException(f"Plan has a cycle: {cycle}")
+            state[name] = False
+            for dependency in jobs[name].depends_on:
+                if dependency != name:
+                    visit(dependency, (*chain, name))
+            state[name] = True
+            ordered.append(jobs[name])
+
+        for name in jobs:
+            visit(name, ())
+        return ordered
@@ -0,0 +1,133 @@
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+
+# Stages of a template's life measured by RenderExecutor
+LOAD = "load"
+RENDER = "render"
+FORMAT = "format"
+WRITE = "write"
+# Measured by the use case, once the run is committed
+COMPILE = "compile"
+
+
+@dataclass
+class Timing:
+    """Accumulated cost of a phase or template stage"""
+
+    wall: float = 0.0
+    cpu: float = 0.0
+    bytes_written: int = 0
+    calls: int = 0
+
+    def add(self, wall: float, cpu: float) -> None:
+        self.wall += wall
+        self.cpu += cpu
+        self.calls += 1
+
+
+class Profiler:
+    """Record wall time, CPU time and bytes written per phase and template
+
+    Phases are sequential steps of a use case (``validate``,
+    ``create_structure``, ...). Template stages (load, render, write) may run
+    on worker threads, so their CPU time is per thread, while phase CPU time
+    covers the whole process. Bytes are attributed to the current phase and,
+    inside a template's write stage, to that template. Counters record
+    plain quantities, such as directories created.
+    """
+
+    def __init__(self):
+        self.phases: dict[str, Timing] = {}
+        self.templates: dict[str, dict[str, Timing]] = {}
+        self.counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._phase: str | None = None
+        self._local = threading.local()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Measure a phase of a use case"""
+        previous, self._phase = self._phase, name
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - wall, time.process_time() - cpu
+            with self._lock:
+                self.phases.setdefault(name, Timing()).add(*elapsed)
+            self._phase = previous
+
+    @contextmanager
+    def template(self, name: str, stage: str) -> Iterator[None]:
+        """Measure one stage (load, render, format, write, compile) of a template"""
+        self._local.template = name
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - wall, time.thread_time() - cpu
+            with self._lock:
+                stages = self.templates.setdefault(name, {})
+                stages.setdefault(stage, Timing()).add(*elapsed)
+            self._local.template = None
+
+    def record_write(self, size: int) -> None:
+        """Attribute written bytes to the current phase and template"""
+        template = getattr(self._local, "template", None)
+        with self._lock:
+            if self._phase is not None:
+                self.phases.setdefault(self._phase, Timing()).bytes_written += size
+            if template is not None:
+                stages = self.templates.setdefault(template, {})
+                stages.setdefault(WRITE, Timing()).bytes_written += size
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Add to a counter"""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def template_totals(self) -> dict[str, Timing]:
+        """Cost of each template over all of its stages"""
+        totals = {}
+        for name, stages in self.templates.items():
+            total = Timing()
+            for timing in stages.values():
+                total.wall += timing.wall
+                total.cpu += timing.cpu
+                total.bytes_written += timing.bytes_written
+            total.calls = stages[RENDER].calls if RENDER in stages else 0
+            totals[name] = total
+        return totals
+
+    def to_dict(self) -> dict:
+        """Report as plain data, e.g. for JSON"""
+        return {
+            "phases": {name: asdict(t) for name, t in self.phases.items()},
+            "templates": {
+                name: {stage: asdict(t) for stage, t in stages.items()}
+                for name, stages in self.templates.items()
+            },
+            "counters": dict(self.counters),
+        }
+
+
+class NullProfiler(Profiler):
+    """Profiler that records nothing, used when profiling is off"""
+
+    def phase(self, name: str):
+        return nullcontext()
+
+    def template(self, name: str, stage: str):
+        return nullcontext()
+
+    def record_write(self, size: int) -> None:
+        pass
+
+    def count(self, name: str, amount: int = 1) -> None:
+        pass
+
+
+NULL_PROFILER = NullProfiler()
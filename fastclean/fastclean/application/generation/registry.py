@@ -0,0 +1,94 @@
+import re
+from pathlib import PurePosixPath
+from typing import Any
+
+from fastclean.application.generation.executor import RenderExecutor, RenderResult
+from fastclean.application.generation.lock import GenerationLock
+from fastclean.application.generation.plan import GenerationPlan, PlanNode
+from fastclean.application.interfaces.file_system import IFileSystemService
+from fastclean.core.exceptions.base import ValidationException
+
+# Generated route modules and repository providers, relative to the root
+ROUTES_DIR = PurePosixPath("src/interfaces/api/v1/routes")
+DEPENDENCIES_PATH = PurePosixPath("src/interfaces/api/dependencies.py")
+
+# A provider function, and the import of the repository class it returns
+_PROVIDER = re.compile(r"^def get_(\w+)_repository\(", re.MULTILINE)
+_REPOSITORY_IMPORT = re.compile(
+    r"repositories\.(\w+)_repository import (\w+)Repository\b"
+)
+
+# The route registry and the repository providers it lists, rendered with
+# registry_context(); both are rebuilt whole, never appended to
+REGISTRY_PLAN = GenerationPlan(
+    [
+        PlanNode(
+            "dependencies",
+            "dependencies",
+            "crud",
+            str(DEPENDENCIES_PATH),
+            condition="entities",
+        ),
+        PlanNode(
+            "registry",
+            "registry",
+            "crud",
+            "src/interfaces/api/registry.py",
+            depends_on=("dependencies",),
+        ),
+    ]
+)
+
+
+def registry_context(lock: GenerationLock) -> dict[str, Any]:
+    """Every generated route module and entity recorded in a lock"""
+    # Matched as strings, the lock holds every generated file of the project
+    prefix = f"{ROUTES_DIR}/"
+    names = [key[len(prefix) :] for key in lock.paths() if key.startswith(prefix)]
+    routers = {
+        PurePosixPath(name).stem
+        for name in names
+        if "/" not in name and name != "__init__.py"
+    }
+    # Every entity has a route module, including those generated before
+    # the lock recorded paths
+    routers = sorted(routers | set(lock.entities.values()))
+    entities = [
+        {"entity_name": name, "entity_name_snake": snake}
+        for name, snake in sorted(lock.entities.items(), key=lambda item: item[1])
+    ]
+    return {"routers": routers, "entities": entities}
+
+
+def adopt_providers(file_system: IFileSystemService, lock: GenerationLock) -> None:
+    """Record the entities of a dependencies.py the lock does not know
+
+    Projects generated before ``.fastclean.lock`` existed had providers
+    appended to dependencies.py. Recording their entities keeps them when
+    the file is rebuilt. A provider whose entity cannot be recognized
+    stops the run, because rebuilding the file would delete it.
+    """
+    path = lock.root / DEPENDENCIES_PATH
+    if lock.get(path) is not None or not file_system.file_exists(path):
+        return
+
+    content = file_system.read_file(path)
+    classes = dict(_REPOSITORY_IMPORT.findall(content))
+    for snake_name in _PROVIDER.findall(content):
+        if snake_name not in classes:
+            raise ValidationException(
+                f"Cannot rebuild {DEPENDENCIES_PATH}: the entity of "
+                f"get_{snake_name}_repository is unknown. Move the provider "
+                "elsewhere or regenerate its entity first."
+            )
+        lock.record_entity(classes[snake_name], snake_name)
+
+
+def write_registry(
+    executor: RenderExecutor,
+    lock: GenerationLock,
+    file_system: IFileSystemService,
+) -> list[RenderResult]:
+    """Render the registry of a lock's project, writing only what changed"""
+    adopt_providers(file_system, lock)
+    return executor.run_plan(REGISTRY_PLAN, registry_context(lock), lock.root)
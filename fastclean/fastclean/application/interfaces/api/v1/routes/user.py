@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from .....application.usecases.user.create_user import CreateUserUseCase
 from .....application.usecases.user.get_user import GetUserUseCase
@@ -8,7 +8,13 @@ from ....api.dependencies import (
     get_get_user_usecase,
     get_list_users_usecase,
 )
-from ....schemas.user import UserCreate, UserResponse
+from ....schemas.user import (
+    UserCreate,
+    UserPage,
+    UserResponse,
+    decode_cursor,
+    encode_cursor,
+)
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -47,20 +53,30 @@ async def get_user(
         raise HTTPException(status_code=404, detail=str(e)) from e
 
 
-@router.get("/", response_model=list[UserResponse])
+@router.get("/", response_model=UserPage)
 async def list_users(
-    skip: int = 0,
-    limit: int = 100,
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=1000),
     usecase: ListUsersUseCase = Depends(get_list_users_usecase),
 ):
-    users = await usecase.execute(skip=skip, limit=limit)
-    return [
-        UserResponse(
-            id=u.id,
-            email=u.email,
-            username=u.username,
-            is_active=u.is_active,
-            created_at=u.created_at,
-        )
-        for u in users
-    ]
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+    # One extra row tells whether there is a next page
+    users = await usecase.execute(after=after, limit=limit + 1)
+    page = users[:limit]
+    return UserPage(
+        items=[
+            UserResponse(
+                id=u.id,
+                email=u.email,
+                username=u.username,
+                is_active=u.is_active,
+                created_at=u.created_at,
+            )
+            for u in page
+        ],
+        next_cursor=encode_cursor(page[-1].id) if len(users) > limit else None,
+    )
@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from pathlib import Path
+
+
+class IAsyncFileSystemService(ABC):
+    """Interface for file system operations awaited from an event loop"""
+
+    @abstractmethod
+    async def create_directory(self, path: Path) -> None:
+        """Create a directory"""
+
+    @abstractmethod
+    async def create_file(self, path: Path, content: str) -> None:
+        """Create a file with content"""
+
+    @abstractmethod
+    async def directory_exists(self, path: Path) -> bool:
+        """Check if directory exists"""
+
+    @abstractmethod
+    async def file_exists(self, path: Path) -> bool:
+        """Check if file exists"""
+
+    @abstractmethod
+    async def read_file(self, path: Path) -> str:
+        """Read file content"""
+
+    @abstractmethod
+    async def list_files(self, path: Path, pattern: str = "*") -> list[Path]:
+        """List files in directory"""
+
+    async def create_directories(self, paths: Iterable[Path]) -> None:
+        """Create directories and their parents (one by one by default)"""
+        for path in paths:
+            await self.create_directory(path)
+
+    def session(self) -> "IAsyncFileSystemService":
+        """A file system for one run, committing and rolling back on its own
+
+        Runs share this one by default.
+        """
+        return self
+
+    def exclusive(self, path: Path) -> AbstractAsyncContextManager:
+        """Hold an exclusive lock on a directory, across processes (none by default)"""
+        return nullcontext()
+
+    async def commit(self) -> None:
+        """Make all writes since the last commit visible (no-op by default)"""
+
+    async def rollback(self) -> None:
+        """Discard all writes since the last commit (no-op by default)"""
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
 
 
@@ -28,3 +30,25 @@ class IFileSystemService(ABC):
     @abstractmethod
     def list_files(self, path: Path, pattern: str = "*") -> list[Path]:
         """List files in directory"""
+
+    def create_directories(self, paths: Iterable[Path]) -> None:
+        """Create directories and their parents (one by one by default)"""
+        for path in paths:
+            self.create_directory(path)
+
+    def session(self) -> "IFileSystemService":
+        """A file system for one run, committing and rolling back on its own
+
+        Runs share this one by default.
+        """
+        return self
+
+    def commit(self) -> None:
+        """Make all writes since the last commit visible (no-op by default)"""
+
+    def rollback(self) -> None:
+        """Discard all writes since the last commit (no-op by default)"""
+
+    def exclusive(self, path: Path) -> AbstractContextManager:
+        """Hold an exclusive lock on a directory, across processes (none by default)"""
+        return nullcontext()
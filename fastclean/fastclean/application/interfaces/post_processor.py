@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+
+class IPostProcessor(ABC):
+    """Interface for post-processing generated files"""
+
+    @property
+    @abstractmethod
+    def fingerprint(self) -> str:
+        """Identity of the formatting applied, recorded with each render"""
+
+    @abstractmethod
+    def format(self, path: Path, content: str) -> str:
+        """Format the rendered content of a file, before it is written"""
+
+    @abstractmethod
+    def compile(self, path: Path) -> None:
+        """Compile a written file to bytecode, if it is Python"""
+
+    def close(self) -> None:
+        """Release workers, if any"""
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+
+class IRenderCache(ABC):
+    """Interface for a cache of rendered templates, shared across runs"""
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        """Get rendered content by key, or None on a miss"""
+
+    @abstractmethod
+    def set(self, key: str, content: str) -> None:
+        """Store rendered content under a key"""
@@ -1,3 +1,4 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from datetime import datetime
 
 from pydantic import BaseModel, EmailStr
@@ -25,3 +26,19 @@ class UserResponse(UserBase):
 
     class Config:
         from_attributes = True
+
+
+class UserPage(BaseModel):
+    items: list[UserResponse]
+    # Opaque cursor of the next page, None on the last one
+    next_cursor: str | None = None
+
+
+def encode_cursor(user_id: int) -> str:
+    """Opaque cursor for the page after a user"""
+    return urlsafe_b64encode(str(user_id).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """User ID a cursor points after, raising ValueError if it is invalid"""
+    return int(urlsafe_b64decode(cursor.encode()).decode())
@@ -0,0 +1,214 @@
+from pathlib import Path
+
+from fastclean.application.interfaces.file_system import IFileSystemService
+from fastclean.application.interfaces.template_engine import ITemplateEngine
+from fastclean.core.exceptions.base import ValidationException
+from fastclean.core.exceptions.validation import InvalidPathException
+
+from .base import FeatureUseCase
+from .dto import AddAuthenticationRequest, AddFeatureResponse
+from .edits import FeatureEdits
+
+DEFAULT_SECRET_KEY = "your-secret-key-change-in-production"
+
+# Authentication schemes this use case can add
+AUTH_TYPES = ("jwt",)
+
+
+class AddAuthenticationUseCase(FeatureUseCase[AddAuthenticationRequest]):
+    """Use case for adding authentication to existing project"""
+
+    def __init__(
+        self, file_system: IFileSystemService, template_engine: ITemplateEngine
+    ):
+        super().__init__(file_system)
+        self._template_engine = template_engine
+
+    def execute(self, request: AddAuthenticationRequest) -> AddFeatureResponse:
+        """Execute authentication addition"""
+        # Validate
+        self.validate_input(request)
+
+        files_created, files_modified = self.apply(
+            request.project_path, self.edits(request)
+        )
+
+        return AddFeatureResponse(
+            feature_name=f"authentication_{request.auth_type}",
+            files_created=files_created,
+            files_modified=files_modified,
+            success=True,
+            message=f"Successfully added {request.auth_type.upper()} authentication!",
+        )
+
+    def validate_input(self, request: AddAuthenticationRequest) -> None:
+        """Validate input"""
+        if not self._file_system.directory_exists(request.project_path):
+            raise InvalidPathException(str(request.project_path))
+
+        # Check if src directory exists
+        src_path = request.project_path / "src"
+        if not self._file_system.directory_exists(src_path):
+            raise InvalidPathException("Project does not have src/ directory")
+
+        self._check_auth_type(request.auth_type)
+
+    def edits(self, request: AddAuthenticationRequest) -> FeatureEdits:
+        """Authentication files, routes, requirements and settings"""
+        self._check_auth_type(request.auth_type)
+        return self._jwt_edits(request)
+
+    @staticmethod
+    def _check_auth_type(auth_type: str) -> None:
+        if auth_type not in AUTH_TYPES:
+            raise ValidationException(
+                f"Unsupported auth type '{auth_type}', supported: "
+                f"{', '.join(AUTH_TYPES)}"
+            )
+
+    def _jwt_edits(self, request: AddAuthenticationRequest) -> FeatureEdits:
+        """Add JWT authentication"""
+        auth_dir = Path("src/infrastructure/auth")
+        secret_key = request.secret_key or DEFAULT_SECRET_KEY
+
+        # JWT Handler
+        template = self._template_engine.load_template("jwt_handler", "auth")
+        jwt_handler_content = self._template_engine.render(
+            template, {"auth_type": "jwt", "secret_key": secret_key}
+        )
+
+        # Password Hasher
+        password_hasher_content = '''"""Password Hashing Utilities"""
+from passlib.context import CryptContext
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def hash_password(password: str) -> str:
+    """Hash a password"""
+    return pwd_context.hash(password)
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify password against hash"""
+    return pwd_context.verify(plain_password, hashed_password)
+'''
+
+        # Auth Dependencies
+        dependencies_content = '''"""Authentication Dependencies"""
+from fastapi import Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordBearer
+from typing import Optional
+
+from .jwt_handler import JWTHandler
+from ...domain.entities.user import User
+from ...domain.repositories.user_repository import IUserRepository
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
+jwt_handler = JWTHandler()
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    user_repository: IUserRepository = Depends()
+) -> User:
+    """Get current authenticated user"""
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+    payload = jwt_handler.verify_token(token)
+    if payload is None:
+        raise credentials_exception
+
+    user_id: str = payload.get("sub")
+    if user_id is None:
+        raise credentials_exception
+
+    user = await user_repository.get_by_id(int(user_id))
+    if user is None:
+        raise credentials_exception
+
+    return user
+
+async def get_current_active_user(
+    current_user: User = Depends(get_current_user)
+) -> User:
+    """Get current active user"""
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
+'''
+
+        # Auth Routes
+        auth_routes_content = '''"""Authentication API Routes"""
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordRequestForm
+from datetime import timedelta
+
+from ....schemas.auth import Token, UserLogin
+from .....infrastructure.auth.jwt_handler import JWTHandler
+from .....domain.repositories.user_repository import IUserRepository
+
+router = APIRouter(prefix="/auth", tags=["authentication"])
+jwt_handler = JWTHandler()
+
+@router.post("/login", response_model=Token)
+async def login(
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    user_repository: IUserRepository = Depends()
+):
+    """Login endpoint"""
+    user = await user_repository.get_by_email(form_data.username)
+    if not user or not jwt_handler.verify_password(form_data.password, user.hashed_password):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    access_token = jwt_handler.create_access_token(data={"sub": str(user.id)})
+    return {"access_token": access_token, "token_type": "bearer"}
+'''
+
+        # Auth Schemas
+        auth_schemas_content = '''"""Authentication Schemas"""
+from pydantic import BaseModel, EmailStr
+
+class Token(BaseModel):
+    """Token response"""
+    access_token: str
+    token_type: str
+
+class TokenData(BaseModel):
+    """Token data"""
+    user_id: int | None = None
+
+class UserLogin(BaseModel):
+    """User login"""
+    email: EmailStr
+    password: str
+'''
+
+        return FeatureEdits(
+            files={
+                auth_dir / "__init__.py": "",
+                auth_dir / "jwt_handler.py": jwt_handler_content,
+                auth_dir / "password_hasher.py": password_hasher_content,
+                auth_dir / "dependencies.py": dependencies_content,
+                Path("src/interfaces/api/v1/routes/auth.py"): auth_routes_content,
+                Path("src/interfaces/schemas/auth.py"): auth_schemas_content,
+            },
+            requirements=[
+                "python-jose[cryptography]==3.3.0",
+                "passlib[bcrypt]==1.7.4",
+                "python-multipart==0.0.6",
+            ],
+            main_imports=["from .interfaces.api.v1.routes import auth"],
+            main_statements=['app.include_router(auth.router, prefix="/api/v1")'],
+            settings=[
+                f'SECRET_KEY: str = "{secret_key}"',
+                'ALGORITHM: str = "HS256"',
+                "ACCESS_TOKEN_EXPIRE_MINUTES: int = 30",
+            ],
+            env=[f"SECRET_KEY={secret_key}"],
+        )
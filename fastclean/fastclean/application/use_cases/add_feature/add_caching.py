@@ -0,0 +1,152 @@
+from pathlib import Path
+
+from fastclean.application.interfaces.file_system import IFileSystemService
+from fastclean.application.interfaces.template_engine import ITemplateEngine
+from fastclean.core.exceptions.base import ValidationException
+from fastclean.core.exceptions.validation import InvalidPathException
+
+from .base import FeatureUseCase
+from .dto import AddCachingRequest, AddFeatureResponse
+from .edits import FeatureEdits
+
+DEFAULT_REDIS_URL = "redis://localhost:6379/0"
+
+# Cache backends this use case can add
+CACHE_TYPES = ("redis",)
+
+
+class AddCachingUseCase(FeatureUseCase[AddCachingRequest]):
+    """Use case for adding caching to existing project"""
+
+    def __init__(
+        self, file_system: IFileSystemService, template_engine: ITemplateEngine
+    ):
+        super().__init__(file_system)
+        self._template_engine = template_engine
+
+    def execute(self, request: AddCachingRequest) -> AddFeatureResponse:
+        """Execute caching addition"""
+        self.validate_input(request)
+
+        files_created, files_modified = self.apply(
+            request.project_path, self.edits(request)
+        )
+
+        return AddFeatureResponse(
+            feature_name=f"caching_{request.cache_type}",
+            files_created=files_created,
+            files_modified=files_modified,
+            success=True,
+            message=f"Successfully added {request.cache_type.upper()} caching!",
+        )
+
+    def validate_input(self, request: AddCachingRequest) -> None:
+        """Validate input"""
+        if not self._file_system.directory_exists(request.project_path):
+            raise InvalidPathException(str(request.project_path))
+
+        self._check_cache_type(request.cache_type)
+
+    def edits(self, request: AddCachingRequest) -> FeatureEdits:
+        """Cache client files, requirements and settings"""
+        self._check_cache_type(request.cache_type)
+        return self._redis_edits(request)
+
+    @staticmethod
+    def _check_cache_type(cache_type: str) -> None:
+        if cache_type not in CACHE_TYPES:
+            raise ValidationException(
+                f"Unsupported cache type '{cache_type}', supported: "
+                f"{', '.join(CACHE_TYPES)}"
+            )
+
+    def _redis_edits(self, request: AddCachingRequest) -> FeatureEdits:
+        """Add Redis caching"""
+        cache_dir = Path("src/infrastructure/cache")
+        redis_url = request.connection_string or DEFAULT_REDIS_URL
+
+        # Redis client
+        redis_client_content = '''"""Redis Cache Client"""
+import redis.asyncio as redis
+from typing import Optional, Any
+import json
+from ..config.settings import settings
+
+class RedisCache:
+    """Redis cache implementation"""
+
+    def __init__(self):
+        self.redis = redis.from_url(
+            settings.REDIS_URL,
+            encoding="utf-8",
+            decode_responses=True
+        )
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from cache"""
+        value = await self.redis.get(key)
+        if value:
+            return json.loads(value)
+        return None
+
+    async def set(self, key: str, value: Any, ttl: int = 300) -> None:
+        """Set value in cache"""
+        await self.redis.setex(key, ttl, json.dumps(value))
+
+    async def delete(self, key: str) -> None:
+        """Delete key from cache"""
+        await self.redis.delete(key)
+
+    async def close(self) -> None:
+        """Close Redis connection"""
+        await self.redis.close()
+
+cache = RedisCache()
+'''
+
+        # Cache decorator
+        decorator_content = '''"""Cache Decorator"""
+from functools import wraps
+from typing import Callable
+from .redis_client import cache
+
+def cached(ttl: int = 300):
+    """Cache decorator"""
+    def decorator(func: Callable):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            # Generate cache key
+            cache_key = f"{func.__name__}:{str(args)}:{str(kwargs)}"
+
+            # Try to get from cache
+            cached_value = await cache.get(cache_key)
+            if cached_value is not None:
+                return cached_value
+
+            # Execute function
+            result = await func(*args, **kwargs)
+
+            # Store in cache
+            await cache.set(cache_key, result, ttl)
+
+            return result
+        return wrapper
+    return decorator
+'''
+
+        return FeatureEdits(
+            files={
+                cache_dir / "__init__.py": "",
+                cache_dir / "redis_client.py": redis_client_content,
+                cache_dir / "decorator.py": decorator_content,
+            },
+            requirements=["redis==5.0.1"],
+            main_imports=["from .infrastructure.cache.redis_client import cache"],
+            main_statements=[
+                '@app.on_event("shutdown")\n'
+                "async def close_cache():\n"
+                "    await cache.close()"
+            ],
+            settings=[f'REDIS_URL: str = "{redis_url}"', "CACHE_TTL: int = 300"],
+            env=[f"REDIS_URL={redis_url}"],
+        )
@@ -0,0 +1,105 @@
+from fastclean.application.interfaces.file_system import IFileSystemService
+from fastclean.application.interfaces.template_engine import ITemplateEngine
+from fastclean.core.exceptions.base import ValidationException
+from fastclean.core.exceptions.validation import (
+    InvalidPathException,
+    UnknownFeatureException,
+)
+
+from .add_authentication import AddAuthenticationUseCase
+from .add_caching import AddCachingUseCase
+from .add_monitoring import AddMonitoringUseCase
+from .base import FeatureUseCase
+from .dto import (
+    AddAuthenticationRequest,
+    AddCachingRequest,
+    AddFeatureResponse,
+    AddFeaturesRequest,
+    AddMonitoringRequest,
+)
+from .edits import FeatureEdits
+
+# Features that can be added, by the kind of feature they are
+FEATURES = {
+    "jwt": "auth",
+    "redis": "cache",
+    "prometheus": "monitoring",
+}
+
+
+class AddFeaturesUseCase(FeatureUseCase[AddFeaturesRequest]):
+    """Use case for adding several features to a project at once
+
+    The edits of every feature are merged first, so requirements are
+    deduplicated, conflicting edits fail before anything is written, and
+    each shared file is patched and written once.
+    """
+
+    def __init__(
+        self, file_system: IFileSystemService, template_engine: ITemplateEngine
+    ):
+        super().__init__(file_system)
+        self._authentication = AddAuthenticationUseCase(file_system, template_engine)
+        self._caching = AddCachingUseCase(file_system, template_engine)
+        self._monitoring = AddMonitoringUseCase(file_system)
+
+    def execute(self, request: AddFeaturesRequest) -> AddFeatureResponse:
+        """Execute feature addition"""
+        self.validate_input(request)
+
+        files_created, files_modified = self.apply(
+            request.project_path, self.edits(request)
+        )
+
+        features = ", ".join(dict.fromkeys(request.features))
+        return AddFeatureResponse(
+            feature_name=",".join(dict.fromkeys(request.features)),
+            files_created=files_created,
+            files_modified=files_modified,
+            success=True,
+            message=f"Successfully added {features}!",
+        )
+
+    def validate_input(self, request: AddFeaturesRequest) -> None:
+        """Validate input"""
+        if not self._file_system.directory_exists(request.project_path):
+            raise InvalidPathException(str(request.project_path))
+
+        for feature in request.features:
+            if feature not in FEATURES:
+                raise UnknownFeatureException(feature, list(FEATURES))
+
+        # A project gets one feature of each kind, e.g. one cache backend
+        by_kind: dict[str, list[str]] = {}
+        for feature in dict.fromkeys(request.features):
+            by_kind.setdefault(FEATURES[feature], []).append(feature)
+        for kind, features in by_kind.items():
+            if len(features) > 1:
+                raise ValidationException(
+                    f"Only one {kind} feature can be added, got: {', '.join(features)}"
+                )
+
+    def edits(self, request: AddFeaturesRequest) -> FeatureEdits:
+        """Merged edits of every requested feature"""
+        edits = FeatureEdits()
+        for feature in dict.fromkeys(request.features):
+            edits = edits.merge(self._feature_edits(feature, request))
+        return edits
+
+    def _feature_edits(self, feature: str, request: AddFeaturesRequest) -> FeatureEdits:
+        kind = FEATURES[feature]
+        if kind == "auth":
+            return self._authentication.edits(
+                AddAuthenticationRequest(
+                    request.project_path, feature, request.secret_key
+                )
+            )
+        if kind == "cache":
+            return self._caching.edits(
+                AddCachingRequest(
+                    request.project_path, feature, request.connection_string
+                )
+            )
+        return self._monitoring.edits(
+            AddMonitoringRequest(request.project_path, feature)
+        )
@@ -0,0 +1,85 @@
+from pathlib import Path
+
+from fastclean.application.interfaces.file_system import IFileSystemService
+from fastclean.core.exceptions.validation import InvalidPathException
+
+from .base import FeatureUseCase
+from .dto import AddFeatureResponse, AddMonitoringRequest
+from .edits import FeatureEdits
+
+
+class AddMonitoringUseCase(FeatureUseCase[AddMonitoringRequest]):
+    """Use case for adding monitoring"""
+
+    def __init__(self, file_system: IFileSystemService):
+        super().__init__(file_system)
+
+    def execute(self, request: AddMonitoringRequest) -> AddFeatureResponse:
+        """Execute monitoring addition"""
+        self.validate_input(request)
+
+        files_created, files_modified = self.apply(
+            request.project_path, self.edits(request)
+        )
+
+        return AddFeatureResponse(
+            feature_name=f"monitoring_{request.monitoring_type}",
+            files_created=files_created,
+            files_modified=files_modified,
+            success=True,
+            message=f"Successfully added {request.monitoring_type} monitoring!",
+        )
+
+    def validate_input(self, request: AddMonitoringRequest) -> None:
+        """Validate input"""
+        if not self._file_system.directory_exists(request.project_path):
+            raise InvalidPathException(str(request.project_path))
+
+        valid_types = ["prometheus"]
+        if request.monitoring_type not in valid_types:
+            raise ValueError(
+                f"Monitoring type must be one of: {', '.join(valid_types)}"
+            )
+
+    def edits(self, request: AddMonitoringRequest) -> FeatureEdits:
+        """Prometheus metrics middleware and the /metrics endpoint"""
+        monitoring_dir = Path("src/infrastructure/monitoring")
+
+        metrics_content = '''"""Prometheus Metrics"""
+import time
+
+from fastapi import Request
+from prometheus_client import Counter, Histogram
+
+REQUESTS = Counter(
+    "http_requests_total", "HTTP requests", ["method", "path", "status"]
+)
+LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency", ["method", "path"]
+)
+
+async def metrics_middleware(request: Request, call_next):
+    """Count requests and measure their latency"""
+    started = time.perf_counter()
+    response = await call_next(request)
+    path = request.scope.get("route").path if request.scope.get("route") else "other"
+    LATENCY.labels(request.method, path).observe(time.perf_counter() - started)
+    REQUESTS.labels(request.method, path, response.status_code).inc()
+    return response
+'''
+
+        return FeatureEdits(
+            files={
+                monitoring_dir / "__init__.py": "",
+                monitoring_dir / "metrics.py": metrics_content,
+            },
+            requirements=["prometheus-client==0.19.0"],
+            main_imports=[
+                "from prometheus_client import make_asgi_app",
+                "from .infrastructure.monitoring.metrics import metrics_middleware",
+            ],
+            main_statements=[
+                'app.middleware("http")(metrics_middleware)',
+                'app.mount("/metrics", make_asgi_app())',
+            ],
+        )
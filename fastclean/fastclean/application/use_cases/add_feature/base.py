@@ -0,0 +1,88 @@
+from abc import abstractmethod
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypeVar
+
+from fastclean.application.interfaces.file_system import IFileSystemService
+from fastclean.core.use_case import BaseUseCase
+
+from .dto import AddFeatureResponse
+from .edits import (
+    ENV,
+    MAIN,
+    REQUIREMENTS,
+    SETTINGS,
+    FeatureEdits,
+    patch_env,
+    patch_main,
+    patch_requirements,
+    patch_settings,
+)
+
+RequestT = TypeVar("RequestT")
+
+
+class FeatureUseCase(BaseUseCase[RequestT, AddFeatureResponse]):
+    """Base class for use cases adding features to an existing project
+
+    Features describe their changes as FeatureEdits, so several of them can
+    be merged and every shared file is read, patched and written once.
+    """
+
+    def __init__(self, file_system: IFileSystemService):
+        self._file_system = file_system
+
+    @abstractmethod
+    def edits(self, request: RequestT) -> FeatureEdits:
+        """Files and shared file edits of the feature, without writing them"""
+
+    def apply(
+        self, project_path: Path, edits: FeatureEdits
+    ) -> tuple[list[Path], list[Path]]:
+        """Write the new files and patch the shared ones, all or nothing
+
+        Files that already exist are kept, so adding a feature twice is
+        harmless. Returns the files created and the files modified.
+        """
+        try:
+            created = []
+            for path, content in edits.files.items():
+                path = project_path / path
+                if not self._file_system.file_exists(path):
+                    self._file_system.create_file(path, content)
+                    created.append(path)
+
+            patches: list[tuple[Path, Callable[[str], str]]] = [
+                (
+                    REQUIREMENTS,
+                    lambda content: patch_requirements(content, edits.requirements),
+                ),
+                (
+                    MAIN,
+                    lambda content: patch_main(
+                        content, edits.main_imports, edits.main_statements
+                    ),
+                ),
+                (SETTINGS, lambda content: patch_settings(content, edits.settings)),
+                (ENV, lambda content: patch_env(content, edits.env)),
+            ]
+            modified = [
+                project_path / path
+                for path, patch in patches
+                if self._patch(project_path / path, patch)
+            ]
+            self._file_system.commit()
+        except BaseException:
+            self._file_system.rollback()
+            raise
+        return created, modified
+
+    def _patch(self, path: Path, patch: Callable[[str], str]) -> bool:
+        if not self._file_system.file_exists(path):
+            return False
+        content = self._file_system.read_file(path)
+        patched = patch(content)
+        if patched == content:
+            return False
+        self._file_system.create_file(path, patched)
+        return True
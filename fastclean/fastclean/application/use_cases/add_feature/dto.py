@@ -13,7 +13,7 @@ class AddFeatureRequest:
 class AddAuthenticationRequest(AddFeatureRequest):
     """Request for adding authentication"""
 
-    auth_type: str  # jwt, oauth2, api_key
+    auth_type: str  # jwt
     secret_key: str | None = None
 
 
@@ -21,7 +21,7 @@ class AddAuthenticationRequest(AddFeatureRequest):
 class AddCachingRequest(AddFeatureRequest):
     """Request for adding caching"""
 
-    cache_type: str  # redis, memcached, in_memory
+    cache_type: str  # redis
     connection_string: str | None = None
 
 
@@ -33,6 +33,15 @@ class AddMonitoringRequest(AddFeatureRequest):
     port: int | None = None
 
 
+@dataclass
+class AddFeaturesRequest(AddFeatureRequest):
+    """Request for adding several features in one pass"""
+
+    features: list[str]  # e.g. ["jwt", "redis", "prometheus"]
+    secret_key: str | None = None
+    connection_string: str | None = None
+
+
 @dataclass
 class AddFeatureResponse:
     """Response for feature addition"""
@@ -0,0 +1,153 @@
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from fastclean.core.exceptions.validation import FeatureConflictException
+
+# Project files that several features edit, relative to the project root
+REQUIREMENTS = Path("requirements.txt")
+MAIN = Path("src/main.py")
+SETTINGS = Path("src/infrastructure/config/settings.py")
+ENV = Path(".env")
+
+
+@dataclass
+class FeatureEdits:
+    """Files a feature adds and the edits it makes to shared project files
+
+    Paths are relative to the project root. ``settings`` holds Settings
+    fields such as ``REDIS_URL: str = "..."``, ``env`` holds ``KEY=value``
+    lines and ``main_statements`` holds blocks of code for ``src/main.py``.
+    """
+
+    files: dict[Path, str] = field(default_factory=dict)
+    requirements: list[str] = field(default_factory=list)
+    main_imports: list[str] = field(default_factory=list)
+    main_statements: list[str] = field(default_factory=list)
+    settings: list[str] = field(default_factory=list)
+    env: list[str] = field(default_factory=list)
+
+    def merge(self, other: "FeatureEdits") -> "FeatureEdits":
+        """Both edit sets, without duplicates, failing on conflicting edits"""
+        for path, content in other.files.items():
+            if self.files.get(path, content) != content:
+                raise FeatureConflictException(f"'{path}' is written differently")
+
+        return FeatureEdits(
+            files={**self.files, **other.files},
+            requirements=_merge_keyed(
+                self.requirements, other.requirements, requirement_name
+            ),
+            main_imports=_merge_keyed(self.main_imports, other.main_imports, str),
+            main_statements=_merge_keyed(
+                self.main_statements, other.main_statements, str
+            ),
+            settings=_merge_keyed(self.settings, other.settings, setting_name),
+            env=_merge_keyed(self.env, other.env, env_name),
+        )
+
+
+def requirement_name(requirement: str) -> str:
+    """Normalized package name of a requirement line"""
+    name = re.split(r"[\[<>=!~;@\s]", requirement.strip(), maxsplit=1)[0]
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def setting_name(line: str) -> str:
+    """Field name of a Settings field line"""
+    return line.split(":", 1)[0].strip()
+
+
+def env_name(line: str) -> str:
+    """Variable name of a .env line"""
+    return line.split("=", 1)[0].strip()
+
+
+def patch_requirements(content: str, requirements: list[str]) -> str:
+    """Append the requirements whose package is not listed yet"""
+    listed = {
+        requirement_name(line)
+        for line in content.splitlines()
+        if line.strip() and not line.lstrip().startswith("#")
+    }
+    missing = [line for line in requirements if requirement_name(line) not in listed]
+    return _append(content, missing)
+
+
+def patch_env(content: str, lines: list[str]) -> str:
+    """Append the variables that are not defined yet"""
+    defined = {env_name(line) for line in content.splitlines() if "=" in line}
+    return _append(content, [line for line in lines if env_name(line) not in defined])
+
+
+def patch_settings(content: str, fields: list[str]) -> str:
+    """Add the Settings fields that are not defined yet, before ``class Config``"""
+    lines = content.split("\n")
+    defined = {setting_name(line) for line in lines if ":" in line}
+    missing = [line for line in fields if setting_name(line) not in defined]
+    if not missing:
+        return content
+
+    at = _find(lines, lambda line: line.strip().startswith("class Config"))
+    if at is None:
+        at = _find(lines, lambda line: line.startswith("settings ="))
+    if at is None:
+        at = len(lines)
+    lines[at:at] = [f"    {line}" for line in missing] + [""]
+    return "\n".join(lines)
+
+
+def patch_main(content: str, imports: list[str], statements: list[str]) -> str:
+    """Add imports after the last import and statements after the last router"""
+    lines = content.split("\n")
+    present = {line.strip() for line in lines}
+
+    missing = [line for line in imports if line not in present]
+    if missing:
+        last = _find(lines, lambda line: line.startswith(("from ", "import ")), True)
+        at = 0 if last is None else last + 1
+        if last is not None and lines[last].rstrip().endswith("("):
+            # After the end of a parenthesized import
+            at = _find(lines[last:], lambda line: line.startswith(")")) + last + 1
+        lines[at:at] = missing
+
+    blocks = [block for block in statements if block not in content]
+    if blocks:
+        last = _find(
+            lines, lambda line: line.lstrip().startswith("app.include_router("), True
+        )
+        at = len(lines) if last is None else last + 1
+        added = []
+        for block in blocks:
+            # Multi-line blocks (e.g. decorated functions) get blank lines
+            if "\n" in block:
+                added.extend(["", *block.split("\n"), ""])
+            else:
+                added.append(block)
+        lines[at:at] = added
+    return "\n".join(lines)
+
+
+def _merge_keyed(first: list[str], second: list[str], key) -> list[str]:
+    merged = {key(line): line for line in first}
+    for line in second:
+        if merged.setdefault(key(line), line) != line:
+            raise FeatureConflictException(
+                f"'{merged[key(line)]}' conflicts with '{line}'"
+            )
+    return list(merged.values())
+
+
+def _append(content: str, lines: list[str]) -> str:
+    if not lines:
+        return content
+    if content and not content.endswith("\n"):
+        content += "\n"
+    return content + "\n".join(lines) + "\n"
+
+
+def _find(lines: list[str], predicate, last: bool = False) -> int | None:
+    indexes = [i for i, line in enumerate(lines) if predicate(line)]
+    if not indexes:
+        return None
+    return indexes[-1] if last else indexes[0]
@@ -1,4 +1,33 @@
+import asyncio
+import time
+from collections.abc import Callable, Generator
+from pathlib import Path
+
+from fastclean.application.generation.directories import DirectoryPlanner
+from fastclean.application.generation.events import (
+    PLANNED,
+    SKIPPED,
+    WRITTEN,
+    GenerationEvent,
+    drain,
+    drain_async,
+)
+from fastclean.application.generation.executor import RenderExecutor
+from fastclean.application.generation.lock import GenerationLock
+from fastclean.application.generation.loop_file_system import LoopFileSystem
+from fastclean.application.generation.plan import PlannedJob
+from fastclean.application.generation.profiler import NULL_PROFILER, Profiler
+from fastclean.application.generation.registry import (
+    REGISTRY_PLAN,
+    registry_context,
+    write_registry,
+)
+from fastclean.application.interfaces.async_file_system import (
+    IAsyncFileSystemService,
+)
 from fastclean.application.interfaces.file_system import IFileSystemService
+from fastclean.application.interfaces.post_processor import IPostProcessor
+from fastclean.application.interfaces.render_cache import IRenderCache
 from fastclean.application.interfaces.template_engine import ITemplateEngine
 from fastclean.application.interfaces.validator import IValidator
 from fastclean.core.entities.project import Project
@@ -11,6 +40,7 @@ from fastclean.core.exceptions.validation import (
 from fastclean.core.use_case import BaseUseCase
 
 from .dto import CreateProjectRequest, CreateProjectResponse
+from .plan import project_plan
 
 
 class CreateProjectUseCase(BaseUseCase[CreateProjectRequest, CreateProjectResponse]):
@@ -21,40 +51,174 @@ class CreateProjectUseCase(BaseUseCase[CreateProjectRequest, CreateProjectRespon
         file_system: IFileSystemService,
         template_engine: ITemplateEngine,
         validator: IValidator,
+        profiler: Profiler | None = None,
+        render_cache: IRenderCache | None = None,
+        post_processor: IPostProcessor | None = None,
     ):
         self._file_system = file_system
         self._template_engine = template_engine
         self._validator = validator
+        self._profiler = profiler or NULL_PROFILER
+        self._render_cache = render_cache
+        self._post_processor = post_processor
 
     def execute(self, request: CreateProjectRequest) -> CreateProjectResponse:
         """Execute project creation"""
+        return drain(self.stream(request))
+
+    async def execute_async(
+        self,
+        request: CreateProjectRequest,
+        on_event: Callable[[GenerationEvent], None] | None = None,
+        file_system: IAsyncFileSystemService | None = None,
+    ) -> CreateProjectResponse:
+        """Execute project creation in worker threads, without blocking the event loop
+
+        Cancelling the awaiting task rolls the run back. Given an async
+        file_system, the run's file I/O goes through it instead, e.g. to
+        bound the writes in flight across concurrent runs.
+        """
+        use_case = self
+        if file_system is not None:
+            loop = asyncio.get_running_loop()
+            use_case = self._on(LoopFileSystem(file_system, loop))
+        return await drain_async(use_case.stream(request), on_event)
+
+    def stream(
+        self, request: CreateProjectRequest
+    ) -> Generator[GenerationEvent, None, CreateProjectResponse]:
+        """Execute project creation, yielding an event per file step
+
+        Returns the response once exhausted. Closing the stream early rolls
+        the project back. Each stream writes through its own session of the
+        file system, so concurrent runs commit and roll back independently.
+        """
+        return self._on(self._file_system.session())._run(request)
+
+    def _on(self, file_system: IFileSystemService) -> "CreateProjectUseCase":
+        """The same use case writing through another file system"""
+        return CreateProjectUseCase(
+            file_system,
+            self._template_engine,
+            self._validator,
+            self._profiler,
+            self._render_cache,
+            self._post_processor,
+        )
+
+    def _run(
+        self, request: CreateProjectRequest
+    ) -> Generator[GenerationEvent, None, CreateProjectResponse]:
+        started = time.perf_counter()
 
         # Step 1: Validate
-        self.validate_input(request)
+        with self._profiler.phase("validate"):
+            self.validate_input(request)
 
         # Step 2: Create project entity
         project = Project(name=request.name, path=request.path, config=request.config)
 
-        # Step 3: Check if project exists
+        # Step 3: Check if project exists (only an update may reuse it)
         if self._file_system.directory_exists(project.full_path):
-            raise ProjectAlreadyExistsException(project.name, str(project.full_path))
+            if not request.update:
+                raise ProjectAlreadyExistsException(
+                    project.name, str(project.full_path)
+                )
+
+        # Other runs on the project wait, so none loses this one's lock entries
+        with self._file_system.exclusive(project.full_path):
+            try:
+                with self._profiler.phase("load_lock"):
+                    lock = GenerationLock.load(self._file_system, project.full_path)
+                executor = RenderExecutor(
+                    self._file_system,
+                    self._template_engine,
+                    request.jobs,
+                    lock=lock,
+                    profiler=self._profiler,
+                    render_cache=self._render_cache,
+                    post_processor=self._post_processor,
+                )
+                context = self._build_template_context(project)
+
+                # Step 4: Create project structure for every planned file
+                with self._profiler.phase("create_structure"):
+                    plan = project_plan(self._template_engine)
+                    planned = executor.plan(plan, context)
+                    files_created = self._create_project_structure(
+                        project, planned, plan.packages(context)
+                    )
+
+                for index, job in enumerate(planned, 1):
+                    yield GenerationEvent(
+                        PLANNED,
+                        project.full_path / job.path,
+                        index,
+                        len(planned),
+                        time.perf_counter() - started,
+                    )
+
+                # Step 5: Generate files from templates
+                files_unchanged = 0
+                written = []
+                with self._profiler.phase("generate_files"):
+                    for event in executor.stream(
+                        [job.job for job in planned],
+                        context,
+                        project.full_path,
+                        started,
+                    ):
+                        if event.kind == WRITTEN:
+                            files_created += 1
+                            written.append(event.path)
+                        elif event.kind == SKIPPED:
+                            files_unchanged += 1
+                        yield event
 
-        # Step 4: Create project structure
-        files_created = self._create_project_structure(project)
+                # Step 6: Register the project's routers, once the lock lists them
+                with self._profiler.phase("generate_registry"):
+                    written += [
+                        r.path
+                        for r in write_registry(executor, lock, self._file_system)
+                        if r.written
+                    ]
+                with self._profiler.phase("save_lock"):
+                    lock.save(self._file_system)
 
-        # Step 5: Generate files from templates
-        files_created += self._generate_project_files(project)
+                with self._profiler.phase("commit"):
+                    self._file_system.commit()
+            except BaseException:
+                # Leave no half-written project behind
+                self._file_system.rollback()
+                raise
 
-        # Step 6: Return response
+        # Step 7: Precompile what was written, now that it is published
+        if self._post_processor is not None:
+            with self._profiler.phase("compile"):
+                executor.compile(written)
+
+        # Step 8: Return response
         return CreateProjectResponse(
             project_id=project.id,
             project_name=project.name,
             project_path=project.full_path,
             files_created=files_created,
+            files_unchanged=files_unchanged,
             success=True,
             message=f"Project '{project.name}' created successfully!",
         )
 
+    def plan(self, request: CreateProjectRequest) -> list[PlannedJob]:
+        """Files a request would generate, without rendering them"""
+        self.validate_input(request)
+        project = Project(name=request.name, path=request.path, config=request.config)
+        executor = RenderExecutor(self._file_system, self._template_engine)
+        lock = GenerationLock.load(self._file_system, project.full_path)
+        return executor.plan(
+            project_plan(self._template_engine),
+            self._build_template_context(project),
+        ) + executor.plan(REGISTRY_PLAN, registry_context(lock))
+
     def validate_input(self, request: CreateProjectRequest) -> None:
         """Validate input request"""
         if not self._validator.validate_project_name(request.name):
@@ -66,67 +230,17 @@ class CreateProjectUseCase(BaseUseCase[CreateProjectRequest, CreateProjectRespon
         if not self._validator.validate_config(request.config):
             raise ValidationException("Invalid project configuration")
 
-    def _create_project_structure(self, project: Project) -> int:
-        """Create directory structure"""
-        directories = [
-            project.full_path,
-            project.full_path / "src",
-            project.full_path / "src" / "domain" / "entities",
-            project.full_path / "src" / "domain" / "repositories",
-            project.full_path / "src" / "domain" / "value_objects",
-            project.full_path / "src" / "application" / "interfaces",
-            project.full_path / "src" / "application" / "usecases" / "user",
-            project.full_path / "src" / "infrastructure" / "config",
-            project.full_path / "src" / "infrastructure" / "database" / "models",
-            project.full_path / "src" / "infrastructure" / "database" / "repositories",
-            project.full_path / "src" / "infrastructure" / "external_services",
-            project.full_path / "src" / "infrastructure" / "security",
-            project.full_path / "src" / "interfaces" / "api" / "v1" / "routes",
-            project.full_path / "src" / "interfaces" / "schemas",
-            project.full_path / "tests" / "unit",
-            project.full_path / "tests" / "integration",
-        ]
-
-        for directory in directories:
-            self._file_system.create_directory(directory)
-            # Create __init__.py
-            init_file = directory / "__init__.py"
-            self._file_system.create_file(init_file, "")
-
-        return len(directories)
-
-    def _generate_project_files(self, project: Project) -> int:
-        """Generate files from templates"""
-        context = self._build_template_context(project)
-        files_created = 0
-
-        # Base categories always included
-        template_categories = [
-            "base",
-            "domain",
-            "application",
-            "infrastructure",
-            "interfaces",
-        ]
-
-        # Conditional categories
-        if project.config.include_docker:
-            template_categories.append("docker")
-
-        # Add other conditional categories here (e.g. ci, monitoring if they have separate folders)
-
-        for category in template_categories:
-            templates = self._template_engine.list_templates(category)
-
-            for template_name in templates:
-                template = self._template_engine.load_template(template_name, category)
-                content = self._template_engine.render(template, context)
-
-                output_path = project.full_path / template.render_path(context)
-                self._file_system.create_file(output_path, content)
-                files_created += 1
-
-        return files_created
+    def _create_project_structure(
+        self, project: Project, planned: list[PlannedJob], packages: list[Path]
+    ) -> int:
+        """Create every directory and package marker in one pass"""
+        directories = (
+            DirectoryPlanner(project.full_path)
+            .add_files(job.path for job in planned)
+            .add_packages(packages)
+            .plan()
+        )
+        return directories.apply(self._file_system, self._profiler).markers
 
     def _build_template_context(self, project: Project) -> dict:
         """Build context for template rendering"""
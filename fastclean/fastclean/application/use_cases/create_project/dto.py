@@ -11,6 +11,9 @@ class CreateProjectRequest:
     name: str
     path: Path
     config: ProjectConfig
+    jobs: int = 1
+    # Regenerate an existing project, rewriting only files that changed
+    update: bool = False
 
 
 @dataclass
@@ -23,3 +26,4 @@ class CreateProjectResponse:
     files_created: int
     success: bool
     message: str
+    files_unchanged: int = 0
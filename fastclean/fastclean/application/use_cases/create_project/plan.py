@@ -0,0 +1,44 @@
+from fastclean.application.generation.plan import GenerationPlan, PlanNode
+from fastclean.application.interfaces.template_engine import ITemplateEngine
+
+# Template categories of a project and the context key enabling each
+CATEGORIES = {
+    "base": None,
+    "domain": None,
+    "application": None,
+    "infrastructure": None,
+    "interfaces": None,
+    "docker": "has_docker",
+}
+
+# Directories of a project that are Python packages
+PACKAGES = [
+    ".",
+    "src",
+    "src/domain/entities",
+    "src/domain/repositories",
+    "src/domain/value_objects",
+    "src/application/interfaces",
+    "src/application/usecases/user",
+    "src/infrastructure/config",
+    "src/infrastructure/database/models",
+    "src/infrastructure/database/repositories",
+    "src/infrastructure/external_services",
+    "src/infrastructure/security",
+    "src/interfaces/api/v1/routes",
+    "src/interfaces/schemas",
+    "tests/unit",
+    "tests/integration",
+]
+
+
+def project_plan(template_engine: ITemplateEngine) -> GenerationPlan:
+    """Every template of the project categories, written where it says"""
+    return GenerationPlan(
+        (
+            PlanNode(f"{category}/{name}", name, category, condition=condition)
+            for category, condition in CATEGORIES.items()
+            for name in template_engine.list_templates(category)
+        ),
+        packages=PACKAGES,
+    )
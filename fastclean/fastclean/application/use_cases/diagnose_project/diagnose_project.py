@@ -0,0 +1,62 @@
+import ast
+
+from fastclean.application.analysis.analyzer import ProjectAnalyzer
+from fastclean.application.analysis.rules import Module
+from fastclean.application.interfaces.file_system import IFileSystemService
+from fastclean.core.exceptions.validation import InvalidPathException
+from fastclean.core.use_case import BaseUseCase
+
+from .dto import DiagnoseProjectRequest, DiagnoseProjectResponse
+
+# Directories holding code that is not the project's own
+IGNORED_DIRECTORIES = {
+    ".git",
+    ".venv",
+    "venv",
+    "env",
+    "__pycache__",
+    "node_modules",
+    "site-packages",
+    "build",
+    "dist",
+}
+
+
+class DiagnoseProjectUseCase(
+    BaseUseCase[DiagnoseProjectRequest, DiagnoseProjectResponse]
+):
+    """Use case for finding performance anti-patterns in a project"""
+
+    def __init__(
+        self,
+        file_system: IFileSystemService,
+        analyzer: ProjectAnalyzer | None = None,
+    ):
+        self._file_system = file_system
+        self._analyzer = analyzer or ProjectAnalyzer()
+
+    def execute(self, request: DiagnoseProjectRequest) -> DiagnoseProjectResponse:
+        """Execute project analysis"""
+        root = request.project_path
+        if not self._file_system.directory_exists(root):
+            raise InvalidPathException(str(root))
+
+        modules, errors = [], {}
+        for path in sorted(self._file_system.list_files(root, "**/*.py")):
+            parts = set(path.relative_to(root).parts[:-1])
+            if parts & IGNORED_DIRECTORIES:
+                continue
+            if not request.include_tests and "tests" in parts:
+                continue
+            try:
+                source = self._file_system.read_file(path)
+                modules.append(Module(path, ast.parse(source, filename=str(path))))
+            except (SyntaxError, ValueError, OSError) as e:
+                errors[path] = str(e)
+
+        return DiagnoseProjectResponse(
+            project_path=root,
+            findings=self._analyzer.analyze(modules),
+            files_analyzed=len(modules),
+            errors=errors,
+        )
@@ -0,0 +1,23 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from fastclean.application.analysis.findings import Finding
+
+
+@dataclass
+class DiagnoseProjectRequest:
+    """Request for analyzing a generated project"""
+
+    project_path: Path
+    include_tests: bool = False
+
+
+@dataclass
+class DiagnoseProjectResponse:
+    """Response for project analysis, findings ranked by impact"""
+
+    project_path: Path
+    findings: list[Finding]
+    files_analyzed: int
+    # Files that could not be parsed, with the reason
+    errors: dict[Path, str] = field(default_factory=dict)
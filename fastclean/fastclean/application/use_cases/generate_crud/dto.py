@@ -1,6 +1,14 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
+# List pagination styles: keyset seeks past a cursor, offset skips rows
+KEYSET = "keyset"
+OFFSET = "offset"
+PAGINATION_STYLES = (KEYSET, OFFSET)
+
+# Primary key types a keyset cursor can encode
+KEYSET_KEY_TYPES = ("int", "str")
+
 
 @dataclass
 class FieldDefinition:
@@ -10,6 +18,18 @@ class FieldDefinition:
     type: str
     required: bool = True
     default: str = None
+    # Column nullability, or None to leave it to the database default
+    nullable: bool | None = None
+    unique: bool = False
+    indexed: bool = False
+    # Referenced column as "table.column", e.g. "users.id"
+    foreign_key: str | None = None
+    # Allowed values, for fields limited to an enumeration
+    enum: list | None = None
+    max_length: int | None = None
+    primary_key: bool = False
+    # Database column name, when it differs from the field name
+    column: str | None = None
 
 
 @dataclass
@@ -20,6 +40,22 @@ class GenerateCRUDRequest:
     project_path: Path
     fields: list[FieldDefinition]
     generate_tests: bool = True
+    # Defaults to the pluralized snake_case entity name
+    table_name: str | None = None
+    pagination: str = KEYSET
+    has_created_at: bool = True
+
+    @property
+    def key_fields(self) -> list[FieldDefinition]:
+        """Primary key fields, the generated integer id when none is declared"""
+        keys = [field for field in self.fields if field.primary_key]
+        return keys or [FieldDefinition(name="id", type="int", required=False)]
+
+    @property
+    def supports_keyset(self) -> bool:
+        """Whether the primary key can be paged through with keyset cursors"""
+        keys = self.key_fields
+        return len(keys) == 1 and keys[0].type in KEYSET_KEY_TYPES
 
 
 @dataclass
@@ -30,3 +66,32 @@ class GenerateCRUDResponse:
     files_created: list[Path]
     success: bool
     message: str
+    files_unchanged: list[Path] = field(default_factory=list)
+    # Why each created file was (re)written, e.g. "template changed"
+    changes: dict[Path, str] = field(default_factory=dict)
+
+
+@dataclass
+class GenerateCRUDBatchRequest:
+    """Request for generating CRUD for many entities at once"""
+
+    project_path: Path
+    entities: list[GenerateCRUDRequest]
+    jobs: int = 1
+
+
+@dataclass
+class GenerateCRUDBatchResponse:
+    """Response for batch CRUD generation"""
+
+    results: list[GenerateCRUDResponse]
+    shared_files: list[Path]
+    success: bool
+    message: str
+    shared_files_unchanged: list[Path] = field(default_factory=list)
+
+    @property
+    def files_created(self) -> list[Path]:
+        """All files created, per entity in request order, then shared files"""
+        files = [path for result in self.results for path in result.files_created]
+        return files + self.shared_files
@@ -1,6 +1,32 @@
+import asyncio
+import time
+from collections.abc import Callable, Generator
 from pathlib import Path
 
+from fastclean.application.generation.directories import (
+    DirectoryPlan,
+    DirectoryPlanner,
+)
+from fastclean.application.generation.events import (
+    PLANNED,
+    SKIPPED,
+    WRITTEN,
+    GenerationEvent,
+    drain,
+    drain_async,
+)
+from fastclean.application.generation.executor import RenderExecutor, RenderResult
+from fastclean.application.generation.lock import GenerationLock
+from fastclean.application.generation.loop_file_system import LoopFileSystem
+from fastclean.application.generation.plan import PlannedJob
+from fastclean.application.generation.profiler import NULL_PROFILER, Profiler
+from fastclean.application.generation.registry import REGISTRY_PLAN, write_registry
+from fastclean.application.interfaces.async_file_system import (
+    IAsyncFileSystemService,
+)
 from fastclean.application.interfaces.file_system import IFileSystemService
+from fastclean.application.interfaces.post_processor import IPostProcessor
+from fastclean.application.interfaces.render_cache import IRenderCache
 from fastclean.application.interfaces.template_engine import ITemplateEngine
 from fastclean.core.exceptions.base import ValidationException
 from fastclean.core.exceptions.validation import (
@@ -9,63 +35,215 @@ from fastclean.core.exceptions.validation import (
 )
 from fastclean.core.use_case import BaseUseCase
 
-from .dto import GenerateCRUDRequest, GenerateCRUDResponse
+from .dto import KEYSET, PAGINATION_STYLES, GenerateCRUDRequest, GenerateCRUDResponse
+from .plan import CRUD_PLAN
 
 
 class GenerateCRUDUseCase(BaseUseCase[GenerateCRUDRequest, GenerateCRUDResponse]):
     """Use case for generating CRUD operations"""
 
     def __init__(
-        self, file_system: IFileSystemService, template_engine: ITemplateEngine
+        self,
+        file_system: IFileSystemService,
+        template_engine: ITemplateEngine,
+        profiler: Profiler | None = None,
+        render_cache: IRenderCache | None = None,
+        post_processor: IPostProcessor | None = None,
     ):
         self._file_system = file_system
         self._template_engine = template_engine
+        self._profiler = profiler or NULL_PROFILER
+        self._render_cache = render_cache
+        self._post_processor = post_processor
 
     def execute(self, request: GenerateCRUDRequest) -> GenerateCRUDResponse:
         """Execute CRUD generation"""
+        return drain(self.stream(request))
+
+    async def execute_async(
+        self,
+        request: GenerateCRUDRequest,
+        on_event: Callable[[GenerationEvent], None] | None = None,
+        file_system: IAsyncFileSystemService | None = None,
+    ) -> GenerateCRUDResponse:
+        """Execute CRUD generation in worker threads, without blocking the event loop
+
+        Cancelling the awaiting task rolls the run back. Given an async
+        file_system, the run's file I/O goes through it instead, e.g. to
+        bound the writes in flight across concurrent runs.
+        """
+        use_case = self
+        if file_system is not None:
+            loop = asyncio.get_running_loop()
+            use_case = self._on(LoopFileSystem(file_system, loop))
+        return await drain_async(use_case.stream(request), on_event)
+
+    def stream(
+        self, request: GenerateCRUDRequest
+    ) -> Generator[GenerationEvent, None, GenerateCRUDResponse]:
+        """Execute CRUD generation, yielding an event per file step
+
+        Returns the response once exhausted. Closing the stream early rolls
+        the generated files back. Each stream writes through its own session
+        of the file system, so concurrent runs commit and roll back
+        independently.
+        """
+        return self._on(self._file_system.session())._run(request)
+
+    def _on(self, file_system: IFileSystemService) -> "GenerateCRUDUseCase":
+        """The same use case writing through another file system"""
+        return GenerateCRUDUseCase(
+            file_system,
+            self._template_engine,
+            self._profiler,
+            self._render_cache,
+            self._post_processor,
+        )
 
-        # Validate
-        self.validate_input(request)
-
-        # Generate files
-        files_created = []
-        context = self._build_context(request)
-
-        # Generate entity
-        entity_path = self._generate_entity(request, context)
-        files_created.append(entity_path)
-
-        # Generate repository interface
-        repo_interface_path = self._generate_repository_interface(request, context)
-        files_created.append(repo_interface_path)
-
-        # Generate repository implementation
-        repo_impl_path = self._generate_repository_implementation(request, context)
-        files_created.append(repo_impl_path)
-
-        # Generate use cases
-        usecase_paths = self._generate_use_cases(request, context)
-        files_created.extend(usecase_paths)
-
-        # Generate API routes
-        route_path = self._generate_api_routes(request, context)
-        files_created.append(route_path)
-
-        # Generate schemas
-        schema_path = self._generate_schemas(request, context)
-        files_created.append(schema_path)
-
-        # Generate tests if requested
-        if request.generate_tests:
-            test_paths = self._generate_tests(request, context)
-            files_created.extend(test_paths)
+    def _run(
+        self, request: GenerateCRUDRequest
+    ) -> Generator[GenerationEvent, None, GenerateCRUDResponse]:
+        started = time.perf_counter()
 
-        return GenerateCRUDResponse(
+        # Validate
+        with self._profiler.phase("validate"):
+            self.validate_input(request)
+
+        # Other runs on the project wait, so none loses this one's lock entries
+        with self._file_system.exclusive(request.project_path):
+            try:
+                with self._profiler.phase("load_lock"):
+                    lock = GenerationLock.load(self._file_system, request.project_path)
+                with self._profiler.phase("generate_files"):
+                    response = yield from self.generate_events(
+                        request, lock, started=started
+                    )
+                with self._profiler.phase("generate_shared"):
+                    for result in self.generate_registry(lock):
+                        if result.written:
+                            response.files_created.append(result.path)
+                            response.changes[result.path] = result.reason
+                        else:
+                            response.files_unchanged.append(result.path)
+                with self._profiler.phase("save_lock"):
+                    lock.save(self._file_system)
+                with self._profiler.phase("commit"):
+                    self._file_system.commit()
+            except BaseException:
+                self._file_system.rollback()
+                raise
+
+        self.compile(response.files_created, lock)
+        return response
+
+    def generate(
+        self,
+        request: GenerateCRUDRequest,
+        lock: GenerationLock,
+        create_directories: bool = True,
+    ) -> GenerateCRUDResponse:
+        """Generate files for a validated request, recording them in lock
+
+        Callers that created the directories of the whole run already pass
+        ``create_directories=False``.
+        """
+        return drain(self.generate_events(request, lock, create_directories))
+
+    def generate_registry(self, lock: GenerationLock) -> list[RenderResult]:
+        """Rebuild the route registry from every entity recorded in lock"""
+        executor = RenderExecutor(
+            self._file_system,
+            self._template_engine,
+            lock=lock,
+            profiler=self._profiler,
+            render_cache=self._render_cache,
+            post_processor=self._post_processor,
+        )
+        return write_registry(executor, lock, self._file_system)
+
+    def compile(self, paths: list[Path], lock: GenerationLock) -> None:
+        """Precompile published files to bytecode"""
+        if self._post_processor is None:
+            return
+        executor = RenderExecutor(
+            self._file_system,
+            self._template_engine,
+            lock=lock,
+            profiler=self._profiler,
+            post_processor=self._post_processor,
+        )
+        with self._profiler.phase("compile"):
+            executor.compile(paths)
+
+    def generate_events(
+        self,
+        request: GenerateCRUDRequest,
+        lock: GenerationLock,
+        create_directories: bool = True,
+        started: float | None = None,
+    ) -> Generator[GenerationEvent, None, GenerateCRUDResponse]:
+        """Like generate, yielding an event per file step"""
+        started = time.perf_counter() if started is None else started
+        context = self.build_context(request)
+        executor = RenderExecutor(
+            self._file_system,
+            self._template_engine,
+            lock=lock,
+            profiler=self._profiler,
+            render_cache=self._render_cache,
+            post_processor=self._post_processor,
+        )
+        planned = executor.plan(CRUD_PLAN, context)
+        lock.record_entity(request.entity_name, context["entity_name_snake"])
+        if create_directories:
+            self.plan_directories(
+                request.project_path, [(planned, CRUD_PLAN.packages(context))]
+            ).apply(self._file_system, self._profiler)
+
+        for index, job in enumerate(planned, 1):
+            yield GenerationEvent(
+                PLANNED,
+                request.project_path / job.path,
+                index,
+                len(planned),
+                time.perf_counter() - started,
+            )
+
+        response = GenerateCRUDResponse(
             entity_name=request.entity_name,
-            files_created=files_created,
+            files_created=[],
             success=True,
             message=f"CRUD for '{request.entity_name}' generated successfully!",
         )
+        for event in executor.stream(
+            [job.job for job in planned], context, request.project_path, started
+        ):
+            if event.kind == WRITTEN:
+                response.files_created.append(event.path)
+                response.changes[event.path] = event.reason
+            elif event.kind == SKIPPED:
+                response.files_unchanged.append(event.path)
+            yield event
+        return response
+
+    def plan(self, request: GenerateCRUDRequest) -> list[PlannedJob]:
+        """Files a request would generate, without rendering them"""
+        self.validate_input(request)
+        executor = RenderExecutor(self._file_system, self._template_engine)
+        context = self.build_context(request)
+        return executor.plan(CRUD_PLAN, context) + executor.plan(
+            REGISTRY_PLAN, {"entities": [context]}
+        )
+
+    @staticmethod
+    def plan_directories(
+        root: Path, outputs: list[tuple[list[PlannedJob], list[Path]]]
+    ) -> DirectoryPlan:
+        """Directories for planned files and their package directories"""
+        planner = DirectoryPlanner(root)
+        for planned, packages in outputs:
+            planner.add_files(job.path for job in planned).add_packages(packages)
+        return planner.plan()
 
     def validate_input(self, request: GenerateCRUDRequest) -> None:
         """Validate input"""
@@ -78,152 +256,36 @@ class GenerateCRUDUseCase(BaseUseCase[GenerateCRUDRequest, GenerateCRUDResponse]
         if not request.fields:
             raise ValidationException("At least one field is required")
 
-    def _build_context(self, request: GenerateCRUDRequest) -> dict:
+        if request.pagination not in PAGINATION_STYLES:
+            raise ValidationException(
+                f"Unknown pagination '{request.pagination}', expected one of "
+                f"{', '.join(PAGINATION_STYLES)}"
+            )
+
+        if request.pagination == KEYSET and not request.supports_keyset:
+            raise ValidationException(
+                f"Keyset pagination needs a single int or str primary key, "
+                f"use offset pagination for '{request.entity_name}'"
+            )
+
+    def build_context(self, request: GenerateCRUDRequest) -> dict:
         """Build template context"""
+        entity_name_snake = self._to_snake_case(request.entity_name)
+        key_fields = request.key_fields
         return {
             "entity_name": request.entity_name,
             "entity_name_lower": request.entity_name.lower(),
-            "entity_name_snake": self._to_snake_case(request.entity_name),
+            "entity_name_snake": entity_name_snake,
+            "table_name": request.table_name or f"{entity_name_snake}s",
             "fields": request.fields,
             "has_tests": request.generate_tests,
+            "pagination": request.pagination,
+            "key_fields": key_fields,
+            "key_type": key_fields[0].type if len(key_fields) == 1 else "tuple",
+            "default_key": not any(field.primary_key for field in request.fields),
+            "has_created_at": request.has_created_at,
         }
 
-    def _generate_entity(self, request: GenerateCRUDRequest, context: dict) -> Path:
-        """Generate entity file"""
-        template = self._template_engine.load_template("entity", "crud")
-        content = self._template_engine.render(template, context)
-
-        path = (
-            request.project_path
-            / "src"
-            / "domain"
-            / "entities"
-            / f"{context['entity_name_snake']}.py"
-        )
-        self._file_system.create_file(path, content)
-        return path
-
-    def _generate_repository_interface(
-        self, request: GenerateCRUDRequest, context: dict
-    ) -> Path:
-        """Generate repository interface"""
-        template = self._template_engine.load_template("repository_interface", "crud")
-        content = self._template_engine.render(template, context)
-
-        path = (
-            request.project_path
-            / "src"
-            / "domain"
-            / "repositories"
-            / f"{context['entity_name_snake']}_repository.py"
-        )
-        self._file_system.create_file(path, content)
-        return path
-
-    def _generate_repository_implementation(
-        self, request: GenerateCRUDRequest, context: dict
-    ) -> Path:
-        """Generate repository implementation"""
-        template = self._template_engine.load_template("repository_impl", "crud")
-        content = self._template_engine.render(template, context)
-
-        path = (
-            request.project_path
-            / "src"
-            / "infrastructure"
-            / "database"
-            / "repositories"
-            / f"{context['entity_name_snake']}_repository.py"
-        )
-        self._file_system.create_file(path, content)
-        return path
-
-    def _generate_use_cases(self, request: GenerateCRUDRequest, context: dict) -> list:
-        """Generate use case files"""
-        paths = []
-        use_cases = ["create", "get", "update", "delete", "list"]
-
-        usecase_dir = (
-            request.project_path
-            / "src"
-            / "application"
-            / "usecases"
-            / context["entity_name_snake"]
-        )
-        self._file_system.create_directory(usecase_dir)
-
-        for uc in use_cases:
-            template = self._template_engine.load_template(f"usecase_{uc}", "crud")
-            content = self._template_engine.render(template, context)
-
-            path = usecase_dir / f"{uc}_{context['entity_name_snake']}.py"
-            self._file_system.create_file(path, content)
-            paths.append(path)
-
-        return paths
-
-    def _generate_api_routes(self, request: GenerateCRUDRequest, context: dict) -> Path:
-        """Generate API routes"""
-        template = self._template_engine.load_template("routes", "crud")
-        content = self._template_engine.render(template, context)
-
-        path = (
-            request.project_path
-            / "src"
-            / "interfaces"
-            / "api"
-            / "v1"
-            / "routes"
-            / f"{context['entity_name_snake']}.py"
-        )
-        self._file_system.create_file(path, content)
-        return path
-
-    def _generate_schemas(self, request: GenerateCRUDRequest, context: dict) -> Path:
-        """Generate Pydantic schemas"""
-        template = self._template_engine.load_template("schemas", "crud")
-        content = self._template_engine.render(template, context)
-
-        path = (
-            request.project_path
-            / "src"
-            / "interfaces"
-            / "schemas"
-            / f"{context['entity_name_snake']}.py"
-        )
-        self._file_system.create_file(path, content)
-        return path
-
-    def _generate_tests(self, request: GenerateCRUDRequest, context: dict) -> list:
-        """Generate test files"""
-        paths = []
-
-        # Unit test
-        unit_template = self._template_engine.load_template("test_unit", "crud")
-        unit_content = self._template_engine.render(unit_template, context)
-        unit_path = (
-            request.project_path
-            / "tests"
-            / "unit"
-            / f"test_{context['entity_name_snake']}_usecase.py"
-        )
-        self._file_system.create_file(unit_path, unit_content)
-        paths.append(unit_path)
-
-        # Integration test
-        int_template = self._template_engine.load_template("test_integration", "crud")
-        int_content = self._template_engine.render(int_template, context)
-        int_path = (
-            request.project_path
-            / "tests"
-            / "integration"
-            / f"test_{context['entity_name_snake']}_api.py"
-        )
-        self._file_system.create_file(int_path, int_content)
-        paths.append(int_path)
-
-        return paths
-
     @staticmethod
     def _to_snake_case(text: str) -> str:
         """Convert text to snake_case"""
@@ -0,0 +1,143 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from fastclean.application.generation.executor import RenderExecutor, resolve_jobs
+from fastclean.application.generation.lock import GenerationLock
+from fastclean.application.generation.plan import PlannedJob
+from fastclean.application.generation.profiler import NULL_PROFILER, Profiler
+from fastclean.application.generation.registry import REGISTRY_PLAN
+from fastclean.application.interfaces.file_system import IFileSystemService
+from fastclean.application.interfaces.render_cache import IRenderCache
+from fastclean.application.interfaces.template_engine import ITemplateEngine
+from fastclean.core.exceptions.base import ValidationException
+from fastclean.core.exceptions.validation import InvalidPathException
+from fastclean.core.use_case import BaseUseCase
+
+from .dto import GenerateCRUDBatchRequest, GenerateCRUDBatchResponse
+from .generate_crud import GenerateCRUDUseCase
+from .plan import CRUD_PLAN
+
+
+class GenerateCRUDBatchUseCase(
+    BaseUseCase[GenerateCRUDBatchRequest, GenerateCRUDBatchResponse]
+):
+    """Use case for generating CRUD for many entities in one process
+
+    Entities are generated by a worker pool sharing one template engine, so
+    every template is compiled once for the whole batch. The directories of
+    all entities are created in one pass up front. The route registry, shared
+    by all entities, is rebuilt once after every entity succeeded.
+    """
+
+    def __init__(
+        self,
+        generate_crud: GenerateCRUDUseCase,
+        file_system: IFileSystemService,
+        template_engine: ITemplateEngine,
+        profiler: Profiler | None = None,
+        render_cache: IRenderCache | None = None,
+    ):
+        self._generate_crud = generate_crud
+        self._file_system = file_system
+        self._template_engine = template_engine
+        self._profiler = profiler or NULL_PROFILER
+        self._render_cache = render_cache
+
+    def execute(self, request: GenerateCRUDBatchRequest) -> GenerateCRUDBatchResponse:
+        """Execute batch CRUD generation"""
+        with self._profiler.phase("validate"):
+            self.validate_input(request)
+
+        # Other runs on the project wait, so none loses this one's lock entries
+        with self._file_system.exclusive(request.project_path):
+            try:
+                with self._profiler.phase("load_lock"):
+                    lock = GenerationLock.load(self._file_system, request.project_path)
+                with self._profiler.phase("create_structure"):
+                    self._create_directories(request)
+                with self._profiler.phase("generate_entities"):
+                    results = self._generate_entities(request, lock)
+                with self._profiler.phase("generate_shared"):
+                    shared = self._generate_crud.generate_registry(lock)
+                with self._profiler.phase("save_lock"):
+                    lock.save(self._file_system)
+                with self._profiler.phase("commit"):
+                    self._file_system.commit()
+            except BaseException:
+                # All entities are published together, or none of them
+                self._file_system.rollback()
+                raise
+
+        response = GenerateCRUDBatchResponse(
+            results=results,
+            shared_files=[r.path for r in shared if r.written],
+            shared_files_unchanged=[r.path for r in shared if not r.written],
+            success=all(result.success for result in results),
+            message=f"CRUD for {len(results)} entities generated successfully!",
+        )
+        self._generate_crud.compile(response.files_created, lock)
+        return response
+
+    def plan(self, request: GenerateCRUDBatchRequest) -> list[PlannedJob]:
+        """Files a request would generate, without rendering them"""
+        self.validate_input(request)
+        executor = RenderExecutor(self._file_system, self._template_engine)
+        planned = []
+        for entity in request.entities:
+            context = self._generate_crud.build_context(entity)
+            planned.extend(executor.plan(CRUD_PLAN, context))
+        return planned + executor.plan(REGISTRY_PLAN, self._shared_context(request))
+
+    def validate_input(self, request: GenerateCRUDBatchRequest) -> None:
+        """Validate input"""
+        if not self._file_system.directory_exists(request.project_path):
+            raise InvalidPathException(str(request.project_path))
+
+        if not request.entities:
+            raise ValidationException("At least one entity is required")
+
+        seen = set()
+        for entity in request.entities:
+            self._generate_crud.validate_input(entity)
+            if entity.entity_name in seen:
+                raise ValidationException(
+                    f"Entity '{entity.entity_name}' is defined more than once"
+                )
+            seen.add(entity.entity_name)
+
+    def _generate_entities(
+        self, request: GenerateCRUDBatchRequest, lock: GenerationLock
+    ) -> list:
+        """Generate every entity, in a thread pool when jobs allow"""
+
+        def generate(entity):
+            return self._generate_crud.generate(entity, lock, create_directories=False)
+
+        workers = min(resolve_jobs(request.jobs), len(request.entities))
+        if workers == 1:
+            return [generate(entity) for entity in request.entities]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(generate, request.entities))
+
+    def _create_directories(self, request: GenerateCRUDBatchRequest) -> None:
+        """Create the directories of every entity in one pass"""
+        executor = RenderExecutor(self._file_system, self._template_engine)
+        outputs = []
+        for entity in request.entities:
+            context = self._generate_crud.build_context(entity)
+            outputs.append(
+                (executor.plan(CRUD_PLAN, context), CRUD_PLAN.packages(context))
+            )
+        outputs.append(
+            (executor.plan(REGISTRY_PLAN, self._shared_context(request)), [])
+        )
+        directories = self._generate_crud.plan_directories(
+            request.project_path, outputs
+        )
+        directories.apply(self._file_system, self._profiler)
+
+    def _shared_context(self, request: GenerateCRUDBatchRequest) -> dict:
+        return {
+            "entities": [
+                self._generate_crud.build_context(entity) for entity in request.entities
+            ]
+        }
@@ -0,0 +1,68 @@
+from fastclean.application.generation.plan import GenerationPlan, PlanNode
+
+USE_CASES = ["create", "get", "update", "delete", "list"]
+
+# Files generated for each entity
+CRUD_PLAN = GenerationPlan(
+    [
+        PlanNode(
+            "entity", "entity", "crud", "src/domain/entities/{entity_name_snake}.py"
+        ),
+        PlanNode(
+            "repository_interface",
+            "repository_interface",
+            "crud",
+            "src/domain/repositories/{entity_name_snake}_repository.py",
+        ),
+        PlanNode(
+            "model",
+            "model",
+            "crud",
+            "src/infrastructure/database/models/{entity_name_snake}_model.py",
+        ),
+        PlanNode(
+            "repository_impl",
+            "repository_impl",
+            "crud",
+            "src/infrastructure/database/repositories/"
+            "{entity_name_snake}_repository.py",
+        ),
+        *(
+            PlanNode(
+                f"usecase_{uc}",
+                f"usecase_{uc}",
+                "crud",
+                "src/application/usecases/{entity_name_snake}/"
+                f"{uc}_{{entity_name_snake}}.py",
+            )
+            for uc in USE_CASES
+        ),
+        PlanNode(
+            "routes",
+            "routes",
+            "crud",
+            "src/interfaces/api/v1/routes/{entity_name_snake}.py",
+        ),
+        PlanNode(
+            "schemas",
+            "schemas",
+            "crud",
+            "src/interfaces/schemas/{entity_name_snake}.py",
+        ),
+        PlanNode(
+            "test_unit",
+            "test_unit",
+            "crud",
+            "tests/unit/test_{entity_name_snake}_usecase.py",
+            condition="has_tests",
+        ),
+        PlanNode(
+            "test_integration",
+            "test_integration",
+            "crud",
+            "tests/integration/test_{entity_name_snake}_api.py",
+            condition="has_tests",
+        ),
+    ],
+    packages=["src/application/usecases/{entity_name_snake}"],
+)
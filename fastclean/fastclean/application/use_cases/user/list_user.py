@@ -8,6 +8,6 @@ class ListUsersUseCase:
     def __init__(self, user_repository: IUserRepository):
         self._repository = user_repository
 
-    async def execute(self, skip: int = 0, limit: int = 100) -> list[User]:
+    async def execute(self, after: int | None = None, limit: int = 100) -> list[User]:
         """Execute use case"""
-        return await self._repository.get_all(skip=skip, limit=limit)
+        return await self._repository.get_page(after=after, limit=limit)
@@ -4,55 +4,264 @@ FastAPI Clean Architecture CLI - Main Entry Point
 
 import argparse
 import sys
+from functools import cached_property
+from pathlib import Path
 
-from fastclean.application.use_cases.create_project.create_project import (
-    CreateProjectUseCase,
-)
-from fastclean.application.use_cases.generate_crud.generate_crud import (
-    GenerateCRUDUseCase,
-)
-from fastclean.infrastructure.file_system.local_file_system import (
-    LocalFileSystemService,
-)
-from fastclean.infrastructure.file_system.path_resolver import PathResolver
-from fastclean.infrastructure.templates.jinja_engine import JinjaTemplateEngine
-from fastclean.infrastructure.validators.project_validator import ProjectValidator
-from fastclean.presentation.cli.crud_command import CRUDCommand
-from fastclean.presentation.cli.init_command import InitCommand
-from fastclean.presentation.formatters.console_formatter import ConsoleFormatter
+# Startup only imports argparse: everything else is imported by the
+# container when a command first needs it, so --help, argument errors and
+# each subcommand load no more than they use.
 
 
 class DependencyContainer:
-    """Dependency Injection Container"""
+    """Dependency Injection Container
 
-    def __init__(self):
-        self.file_system = LocalFileSystemService()
-        templates_dir = PathResolver.get_templates_dir()
-        self.template_engine = JinjaTemplateEngine(templates_dir)
-        self.validator = ProjectValidator()
+    Services are built lazily, on first access.
+    """
 
-        self.create_project_usecase = CreateProjectUseCase(
-            self.file_system, self.template_engine, self.validator
+    def __init__(
+        self,
+        dry_run: bool = False,
+        output_archive: Path | None = None,
+        archive_root: Path = Path("."),
+        profiler=None,
+        use_cache: bool = True,
+        template_engine=None,
+        formatter=None,
+        render_cache=None,
+        format_code: bool = False,
+        compile_bytecode: bool = False,
+        jobs: int = 1,
+    ):
+        self._dry_run = dry_run
+        self._output_archive = output_archive
+        self._archive_root = archive_root
+        self._use_cache = use_cache
+        self._format_code = format_code
+        self._compile_bytecode = compile_bytecode
+        self._jobs = jobs
+        self.profiler = profiler
+        # Shared services (e.g. the daemon's warm engine) replace the lazy ones
+        if template_engine is not None:
+            self.template_engine = template_engine
+        if formatter is not None:
+            self.formatter = formatter
+        if render_cache is not None:
+            self.disk_render_cache = render_cache
+
+    @cached_property
+    def preview(self):
+        # A dry run renders into memory, reading existing files from disk
+        if not self._dry_run:
+            return None
+        from fastclean.infrastructure.file_system.in_memory_file_system import (
+            InMemoryFileSystemService,
         )
 
-        self.generate_crud_usecase = GenerateCRUDUseCase(
-            self.file_system, self.template_engine
+        return InMemoryFileSystemService(read_through=True)
+
+    @cached_property
+    def file_system(self):
+        if self.preview:
+            file_system = self.preview
+        elif self._output_archive:
+            from fastclean.infrastructure.file_system.archive_file_system import (
+                ArchiveFileSystemService,
+            )
+
+            file_system = ArchiveFileSystemService(
+                self._output_archive, self._archive_root
+            )
+        else:
+            from fastclean.infrastructure.file_system.transactional_file_system import (
+                TransactionalFileSystemService,
+            )
+
+            file_system = TransactionalFileSystemService()
+
+        if self.profiler:
+            from fastclean.infrastructure.file_system.profiling_file_system import (
+                ProfilingFileSystemService,
+            )
+
+            file_system = ProfilingFileSystemService(file_system, self.profiler)
+        return file_system
+
+    @cached_property
+    def template_engine(self):
+        from fastclean.infrastructure.file_system.path_resolver import PathResolver
+        from fastclean.infrastructure.templates.jinja_engine import (
+            JinjaTemplateEngine,
         )
 
-        self.formatter = ConsoleFormatter()
+        return JinjaTemplateEngine(PathResolver.get_templates_dir())
+
+    @cached_property
+    def disk_render_cache(self):
+        from importlib.metadata import PackageNotFoundError, version
+
+        from fastclean.infrastructure.cache.disk_render_cache import DiskRenderCache
+        from fastclean.infrastructure.file_system.path_resolver import PathResolver
 
-        self.init_command = InitCommand(
-            self.create_project_usecase, formatter=self.formatter
+        # Renders depend on the generator and Jinja versions as well
+        versions = []
+        for package in ("fastclean", "jinja2"):
+            try:
+                versions.append(f"{package}-{version(package)}")
+            except PackageNotFoundError:
+                versions.append(f"{package}-dev")
+        return DiskRenderCache(
+            PathResolver.get_cache_dir(), namespace=",".join(versions)
         )
 
-        self.crud_command = CRUDCommand(
-            self.generate_crud_usecase, formatter=self.formatter
+    @property
+    def render_cache(self):
+        return self.disk_render_cache if self._use_cache else None
+
+    @cached_property
+    def post_processor(self):
+        # Only files published to disk can be compiled; parse_args rejects
+        # the combination, this guards containers built directly
+        compile_bytecode = self._compile_bytecode and not (
+            self._dry_run or self._output_archive
+        )
+        if not (self._format_code or compile_bytecode):
+            return None
+        from fastclean.application.generation.executor import resolve_jobs
+        from fastclean.infrastructure.post_processing.python_post_processor import (
+            PythonPostProcessor,
         )
 
+        return PythonPostProcessor(
+            self._format_code, compile_bytecode, resolve_jobs(self._jobs)
+        )
 
-def main():
-    """Main CLI entry point"""
-    parser = argparse.ArgumentParser(
+    def close(self) -> None:
+        """Release services holding workers"""
+        if self.__dict__.get("post_processor") is not None:
+            self.post_processor.close()
+
+    @cached_property
+    def validator(self):
+        from fastclean.infrastructure.validators.project_validator import (
+            ProjectValidator,
+        )
+
+        return ProjectValidator()
+
+    @cached_property
+    def create_project_usecase(self):
+        from fastclean.application.use_cases.create_project.create_project import (
+            CreateProjectUseCase,
+        )
+
+        return CreateProjectUseCase(
+            self.file_system,
+            self.template_engine,
+            self.validator,
+            self.profiler,
+            self.render_cache,
+            self.post_processor,
+        )
+
+    @cached_property
+    def generate_crud_usecase(self):
+        from fastclean.application.use_cases.generate_crud.generate_crud import (
+            GenerateCRUDUseCase,
+        )
+
+        return GenerateCRUDUseCase(
+            self.file_system,
+            self.template_engine,
+            self.profiler,
+            self.render_cache,
+            self.post_processor,
+        )
+
+    @cached_property
+    def generate_crud_batch_usecase(self):
+        from fastclean.application.use_cases.generate_crud.generate_crud_batch import (
+            GenerateCRUDBatchUseCase,
+        )
+
+        return GenerateCRUDBatchUseCase(
+            self.generate_crud_usecase,
+            self.file_system,
+            self.template_engine,
+            self.profiler,
+            self.render_cache,
+        )
+
+    @cached_property
+    def add_features_usecase(self):
+        from fastclean.application.use_cases.add_feature.add_features import (
+            AddFeaturesUseCase,
+        )
+
+        return AddFeaturesUseCase(self.file_system, self.template_engine)
+
+    @cached_property
+    def formatter(self):
+        from fastclean.presentation.formatters.console_formatter import (
+            ConsoleFormatter,
+        )
+
+        return ConsoleFormatter()
+
+    @cached_property
+    def init_command(self):
+        from fastclean.presentation.cli.init_command import InitCommand
+
+        return InitCommand(
+            self.create_project_usecase,
+            formatter=self.formatter,
+            preview=self.preview,
+        )
+
+    @cached_property
+    def crud_command(self):
+        from fastclean.presentation.cli.crud_command import CRUDCommand
+
+        return CRUDCommand(
+            self.generate_crud_usecase,
+            self.generate_crud_batch_usecase,
+            formatter=self.formatter,
+            preview=self.preview,
+        )
+
+    @cached_property
+    def feature_command(self):
+        from fastclean.presentation.cli.feature_command import FeatureCommand
+
+        return FeatureCommand(
+            self.add_features_usecase, formatter=self.formatter, preview=self.preview
+        )
+
+    @cached_property
+    def diagnose_project_usecase(self):
+        from fastclean.application.use_cases.diagnose_project.diagnose_project import (
+            DiagnoseProjectUseCase,
+        )
+
+        return DiagnoseProjectUseCase(self.file_system)
+
+    @cached_property
+    def doctor_command(self):
+        from fastclean.presentation.cli.doctor_command import DoctorCommand
+
+        return DoctorCommand(self.diagnose_project_usecase, formatter=self.formatter)
+
+    @cached_property
+    def cache_command(self):
+        from fastclean.presentation.cli.cache_command import CacheCommand
+
+        return CacheCommand(self.disk_render_cache, formatter=self.formatter)
+
+
+def build_parser(
+    parser_class: type[argparse.ArgumentParser] = argparse.ArgumentParser,
+) -> tuple[argparse.ArgumentParser, dict[str, argparse.ArgumentParser]]:
+    """Build the argument parser and its subcommand parsers"""
+    parser = parser_class(
         prog="fastclean",
         description="FastAPI Clean Architecture CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -60,6 +269,11 @@ def main():
 Examples:
   fastclean init --name=my_project --db=postgresql --docker
   fastclean crud Product --fields="name:str,price:float"
+  fastclean crud --from entities.yaml --jobs 0
+  fastclean feature add jwt,redis,prometheus
+  fastclean serve --workers 8
+  fastclean cache stats
+  fastclean doctor --json report.json --fail-on high
 """,
     )
 
@@ -117,31 +331,282 @@ Examples:
     init_parser.add_argument(
         "--testing", default="basic", choices=["basic", "full"], help="Testing scope"
     )
+    init_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Render templates with N worker threads (0 = one per CPU)",
+    )
+    init_parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Regenerate an existing project, rewriting only changed files",
+    )
+    init_parser.add_argument(
+        "--output-archive",
+        metavar="FILE",
+        help="Stream the project into a .tar.gz/.tar.xz/.tar/.zip archive instead",
+    )
 
     # CRUD command
     crud_parser = subparsers.add_parser("crud", help="Generate CRUD operations")
-    crud_parser.add_argument("entity", help="Entity name")
-    crud_parser.add_argument("--fields", required=True, help="Fields")
+    crud_parser.add_argument("entity", nargs="?", help="Entity name")
+    crud_parser.add_argument("--fields", help="Fields")
+    crud_parser.add_argument(
+        "--from",
+        dest="manifest",
+        help="Generate every entity of a JSON/YAML manifest",
+    )
+    crud_parser.add_argument(
+        "--from-db",
+        dest="database",
+        metavar="URL",
+        help="Generate an entity per table of a database (SQLite path or URL)",
+    )
+    crud_parser.add_argument(
+        "--from-openapi",
+        dest="openapi",
+        metavar="SPEC",
+        help="Generate an entity per object schema of an OpenAPI document",
+    )
     crud_parser.add_argument("--path", default=".", help="Project path")
+    crud_parser.add_argument(
+        "--pagination",
+        choices=["keyset", "offset"],
+        help="List pagination: keyset cursors (default) or opt-in offset/limit",
+    )
     crud_parser.add_argument(
         "--no-tests", dest="tests", action="store_false", help="Skip test generation"
     )
+    crud_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Generate entities with N worker threads (0 = one per CPU)",
+    )
 
-    args = parser.parse_args()
+    # Feature command
+    feature_parser = subparsers.add_parser(
+        "feature", help="Add features to an existing project"
+    )
+    feature_parser.add_argument("action", choices=["add"], help="Add features")
+    feature_parser.add_argument(
+        "features",
+        help="Comma-separated features: jwt, redis, prometheus",
+    )
+    feature_parser.add_argument("--path", default=".", help="Project path")
+    feature_parser.add_argument("--secret-key", help="JWT secret key")
+    feature_parser.add_argument("--redis-url", help="Redis connection URL")
+    feature_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Apply the edits in memory and print the changed files instead",
+    )
+    feature_parser.set_defaults(
+        use_cache=True, profile=False, profile_json=None, pstats=None
+    )
+
+    # Doctor command
+    doctor_parser = subparsers.add_parser(
+        "doctor", help="Find performance anti-patterns in a project"
+    )
+    doctor_parser.add_argument("--path", default=".", help="Project path")
+    doctor_parser.add_argument(
+        "--json",
+        metavar="FILE",
+        help="Write the findings as JSON ('-' for stdout)",
+    )
+    doctor_parser.add_argument(
+        "--fail-on",
+        choices=["high", "medium", "low"],
+        help="Exit with status 1 if any finding is at least this severe",
+    )
+    doctor_parser.add_argument(
+        "--include-tests", action="store_true", help="Analyze tests/ as well"
+    )
+
+    # Cache command
+    cache_parser = subparsers.add_parser("cache", help="Manage the render cache")
+    cache_parser.add_argument(
+        "action", choices=["stats", "clear"], help="Show or remove cached renders"
+    )
+
+    # Serve command
+    serve_parser = subparsers.add_parser(
+        "serve", help="Run a generator daemon with warm templates"
+    )
+    transport = serve_parser.add_mutually_exclusive_group()
+    transport.add_argument(
+        "--socket",
+        metavar="PATH",
+        help="UNIX socket to listen on (default: $FASTCLEAN_SOCKET or a temp path)",
+    )
+    transport.add_argument(
+        "--stdio",
+        action="store_true",
+        help="Serve JSON-RPC over stdin/stdout instead of a socket",
+    )
+    serve_parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=4,
+        help="Requests handled concurrently (0 = one per CPU)",
+    )
+
+    for command_parser in (init_parser, crud_parser):
+        command_parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Render into memory and print the planned files instead",
+        )
+        command_parser.add_argument(
+            "--plan",
+            action="store_true",
+            help="Print the templates and files to generate without rendering",
+        )
+        command_parser.add_argument(
+            "--snapshot",
+            metavar="FILE",
+            help="With --dry-run, save the rendered files as JSON",
+        )
+        command_parser.add_argument(
+            "--no-cache",
+            dest="use_cache",
+            action="store_false",
+            help="Render every template instead of reusing cached renders",
+        )
+        command_parser.add_argument(
+            "--format",
+            dest="format_code",
+            action="store_true",
+            help="Format generated Python with black (whitespace only without it)",
+        )
+        command_parser.add_argument(
+            "--compile",
+            dest="compile_bytecode",
+            action="store_true",
+            help="Precompile generated Python into __pycache__",
+        )
+        command_parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="Print time and bytes written per phase and template",
+        )
+        command_parser.add_argument(
+            "--profile-json",
+            metavar="FILE",
+            help="Write the profile as JSON ('-' for stdout)",
+        )
+        command_parser.add_argument(
+            "--pstats",
+            metavar="FILE",
+            help="Dump a cProfile of the command for pstats/snakeviz",
+        )
+
+    return parser, {"init": init_parser, "crud": crud_parser}
+
+
+def parse_args(
+    parser: argparse.ArgumentParser,
+    commands: dict[str, argparse.ArgumentParser],
+    argv: list[str] | None = None,
+) -> argparse.Namespace:
+    """Parse and cross-check arguments, exiting through the parser on errors"""
+    args = parser.parse_args(argv)
+    if not args.command:
+        return args
+
+    init_parser, crud_parser = commands["init"], commands["crud"]
+    if args.command == "crud":
+        sources = [args.manifest, args.database, args.openapi]
+        if len(list(filter(None, sources))) > 1:
+            crud_parser.error("--from, --from-db and --from-openapi cannot be combined")
+        if not any(sources) and not (args.entity and args.fields):
+            crud_parser.error(
+                "ENTITY and --fields are required unless --from, --from-db or "
+                "--from-openapi is used"
+            )
+
+    output_archive = getattr(args, "output_archive", None)
+    if output_archive:
+        if args.dry_run or args.update:
+            init_parser.error("--output-archive cannot be combined with this option")
+        from fastclean.infrastructure.file_system.archive_file_system import (
+            ArchiveFileSystemService,
+        )
+
+        if not ArchiveFileSystemService.supports(Path(output_archive)):
+            init_parser.error(f"unsupported archive format: {output_archive}")
+    if getattr(args, "compile_bytecode", False) and (args.dry_run or output_archive):
+        commands[args.command].error(
+            "--compile cannot be combined with --dry-run or --output-archive"
+        )
+    return args
+
+
+def create_container(args: argparse.Namespace, **services) -> DependencyContainer:
+    """Build the container for parsed arguments"""
+    output_archive = getattr(args, "output_archive", None)
+    return DependencyContainer(
+        dry_run=args.dry_run,
+        output_archive=Path(output_archive) if output_archive else None,
+        archive_root=Path(getattr(args, "path", ".")),
+        profiler=_create_profiler(args),
+        use_cache=args.use_cache,
+        format_code=getattr(args, "format_code", False),
+        compile_bytecode=getattr(args, "compile_bytecode", False),
+        jobs=getattr(args, "jobs", 1),
+        **services,
+    )
+
+
+def execute(container: DependencyContainer, args: argparse.Namespace) -> int:
+    """Run the parsed command, with profiling when requested"""
+    try:
+        if args.pstats:
+            import cProfile
+
+            with cProfile.Profile() as profile:
+                exit_code = _run_command(container, args)
+            profile.dump_stats(args.pstats)
+            container.formatter.info(f"📊 cProfile stats written to: {args.pstats}")
+        else:
+            exit_code = _run_command(container, args)
+    finally:
+        container.close()
+
+    if container.profiler:
+        _report_profile(container, args)
+    return exit_code
+
+
+def main(argv: list[str] | None = None):
+    """Main CLI entry point"""
+    parser, commands = build_parser()
+    args = parse_args(parser, commands, argv)
 
     if not args.command:
         parser.print_help()
         return 1
 
-    container = DependencyContainer()
+    if args.command == "serve":
+        from fastclean.presentation.server.daemon import serve
+
+        return serve(args)
+
+    if args.command == "cache":
+        return DependencyContainer().cache_command.execute(vars(args))
+
+    if args.command == "doctor":
+        return DependencyContainer().doctor_command.execute(vars(args))
+
+    container = create_container(args)
 
     try:
-        if args.command == "init":
-            return container.init_command.execute(vars(args))
-        if args.command == "crud":
-            return container.crud_command.execute(vars(args))
-        print(f"Unknown command: {args.command}")
-        return 1
+        return execute(container, args)
     except KeyboardInterrupt:
         print("\n⚠️  Operation cancelled")
         return 130
@@ -153,5 +618,43 @@ Examples:
         return 1
 
 
+def _create_profiler(args: argparse.Namespace):
+    if not (args.profile or args.profile_json):
+        return None
+    from fastclean.application.generation.profiler import Profiler
+
+    return Profiler()
+
+
+def _run_command(container: DependencyContainer, args: argparse.Namespace) -> int:
+    if args.command == "init":
+        return container.init_command.execute(vars(args))
+    if args.command == "crud":
+        return container.crud_command.execute(vars(args))
+    if args.command == "feature":
+        return container.feature_command.execute(vars(args))
+    print(f"Unknown command: {args.command}")
+    return 1
+
+
+def _report_profile(container: DependencyContainer, args: argparse.Namespace) -> None:
+    if args.profile:
+        from fastclean.presentation.formatters.profile_formatter import (
+            ProfileFormatter,
+        )
+
+        for line in ProfileFormatter().format(container.profiler):
+            container.formatter.info(line)
+
+    if args.profile_json:
+        import json
+
+        report = json.dumps(container.profiler.to_dict(), indent=2)
+        if args.profile_json == "-":
+            container.formatter.write(report)
+        else:
+            Path(args.profile_json).write_text(report + "\n", encoding="utf-8")
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -1,4 +1,5 @@
 from fastclean.core.exceptions.base import (
+    DomainException,
     DuplicateEntityException,
     EntityNotFoundException,
     ValidationException,
@@ -39,3 +40,40 @@ class TemplateNotFoundException(EntityNotFoundException):
         super().__init__(
             f"Template '{template_name}' not found", code="TEMPLATE_NOT_FOUND"
         )
+
+
+class TemplateRenderException(DomainException):
+    """Exception when a template fails to render"""
+
+    def __init__(self, template_name: str, reason: str):
+        super().__init__(
+            f"Failed to render template '{template_name}': {reason}",
+            code="TEMPLATE_RENDER_FAILED",
+        )
+        self.template_name = template_name
+
+
+class InvalidPlanException(ValidationException):
+    """Exception for an inconsistent generation plan"""
+
+    def __init__(self, message: str):
+        super().__init__(message, code="INVALID_PLAN")
+
+
+class UnknownFeatureException(ValidationException):
+    """Exception for a feature that cannot be added"""
+
+    def __init__(self, feature: str, supported: list[str]):
+        super().__init__(
+            f"Unknown feature: '{feature}'. Supported: {', '.join(supported)}",
+            code="UNKNOWN_FEATURE",
+        )
+
+
+class FeatureConflictException(ValidationException):
+    """Exception for features whose edits contradict each other"""
+
+    def __init__(self, reason: str):
+        super().__init__(
+            f"Conflicting feature edits: {reason}", code="FEATURE_CONFLICT"
+        )
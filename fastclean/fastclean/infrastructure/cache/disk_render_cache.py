@@ -0,0 +1,159 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastclean.application.interfaces.render_cache import IRenderCache
+
+ENTRIES_DIR = "renders"
+
+
+@dataclass
+class RenderCacheStats:
+    """Contents of a render cache and its hit/miss counters in this process"""
+
+    directory: Path
+    entries: int = 0
+    size_bytes: int = 0
+    max_bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class DiskRenderCache(IRenderCache):
+    """Content-addressed render cache in a directory, bounded in size
+
+    Each entry is one file named by the hash of its key and the cache
+    ``namespace`` (the generator and Jinja versions), so an upgrade never
+    serves stale renders. Hits refresh the file's mtime, and once the cache
+    grows past ``max_bytes`` the least recently used entries are removed
+    down to 90% of the limit. I/O errors are treated as misses: the cache
+    never fails a generation. Safe to share between threads and processes.
+    """
+
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        namespace: str = "",
+    ):
+        self._directory = directory
+        self._entries_dir = directory / ENTRIES_DIR
+        self._max_bytes = max_bytes
+        self._namespace = namespace
+        self._lock = threading.Lock()
+        # Total size, scanned on the first write
+        self._size: int | None = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def get(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            content = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            with self._lock:
+                self._misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            # Only the entry's eviction order suffers, the content is good
+            pass
+        with self._lock:
+            self._hits += 1
+        return content
+
+    def set(self, key: str, content: str) -> None:
+        path = self._path(key)
+        data = content.encode("utf-8")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            try:
+                replaced = path.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp, path)
+        except OSError:
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._scan())
+            else:
+                self._size += len(data) - replaced
+            if self._size > self._max_bytes:
+                self._evict()
+
+    def stats(self) -> RenderCacheStats:
+        """Entries and size on disk, with this process's counters"""
+        entries = self._scan()
+        with self._lock:
+            return RenderCacheStats(
+                directory=self._directory,
+                entries=len(entries),
+                size_bytes=sum(size for _, size, _ in entries),
+                max_bytes=self._max_bytes,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
+
+    def clear(self) -> RenderCacheStats:
+        """Remove every entry, returning what was removed"""
+        removed = self.stats()
+        shutil.rmtree(self._entries_dir, ignore_errors=True)
+        with self._lock:
+            self._size = 0
+        return removed
+
+    def _evict(self) -> None:
+        # Called with the lock held
+        target = self._max_bytes * 9 // 10
+        for path, size, _ in sorted(self._scan(), key=lambda entry: entry[2]):
+            if self._size <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            self._size -= size
+            self._evictions += 1
+
+    def _scan(self) -> list[tuple[Path, int, float]]:
+        """Path, size and mtime of every entry"""
+        entries = []
+        try:
+            shards = list(os.scandir(self._entries_dir))
+        except OSError:
+            return entries
+        for shard in shards:
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((Path(entry.path), stat.st_size, stat.st_mtime))
+        return entries
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(f"{self._namespace}\0{key}".encode()).hexdigest()
+        return self._entries_dir / digest[:2] / digest[2:]
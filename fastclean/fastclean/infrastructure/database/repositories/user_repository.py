@@ -56,11 +56,13 @@ class UserRepository(IUserRepository):
         model = result.scalar_one_or_none()
         return self._to_entity(model) if model else None
 
-    async def get_all(self, skip: int = 0, limit: int = 100) -> list[User]:
-        """Get all users"""
-        result = await self._session.execute(
-            select(UserModel).offset(skip).limit(limit)
-        )
+    async def get_page(self, after: int | None = None, limit: int = 100) -> list[User]:
+        """Get a page of users after a user ID"""
+        # Seek on the primary key rather than OFFSET, so deep pages stay cheap
+        query = select(UserModel).order_by(UserModel.id).limit(limit)
+        if after is not None:
+            query = query.where(UserModel.id > after)
+        result = await self._session.execute(query)
         models = result.scalars().all()
         return [self._to_entity(model) for model in models]
 
@@ -0,0 +1,167 @@
+import io
+import os
+import tarfile
+import threading
+import time
+import zipfile
+from pathlib import Path, PurePosixPath
+
+from ...application.interfaces.file_system import IFileSystemService
+from ...core.exceptions.base import ValidationException
+
+TAR_MODES = {
+    ".tar": "w",
+    ".tar.gz": "w:gz",
+    ".tgz": "w:gz",
+    ".tar.bz2": "w:bz2",
+    ".tar.xz": "w:xz",
+}
+
+
+class ArchiveFileSystemService(IFileSystemService):
+    """File system that streams every write into a tar or zip archive
+
+    Each file is added to the archive as soon as it is written and is not
+    kept afterwards, so memory stays bounded by the largest single file.
+    Members are named relative to ``root``. The archive is written to a
+    temporary sibling, opened on the first write, and renamed into place on
+    commit.
+    """
+
+    def __init__(self, archive_path: Path, root: Path = Path(".")):
+        if not self.supports(archive_path):
+            raise ValidationException(
+                f"Unsupported archive format '{Path(archive_path).name}' "
+                f"(use .zip, {', '.join(TAR_MODES)})"
+            )
+        self._archive_path = Path(archive_path)
+        self._root = Path(root)
+        self._partial = self._archive_path.with_name(
+            f".{self._archive_path.name}.partial"
+        )
+        self._mtime = time.time()
+        self._files: set[Path] = set()
+        self._directories: set[Path] = set()
+        self._lock = threading.Lock()
+        self._tar: tarfile.TarFile | None = None
+        self._zip: zipfile.ZipFile | None = None
+
+    @staticmethod
+    def supports(archive_path: Path) -> bool:
+        """Check if the archive format is known from the file name"""
+        name = Path(archive_path).name.lower()
+        return name.endswith(".zip") or any(name.endswith(s) for s in TAR_MODES)
+
+    def create_directory(self, path: Path) -> None:
+        """Create a directory"""
+        with self._lock:
+            self._open()
+            self._add_directory(Path(path))
+
+    def create_file(self, path: Path, content: str) -> None:
+        """Create a file with content"""
+        path = Path(path)
+        data = content.encode("utf-8")
+        with self._lock:
+            if path in self._files:
+                raise ValidationException(f"'{path}' was already written to archive")
+            self._open()
+            self._add_directory(path.parent)
+            name = self._member_name(path)
+            if self._zip is not None:
+                info = zipfile.ZipInfo(name, time.localtime(self._mtime)[:6])
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.external_attr = 0o644 << 16
+                self._zip.writestr(info, data)
+            else:
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                info.mtime = self._mtime
+                info.mode = 0o644
+                self._tar.addfile(info, io.BytesIO(data))
+            self._files.add(path)
+
+    def directory_exists(self, path: Path) -> bool:
+        """Check if directory exists"""
+        return Path(path) in self._directories
+
+    def file_exists(self, path: Path) -> bool:
+        """Check if file exists"""
+        return Path(path) in self._files
+
+    def read_file(self, path: Path) -> str:
+        """Read file content"""
+        # Members are streamed out and not kept, so nothing can be read back
+        raise FileNotFoundError(str(path))
+
+    def list_files(self, path: Path, pattern: str = "*") -> list[Path]:
+        """List files in directory"""
+        path = Path(path)
+        return sorted(
+            entry
+            for entry in self._files | self._directories
+            if entry.parent == path and entry.match(pattern)
+        )
+
+    def commit(self) -> None:
+        """Finish the archive and move it into place"""
+        with self._lock:
+            if self._close():
+                os.replace(self._partial, self._archive_path)
+            self._files.clear()
+            self._directories.clear()
+
+    def rollback(self) -> None:
+        """Discard the partial archive"""
+        with self._lock:
+            self._close()
+            self._partial.unlink(missing_ok=True)
+            self._files.clear()
+            self._directories.clear()
+
+    def _open(self) -> None:
+        if self._zip is not None or self._tar is not None:
+            return
+
+        name = self._archive_path.name.lower()
+        if name.endswith(".zip"):
+            self._zip = zipfile.ZipFile(self._partial, "w")
+            return
+        mode = next(m for s, m in TAR_MODES.items() if name.endswith(s))
+        self._tar = tarfile.open(self._partial, mode)
+
+    def _close(self) -> bool:
+        """Close the archive, returning whether one was open"""
+        archive = self._zip or self._tar
+        if archive is None:
+            return False
+        archive.close()
+        self._zip = None
+        self._tar = None
+        return True
+
+    def _add_directory(self, path: Path) -> None:
+        if path in self._directories or not self._member_name(path):
+            return
+        self._add_directory(path.parent)
+
+        name = self._member_name(path) + "/"
+        if self._zip is not None:
+            info = zipfile.ZipInfo(name, time.localtime(self._mtime)[:6])
+            info.external_attr = (0o40755 << 16) | 0x10
+            self._zip.writestr(info, b"")
+        else:
+            info = tarfile.TarInfo(name)
+            info.type = tarfile.DIRTYPE
+            info.mtime = self._mtime
+            info.mode = 0o755
+            self._tar.addfile(info)
+        self._directories.add(path)
+
+    def _member_name(self, path: Path) -> str:
+        try:
+            relative = path.relative_to(self._root)
+        except ValueError:
+            relative = path.relative_to(path.anchor) if path.is_absolute() else path
+        name = PurePosixPath(*relative.parts).as_posix()
+        return "" if name == "." else name
@@ -0,0 +1,55 @@
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Held instead of flock where it is not available
+LOCK_FILE_NAME = ".fastclean.lock.lck"
+POLL_SECONDS = 0.05
+
+
+@contextmanager
+def directory_lock(directory: Path) -> Iterator[None]:
+    """Hold an exclusive lock on a directory, across processes and threads
+
+    Nothing is locked if the directory does not exist yet.
+    """
+    directory = Path(directory)
+    if not directory.is_dir():
+        yield
+        return
+
+    if fcntl is None:
+        with _lock_file(directory / LOCK_FILE_NAME):
+            yield
+        return
+
+    # flock on the directory itself leaves no file behind, and conflicts
+    # between any two opens, even within one process
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def _lock_file(path: Path) -> Iterator[None]:
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            time.sleep(POLL_SECONDS)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        path.unlink(missing_ok=True)
@@ -0,0 +1,116 @@
+import asyncio
+import copy
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import TypeVar
+
+from ...application.interfaces.async_file_system import IAsyncFileSystemService
+from ...application.interfaces.file_system import IFileSystemService
+from .local_file_system import LocalFileSystemService
+
+T = TypeVar("T")
+
+
+class ExecutorFileSystemService(IAsyncFileSystemService):
+    """Async file system running a synchronous one in a thread pool
+
+    Every call is made in one of ``max_workers`` threads, so the event loop
+    never blocks on disk. At most ``max_pending_writes`` writes are queued
+    or running at once: further writers wait, which bounds the memory held
+    by file contents when many writes are started together. Use it from one
+    event loop. Sessions share the threads and the write bound, so the bound
+    holds across every run given this file system.
+    """
+
+    DEFAULT_MAX_WORKERS = 4
+    DEFAULT_MAX_PENDING_WRITES = 32
+
+    def __init__(
+        self,
+        file_system: IFileSystemService | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_pending_writes: int = DEFAULT_MAX_PENDING_WRITES,
+    ):
+        self._file_system = file_system or LocalFileSystemService()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="fastclean-fs"
+        )
+        self._writes = asyncio.Semaphore(max_pending_writes)
+
+    @property
+    def file_system(self) -> IFileSystemService:
+        """The synchronous file system calls are made on"""
+        return self._file_system
+
+    async def __aenter__(self) -> "ExecutorFileSystemService":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the worker threads once pending calls are done"""
+        self._executor.shutdown(wait=False)
+
+    async def create_directory(self, path: Path) -> None:
+        """Create a directory"""
+        await self._write(self._file_system.create_directory, path)
+
+    async def create_directories(self, paths: Iterable[Path]) -> None:
+        """Create directories and their parents in one call"""
+        await self._write(self._file_system.create_directories, list(paths))
+
+    async def create_file(self, path: Path, content: str) -> None:
+        """Create a file with content"""
+        await self._write(self._file_system.create_file, path, content)
+
+    async def directory_exists(self, path: Path) -> bool:
+        """Check if directory exists"""
+        return await self._call(self._file_system.directory_exists, path)
+
+    async def file_exists(self, path: Path) -> bool:
+        """Check if file exists"""
+        return await self._call(self._file_system.file_exists, path)
+
+    async def read_file(self, path: Path) -> str:
+        """Read file content"""
+        return await self._call(self._file_system.read_file, path)
+
+    async def list_files(self, path: Path, pattern: str = "*") -> list[Path]:
+        """List files in directory"""
+        return await self._call(self._file_system.list_files, path, pattern)
+
+    def session(self) -> "ExecutorFileSystemService":
+        """A session of the wrapped file system, on the same threads and bound"""
+        session = copy.copy(self)
+        session._file_system = self._file_system.session()
+        return session
+
+    @asynccontextmanager
+    async def exclusive(self, path: Path) -> AsyncIterator[None]:
+        """Hold an exclusive lock on a directory, across processes"""
+        lock = self._file_system.exclusive(path)
+        # Waiting for the lock must not hold up the threads of other runs
+        await asyncio.to_thread(lock.__enter__)
+        try:
+            yield
+        finally:
+            await asyncio.to_thread(lock.__exit__, None, None, None)
+
+    async def commit(self) -> None:
+        """Make all writes since the last commit visible"""
+        await self._call(self._file_system.commit)
+
+    async def rollback(self) -> None:
+        """Discard all writes since the last commit"""
+        await self._call(self._file_system.rollback)
+
+    async def _write(self, function: Callable[..., T], *args) -> T:
+        async with self._writes:
+            return await self._call(function, *args)
+
+    async def _call(self, function: Callable[..., T], *args) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, function, *args)
@@ -0,0 +1,114 @@
+import json
+import threading
+from fnmatch import fnmatch
+from pathlib import Path
+
+from ...application.interfaces.file_system import IFileSystemService
+
+
+class InMemoryFileSystemService(IFileSystemService):
+    """File system kept entirely in memory
+
+    Used for ``--dry-run`` previews and fast tests. With ``read_through``,
+    paths that were not written are looked up on disk, so generating into
+    an existing project sees its files without ever modifying them.
+    """
+
+    def __init__(self, read_through: bool = False):
+        self._read_through = read_through
+        self._files: dict[Path, str] = {}
+        self._directories: set[Path] = set()
+        self._lock = threading.Lock()
+
+    def create_directory(self, path: Path) -> None:
+        """Create a directory"""
+        with self._lock:
+            self._add_directory(Path(path))
+
+    def create_file(self, path: Path, content: str) -> None:
+        """Create a file with content"""
+        path = Path(path)
+        with self._lock:
+            self._add_directory(path.parent)
+            self._files[path] = content
+
+    def directory_exists(self, path: Path) -> bool:
+        """Check if directory exists"""
+        path = Path(path)
+        if path in self._directories:
+            return True
+        return self._read_through and path.is_dir()
+
+    def file_exists(self, path: Path) -> bool:
+        """Check if file exists"""
+        path = Path(path)
+        if path in self._files:
+            return True
+        return self._read_through and path.is_file()
+
+    def read_file(self, path: Path) -> str:
+        """Read file content"""
+        path = Path(path)
+        if path in self._files:
+            return self._files[path]
+        if self._read_through:
+            return path.read_text(encoding="utf-8")
+        raise FileNotFoundError(str(path))
+
+    def list_files(self, path: Path, pattern: str = "*") -> list[Path]:
+        """List files in directory"""
+        path = Path(path)
+        found = set()
+        if self._read_through and path.is_dir():
+            found.update(path.glob(pattern))
+
+        name_pattern = pattern.rsplit("/", 1)[-1]
+        recursive = "**" in pattern
+        for entry in list(self._files) + list(self._directories):
+            if entry == path or not entry.is_relative_to(path):
+                continue
+            if (recursive or entry.parent == path) and fnmatch(
+                entry.name, name_pattern
+            ):
+                found.add(entry)
+        return sorted(found)
+
+    @property
+    def files(self) -> dict[Path, str]:
+        """Files written so far, by path"""
+        return dict(self._files)
+
+    def sizes(self) -> dict[Path, int]:
+        """Size in bytes of every written file"""
+        return {
+            path: len(content.encode("utf-8")) for path, content in self._files.items()
+        }
+
+    def export(self, file_system: IFileSystemService, root: Path | None = None) -> int:
+        """Write every file to another file system, returning the file count
+
+        Relative paths are placed under root when one is given.
+        """
+        for path, content in sorted(self._files.items()):
+            file_system.create_file(root / path if root else path, content)
+        file_system.commit()
+        return len(self._files)
+
+    def save_snapshot(self, path: Path) -> None:
+        """Save the written files as JSON, to export later"""
+        data = {str(file): content for file, content in sorted(self._files.items())}
+        Path(path).write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+    @classmethod
+    def load_snapshot(cls, path: Path) -> "InMemoryFileSystemService":
+        """Load files saved with save_snapshot"""
+        file_system = cls()
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        for file, content in data.items():
+            file_system.create_file(Path(file), content)
+        return file_system
+
+    def _add_directory(self, path: Path) -> None:
+        while path not in self._directories and path != path.parent:
+            self._directories.add(path)
+            path = path.parent
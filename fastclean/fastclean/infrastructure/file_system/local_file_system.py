@@ -1,19 +1,35 @@
+import os
 import shutil
+from collections.abc import Iterable
+from contextlib import AbstractContextManager
 from pathlib import Path
 
 from ...application.interfaces.file_system import IFileSystemService
+from .directory_lock import directory_lock
 
 
 class LocalFileSystemService(IFileSystemService):
     """Local file system implementation"""
 
+    def __init__(self):
+        # Directories known to exist, so files are written without a mkdir
+        self._directories: set[Path] = set()
+
     def create_directory(self, path: Path) -> None:
         """Create a directory"""
         path.mkdir(parents=True, exist_ok=True)
+        self._directories.add(path)
+
+    def create_directories(self, paths: Iterable[Path]) -> None:
+        """Create directories and their parents, one mkdir per new directory"""
+        for path in paths:
+            self._make_directory(path)
 
     def create_file(self, path: Path, content: str) -> None:
         """Create a file with content"""
-        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.parent not in self._directories:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._directories.add(path.parent)
         path.write_text(content, encoding="utf-8")
 
     def directory_exists(self, path: Path) -> bool:
@@ -34,6 +50,27 @@ class LocalFileSystemService(IFileSystemService):
             return []
         return list(path.glob(pattern))
 
+    def exclusive(self, path: Path) -> AbstractContextManager:
+        """Hold an exclusive lock on a directory, across processes"""
+        return directory_lock(path)
+
+    def _make_directory(self, path: Path) -> None:
+        if path in self._directories:
+            return
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            self._make_directory(path.parent)
+            os.makedirs(path, exist_ok=True)
+
+        # Its parents exist as well
+        for directory in (path, *path.parents):
+            if directory in self._directories:
+                break
+            self._directories.add(directory)
+
     def copy_file(self, source: Path, destination: Path) -> None:
         """Copy file from source to destination"""
         destination.parent.mkdir(parents=True, exist_ok=True)
@@ -43,3 +80,6 @@ class LocalFileSystemService(IFileSystemService):
         """Delete directory and its contents"""
         if self.directory_exists(path):
             shutil.rmtree(path)
+            self._directories = {
+                d for d in self._directories if not d.is_relative_to(path)
+            }
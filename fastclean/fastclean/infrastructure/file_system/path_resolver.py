@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 import fastclean
@@ -15,3 +16,16 @@ class PathResolver:
     def get_templates_dir() -> Path:
         """Get the templates directory"""
         return PathResolver.get_package_root() / "templates"
+
+    @staticmethod
+    def get_compiled_templates_dir() -> Path:
+        """Get the directory of templates precompiled at build time"""
+        return PathResolver.get_package_root() / "compiled_templates"
+
+    @staticmethod
+    def get_cache_dir() -> Path:
+        """Get the per-user cache directory (~/.cache/fastclean by default)"""
+        if os.environ.get("FASTCLEAN_CACHE_DIR"):
+            return Path(os.environ["FASTCLEAN_CACHE_DIR"])
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        return Path(base) / "fastclean"
@@ -0,0 +1,59 @@
+from collections.abc import Iterable
+from contextlib import AbstractContextManager
+from pathlib import Path
+
+from ...application.generation.profiler import Profiler
+from ...application.interfaces.file_system import IFileSystemService
+
+
+class ProfilingFileSystemService(IFileSystemService):
+    """File system wrapper reporting written bytes to a profiler"""
+
+    def __init__(self, file_system: IFileSystemService, profiler: Profiler):
+        self._file_system = file_system
+        self._profiler = profiler
+
+    def create_directory(self, path: Path) -> None:
+        """Create a directory"""
+        self._file_system.create_directory(path)
+
+    def create_directories(self, paths: Iterable[Path]) -> None:
+        """Create directories and their parents"""
+        self._file_system.create_directories(paths)
+
+    def create_file(self, path: Path, content: str) -> None:
+        """Create a file with content"""
+        self._file_system.create_file(path, content)
+        self._profiler.record_write(len(content.encode("utf-8")))
+
+    def directory_exists(self, path: Path) -> bool:
+        """Check if directory exists"""
+        return self._file_system.directory_exists(path)
+
+    def file_exists(self, path: Path) -> bool:
+        """Check if file exists"""
+        return self._file_system.file_exists(path)
+
+    def read_file(self, path: Path) -> str:
+        """Read file content"""
+        return self._file_system.read_file(path)
+
+    def list_files(self, path: Path, pattern: str = "*") -> list[Path]:
+        """List files in directory"""
+        return self._file_system.list_files(path, pattern)
+
+    def session(self) -> "ProfilingFileSystemService":
+        """A session of the wrapped file system, reporting to the same profiler"""
+        return ProfilingFileSystemService(self._file_system.session(), self._profiler)
+
+    def commit(self) -> None:
+        """Commit the wrapped file system"""
+        self._file_system.commit()
+
+    def rollback(self) -> None:
+        """Roll back the wrapped file system"""
+        self._file_system.rollback()
+
+    def exclusive(self, path: Path) -> AbstractContextManager:
+        """Lock through the wrapped file system"""
+        return self._file_system.exclusive(path)
@@ -0,0 +1,217 @@
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from contextlib import AbstractContextManager
+from fnmatch import fnmatch
+from pathlib import Path
+
+from ...application.interfaces.file_system import IFileSystemService
+from .directory_lock import directory_lock
+
+STAGING_PREFIX = ".fastclean-staging-"
+
+
+class TransactionalFileSystemService(IFileSystemService):
+    """File system that stages writes and publishes them on commit
+
+    Output is staged next to its destination, so every commit step is a
+    rename on the same filesystem:
+
+    - a directory tree that does not exist yet (e.g. a new project) is built
+      in a staging directory beside it and moved into place with one rename
+    - a file in an existing directory is written to a hidden sibling and
+      replaces the target on commit
+
+    Staging directories are created once each, and files are fsynced only at
+    commit. If publishing fails halfway, the renames already done are undone,
+    so a commit is all or nothing. Nothing touches the destination before
+    ``commit()``; ``rollback()`` removes everything staged.
+    """
+
+    def __init__(self, durable: bool = True):
+        self._durable = durable
+        self._lock = threading.RLock()
+        # missing top-level directory -> staging root holding its tree
+        self._trees: dict[Path, Path] = {}
+        # target file in an existing directory -> hidden sibling
+        self._replacements: dict[Path, Path] = {}
+        # target file -> staged location
+        self._files: dict[Path, Path] = {}
+        self._directories: set[Path] = set()
+        self._made: set[Path] = set()
+        # Destination directories already checked, so each is stat'ed once
+        self._existing: dict[Path, bool] = {}
+
+    def create_directory(self, path: Path) -> None:
+        """Create a directory"""
+        path = Path(path)
+        if self._is_dir(path):
+            return
+        with self._lock:
+            self._make_dirs(self._tree_location(path))
+            self._directories.add(path)
+
+    def create_file(self, path: Path, content: str) -> None:
+        """Create a file with content"""
+        path = Path(path)
+        with self._lock:
+            staged = self._files.get(path) or self._stage(path)
+            self._files[path] = staged
+        staged.write_text(content, encoding="utf-8")
+
+    def directory_exists(self, path: Path) -> bool:
+        """Check if directory exists"""
+        path = Path(path)
+        with self._lock:
+            if path in self._directories or self._is_dir(path):
+                return True
+            return any(staged.parent.is_relative_to(path) for staged in self._files)
+
+    def file_exists(self, path: Path) -> bool:
+        """Check if file exists"""
+        path = Path(path)
+        return path in self._files or path.is_file()
+
+    def read_file(self, path: Path) -> str:
+        """Read file content"""
+        path = Path(path)
+        return self._files.get(path, path).read_text(encoding="utf-8")
+
+    def list_files(self, path: Path, pattern: str = "*") -> list[Path]:
+        """List files in directory"""
+        path = Path(path)
+        found = set(path.glob(pattern)) if path.is_dir() else set()
+
+        name_pattern = pattern.rsplit("/", 1)[-1]
+        recursive = "**" in pattern
+        with self._lock:
+            pending = list(self._files) + list(self._directories)
+        for staged in pending:
+            if not staged.is_relative_to(path) or staged == path:
+                continue
+            if (recursive or staged.parent == path) and fnmatch(
+                staged.name, name_pattern
+            ):
+                found.add(staged)
+        return sorted(found)
+
+    def exclusive(self, path: Path) -> AbstractContextManager:
+        """Hold an exclusive lock on a directory, across processes"""
+        return directory_lock(path)
+
+    def session(self) -> "TransactionalFileSystemService":
+        """A separate transaction, so concurrent runs never publish each other"""
+        return TransactionalFileSystemService(self._durable)
+
+    def commit(self) -> None:
+        """Publish all staged writes"""
+        with self._lock:
+            if self._durable:
+                self._sync_files()
+
+            published: list[tuple[Path, Path, Path | None]] = []
+            try:
+                for target, staging in self._trees.items():
+                    os.rename(staging / target.name, target)
+                    published.append((staging / target.name, target, None))
+                for target, staged in self._replacements.items():
+                    backup = None
+                    if target.exists():
+                        backup = staged.with_name(staged.name + ".bak")
+                        os.replace(target, backup)
+                    os.replace(staged, target)
+                    published.append((staged, target, backup))
+            except BaseException:
+                self._unpublish(published)
+                self.rollback()
+                raise
+
+            for _, _, backup in published:
+                if backup is not None:
+                    backup.unlink()
+            if self._durable:
+                self._sync_directories(target for _, target, _ in published)
+            self._cleanup()
+
+    def rollback(self) -> None:
+        """Discard all staged writes"""
+        with self._lock:
+            for staged in self._replacements.values():
+                staged.unlink(missing_ok=True)
+            self._cleanup()
+
+    def _stage(self, path: Path) -> Path:
+        """Pick the staged location of a new target file"""
+        if self._is_dir(path.parent):
+            staged = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+            self._replacements[path] = staged
+            return staged
+
+        staged = self._tree_location(path)
+        self._make_dirs(staged.parent)
+        return staged
+
+    def _tree_location(self, path: Path) -> Path:
+        """Where a path below a missing directory lives while staged"""
+        top = path
+        while not self._is_dir(top.parent):
+            top = top.parent
+
+        staging = self._trees.get(top)
+        if staging is None:
+            staging = Path(tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=top.parent))
+            self._trees[top] = staging
+            self._made.add(staging)
+        return staging / path.relative_to(top.parent)
+
+    def _is_dir(self, path: Path) -> bool:
+        """Whether a destination directory exists, checked once"""
+        with self._lock:
+            exists = self._existing.get(path)
+            if exists is None:
+                exists = self._existing[path] = path.is_dir()
+            return exists
+
+    def _make_dirs(self, path: Path) -> None:
+        """Create a staging directory, once"""
+        if path not in self._made:
+            path.mkdir(parents=True, exist_ok=True)
+            self._made.add(path)
+
+    def _sync_files(self) -> None:
+        for staged in self._files.values():
+            fd = os.open(staged, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    @staticmethod
+    def _sync_directories(targets) -> None:
+        if os.name != "posix":
+            return
+        for directory in {target.parent for target in targets}:
+            fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    @staticmethod
+    def _unpublish(published: list[tuple[Path, Path, Path | None]]) -> None:
+        for staged, target, backup in reversed(published):
+            os.replace(target, staged)
+            if backup is not None:
+                os.replace(backup, target)
+
+    def _cleanup(self) -> None:
+        for staging in self._trees.values():
+            shutil.rmtree(staging, ignore_errors=True)
+        self._trees.clear()
+        self._replacements.clear()
+        self._files.clear()
+        self._directories.clear()
+        self._made.clear()
+        self._existing.clear()
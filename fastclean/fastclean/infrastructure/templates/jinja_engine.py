@@ -1,11 +1,20 @@
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import BaseLoader, Environment, FileSystemLoader
 
 from fastclean.application.interfaces.template_engine import ITemplateEngine
 from fastclean.core.entities.template import Template
 from fastclean.core.exceptions.validation import TemplateNotFoundException
 from fastclean.infrastructure.file_system.path_resolver import PathResolver
+from fastclean.infrastructure.templates.precompile import (
+    PrecompiledTemplates,
+    content_hash,
+)
+from fastclean.infrastructure.templates.template_index import TemplateIndex
+from fastclean.infrastructure.templates.template_loader import (
+    CacheStats,
+    TemplateCache,
+)
 
 
 class JinjaTemplateEngine(ITemplateEngine):
@@ -36,83 +45,124 @@ class JinjaTemplateEngine(ITemplateEngine):
         "storage_client": "src/infrastructure/external_services/storage.py",
     }
 
-    def __init__(self, templates_dir: Path = None):
+    def __init__(
+        self,
+        templates_dir: Path = None,
+        cache_size: int = TemplateCache.DEFAULT_MAX_SIZE,
+        compiled_dir: Path = None,
+    ):
         self._templates_dir = templates_dir or PathResolver.get_templates_dir()
-        self._env = Environment(
-            loader=FileSystemLoader(str(self._templates_dir)),
+        # Loaded templates are invalidated by source mtime, compiled ones by
+        # content hash, so edits during template development are picked up.
+        self._template_cache = TemplateCache(cache_size)
+        self._compiled_cache = TemplateCache(cache_size)
+        self.refresh_index()
+        self._env = self.create_environment(FileSystemLoader(str(self._templates_dir)))
+
+        # Templates compiled at build time are imported instead of compiled
+        self._precompiled = PrecompiledTemplates.load(
+            compiled_dir or PathResolver.get_compiled_templates_dir()
+        )
+        self._compiled_env = (
+            self.create_environment(self._precompiled.loader())
+            if self._precompiled
+            else None
+        )
+
+    @classmethod
+    def create_environment(cls, loader: BaseLoader) -> Environment:
+        """Create a Jinja environment with the engine's options and filters"""
+        env = Environment(
+            loader=loader,
             trim_blocks=True,
             lstrip_blocks=True,
             keep_trailing_newline=True,
         )
 
-        self._env.filters["snake_case"] = self._to_snake_case
-        self._env.filters["camel_case"] = self._to_camel_case
-        self._env.filters["pascal_case"] = self._to_pascal_case
+        env.filters["snake_case"] = cls._to_snake_case
+        env.filters["camel_case"] = cls._to_camel_case
+        env.filters["pascal_case"] = cls._to_pascal_case
+        return env
 
     def render(self, template: Template, context: dict) -> str:
-        jinja_template = self._env.from_string(template.content)
+        source_hash = content_hash(template.content)
+        key = TemplateCache.make_key(template.name, template.category, source_hash)
+
+        jinja_template = self._compiled_cache.get(key)
+        if jinja_template is None:
+            jinja_template = self._compile(template, source_hash)
+            self._compiled_cache.set(key, jinja_template)
+
         return jinja_template.render(**context)
 
     def load_template(self, template_name: str, category: str) -> Template:
-        possible_names = [
-            f"{template_name}.py.j2",
-            f"{template_name}.j2",
-            f"{template_name}.yml.j2",
-            f"{template_name}.md.j2",
-            f"{template_name}.txt.j2",
-        ]
-
-        template_path = None
-        for name in possible_names:
-            path = self._templates_dir / category / name
-            if path.exists():
-                template_path = path
-                break
+        entry = self._index.get(template_name, category)
 
         # اگر فایل پیدا نشد، خطا ندهیم (چون برخی فیچرها اختیاری هستند)
-        if not template_path:
+        if entry is None:
             # اینجا می‌توانیم لاگ کنیم یا Exception خاصی برای هندل کردن بدهیم
             # فعلاً برای جلوگیری از کرش در صورت نبود فایل آپشنال:
             if category in ["infrastructure", "domain"]:  # فایل‌های حیاتی
                 raise TemplateNotFoundException(f"{category}/{template_name}")
             return None  # برای فایل‌های غیر حیاتی
 
-        content = template_path.read_text(encoding="utf-8")
-        variables = self._extract_variables(content)
+        template_path = self._index.path_for(entry)
+        key = TemplateCache.make_key(template_name, category)
+        mtime = template_path.stat().st_mtime
+        template = self._template_cache.get(key, mtime=mtime)
+        if template is not None:
+            return template
 
-        return Template(
+        template = Template(
             name=template_name,
-            content=content,
-            variables=variables,
+            content=template_path.read_text(encoding="utf-8"),
+            variables=dict.fromkeys(entry.variables, ""),
             category=category,
-            output_path=self._determine_output_path(template_name, category),
+            output_path=Path(entry.output_path),
         )
+        self._template_cache.set(key, template, mtime=mtime)
+        return template
 
-    def list_templates(self, category: str) -> list:
-        category_path = self._templates_dir / category
-        if not category_path.exists():
-            return []
+    def refresh_index(self) -> None:
+        """Pick up templates added or removed since the index was loaded"""
+        self._index = TemplateIndex.for_directory(
+            self._templates_dir, self.PATH_MAPPINGS
+        )
 
-        templates = []
-        for template_file in category_path.glob("*.j2"):
-            template_name = template_file.name.split(".")[0]
-            if template_name not in templates:
-                templates.append(template_name)
-        return templates
+    def list_templates(self, category: str) -> list:
+        return self._index.names(category)
+
+    def cache_stats(self) -> dict[str, CacheStats]:
+        """Hit/miss counters of the loaded and compiled template caches"""
+        return {
+            "templates": self._template_cache.stats,
+            "compiled": self._compiled_cache.stats,
+        }
+
+    def clear_cache(self) -> None:
+        """Drop all loaded and compiled templates"""
+        self._template_cache.clear()
+        self._compiled_cache.clear()
+
+    def _compile(self, template: Template, source_hash: str):
+        """Get a compiled template, preferring the build-time module"""
+        entry = self._index.get(template.name, template.category)
+        if entry is not None and self._precompiled is not None:
+            source_name = f"{entry.category}/{entry.filename}"
+            if self._precompiled.is_current(source_name, source_hash):
+                return self._compiled_env.get_template(source_name)
+
+        # Sources edited since the build (template development) are compiled
+        return self._env.from_string(template.content)
 
     def _determine_output_path(self, template_name: str, category: str) -> Path:
+        entry = self._index.get(template_name, category)
+        if entry is not None:
+            return Path(entry.output_path)
         if template_name in self.PATH_MAPPINGS:
             return Path(self.PATH_MAPPINGS[template_name])
         return Path(template_name.replace("_", "/"))
 
-    @staticmethod
-    def _extract_variables(content: str) -> dict:
-        import re
-
-        pattern = r"\{\{\s*(\w+)\s*\}\}"
-        variables = re.findall(pattern, content)
-        return dict.fromkeys(set(variables), "")
-
     @staticmethod
     def _to_snake_case(text: str) -> str:
         import re
@@ -0,0 +1,101 @@
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from jinja2 import Environment, ModuleLoader
+
+from fastclean.infrastructure.templates.template_index import TEMPLATE_SUFFIX
+
+
+def content_hash(content: str) -> str:
+    """Hash used to match template sources against their compiled modules"""
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+class PrecompiledTemplates:
+    """Templates compiled to Python modules at build time
+
+    ``manifest.json`` records the source hash each module was compiled from,
+    so a template edited after the build is never served from its stale
+    module.
+    """
+
+    MANIFEST_NAME = "manifest.json"
+
+    def __init__(self, compiled_dir: Path, hashes: dict[str, str]):
+        self._compiled_dir = compiled_dir
+        self._hashes = hashes
+
+    @classmethod
+    def load(cls, compiled_dir: Path) -> "PrecompiledTemplates | None":
+        """Load precompiled templates, or None if there are none"""
+        try:
+            text = (compiled_dir / cls.MANIFEST_NAME).read_text(encoding="utf-8")
+            hashes = json.loads(text)
+        except (OSError, ValueError):
+            return None
+        return cls(compiled_dir, hashes)
+
+    def is_current(self, source_name: str, source_hash: str) -> bool:
+        """Check the module for a template was compiled from this source"""
+        return self._hashes.get(source_name) == source_hash
+
+    def loader(self) -> ModuleLoader:
+        """Jinja loader importing the compiled modules"""
+        return ModuleLoader(str(self._compiled_dir))
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+
+def precompile_templates(
+    templates_dir: Path, target_dir: Path, environment: Environment
+) -> int:
+    """Compile every template in templates_dir into target_dir"""
+    target_dir.mkdir(parents=True, exist_ok=True)
+    for stale in target_dir.glob("tmpl_*.py"):
+        stale.unlink()
+
+    names = environment.list_templates(
+        filter_func=lambda name: name.endswith(TEMPLATE_SUFFIX)
+    )
+    environment.compile_templates(
+        str(target_dir),
+        filter_func=lambda name: name.endswith(TEMPLATE_SUFFIX),
+        zip=None,
+        ignore_errors=False,
+    )
+
+    hashes = {
+        name: content_hash((templates_dir / name).read_text(encoding="utf-8"))
+        for name in names
+    }
+    manifest = target_dir / PrecompiledTemplates.MANIFEST_NAME
+    manifest.write_text(json.dumps(hashes, indent=2) + "\n", encoding="utf-8")
+    return len(hashes)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Precompile templates: python -m ...precompile [TEMPLATES_DIR [TARGET]]"""
+    from jinja2 import FileSystemLoader
+
+    from fastclean.infrastructure.file_system.path_resolver import PathResolver
+    from fastclean.infrastructure.templates.jinja_engine import JinjaTemplateEngine
+
+    argv = sys.argv[1:] if argv is None else argv
+    templates_dir = Path(argv[0]) if argv else PathResolver.get_templates_dir()
+    target_dir = (
+        Path(argv[1]) if len(argv) > 1 else PathResolver.get_compiled_templates_dir()
+    )
+
+    environment = JinjaTemplateEngine.create_environment(
+        FileSystemLoader(str(templates_dir))
+    )
+    count = precompile_templates(templates_dir, target_dir, environment)
+    print(f"Compiled {count} templates -> {target_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
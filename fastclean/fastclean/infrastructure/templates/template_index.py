@@ -0,0 +1,221 @@
+import hashlib
+import json
+import os
+import re
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+TEMPLATE_SUFFIX = ".j2"
+
+
+@dataclass(frozen=True)
+class TemplateIndexEntry:
+    """Indexed template file"""
+
+    category: str
+    name: str
+    filename: str
+    output_path: str
+    variables: list[str] = field(default_factory=list)
+
+
+class TemplateIndex:
+    """Index of all templates, mapping (category, name) to its file
+
+    The index is built once per process with one directory scan, or loaded
+    from the ``index.json`` manifest written by ``build_templates.py``. The
+    manifest is used as long as the template file names on disk still match
+    it, so adding or removing a template during development never serves a
+    stale index. The process-wide index of a directory is also dropped
+    once the directory or one of its categories changes, so a long-running
+    process such as ``fastclean serve`` sees templates added or removed.
+    """
+
+    MANIFEST_NAME = "index.json"
+    MANIFEST_VERSION = 1
+
+    # Index per (directory, mappings), with the directory mtimes it was built at
+    _instances: dict[tuple[Path, str], tuple[tuple, "TemplateIndex"]] = {}
+
+    def __init__(
+        self,
+        templates_dir: Path,
+        entries: list[TemplateIndexEntry],
+        mappings_hash: str = "",
+    ):
+        self._templates_dir = templates_dir
+        self._mappings_hash = mappings_hash
+        self._entries: dict[tuple[str, str], TemplateIndexEntry] = {}
+        self._categories: dict[str, list[str]] = {}
+        for entry in sorted(entries, key=lambda e: (e.category, e.filename)):
+            key = (entry.category, entry.name)
+            if key in self._entries:
+                continue
+            self._entries[key] = entry
+            self._categories.setdefault(entry.category, []).append(entry.name)
+
+    @classmethod
+    def for_directory(
+        cls, templates_dir: Path, path_mappings: dict[str, str]
+    ) -> "TemplateIndex":
+        """Get the process-wide index for a templates directory"""
+        mappings_hash = cls._hash_mappings(path_mappings)
+        key = (Path(templates_dir), mappings_hash)
+        # Stamped before loading, so a change made meanwhile is seen next time
+        stamp = cls._stamp(Path(templates_dir))
+        cached = cls._instances.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        index = cls.load(Path(templates_dir), path_mappings)
+        cls._instances[key] = (stamp, index)
+        return index
+
+    @classmethod
+    def load(
+        cls, templates_dir: Path, path_mappings: dict[str, str]
+    ) -> "TemplateIndex":
+        """Load the prebuilt manifest if it is current, otherwise build"""
+        mappings_hash = cls._hash_mappings(path_mappings)
+        listing = cls._scan(templates_dir)
+
+        manifest = cls._read_manifest(templates_dir)
+        if (
+            manifest is not None
+            and manifest.get("version") == cls.MANIFEST_VERSION
+            and manifest.get("mappings_hash") == mappings_hash
+        ):
+            entries = [TemplateIndexEntry(**item) for item in manifest["templates"]]
+            indexed = {(e.category, e.filename) for e in entries}
+            if indexed == set(listing):
+                return cls(templates_dir, entries, mappings_hash)
+
+        return cls.build(templates_dir, path_mappings, listing)
+
+    @classmethod
+    def build(
+        cls,
+        templates_dir: Path,
+        path_mappings: dict[str, str],
+        listing: list[tuple[str, str]] | None = None,
+    ) -> "TemplateIndex":
+        """Build the index by scanning the templates directory"""
+        if listing is None:
+            listing = cls._scan(templates_dir)
+
+        entries = []
+        for category, filename in listing:
+            name = filename.split(".")[0]
+            content = (templates_dir / category / filename).read_text(encoding="utf-8")
+            entries.append(
+                TemplateIndexEntry(
+                    category=category,
+                    name=name,
+                    filename=filename,
+                    output_path=path_mappings.get(name, name.replace("_", "/")),
+                    variables=extract_variables(content),
+                )
+            )
+        return cls(templates_dir, entries, cls._hash_mappings(path_mappings))
+
+    def get(self, template_name: str, category: str) -> TemplateIndexEntry | None:
+        """Get the entry for a template"""
+        return self._entries.get((category, template_name))
+
+    def names(self, category: str) -> list[str]:
+        """List template names in a category"""
+        return list(self._categories.get(category, []))
+
+    def path_for(self, entry: TemplateIndexEntry) -> Path:
+        """Absolute path of an indexed template"""
+        return self._templates_dir / entry.category / entry.filename
+
+    @property
+    def categories(self) -> list[str]:
+        """All indexed categories"""
+        return list(self._categories)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def to_dict(self) -> dict:
+        """Serialize to the manifest format"""
+        return {
+            "version": self.MANIFEST_VERSION,
+            "mappings_hash": self._mappings_hash,
+            "templates": [asdict(entry) for entry in self._entries.values()],
+        }
+
+    def write_manifest(self) -> Path:
+        """Write the manifest next to the templates"""
+        path = self._templates_dir / self.MANIFEST_NAME
+        path.write_text(json.dumps(self.to_dict(), indent=2) + "\n", encoding="utf-8")
+        return path
+
+    @staticmethod
+    def _scan(templates_dir: Path) -> list[tuple[str, str]]:
+        """List (category, filename) pairs with one scandir per directory"""
+        listing = []
+        if not templates_dir.is_dir():
+            return listing
+
+        with os.scandir(templates_dir) as categories:
+            for category in categories:
+                if category.name.startswith((".", "_")) or not category.is_dir():
+                    continue
+                with os.scandir(category.path) as files:
+                    listing.extend(
+                        (category.name, f.name)
+                        for f in files
+                        if f.name.endswith(TEMPLATE_SUFFIX)
+                    )
+        return sorted(listing)
+
+    @staticmethod
+    def _stamp(templates_dir: Path) -> tuple:
+        """Directory and category mtimes, which change as templates come and go"""
+        try:
+            with os.scandir(templates_dir) as categories:
+                mtimes = sorted(
+                    (category.name, category.stat().st_mtime_ns)
+                    for category in categories
+                    if category.is_dir()
+                )
+            return (templates_dir.stat().st_mtime_ns, *mtimes)
+        except OSError:
+            return ()
+
+    @classmethod
+    def _read_manifest(cls, templates_dir: Path) -> dict | None:
+        try:
+            text = (templates_dir / cls.MANIFEST_NAME).read_text(encoding="utf-8")
+            return json.loads(text)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _hash_mappings(path_mappings: dict[str, str]) -> str:
+        payload = json.dumps(path_mappings, sort_keys=True).encode("utf-8")
+        return hashlib.sha1(payload).hexdigest()
+
+
+def extract_variables(content: str) -> list[str]:
+    """Extract plain ``{{ variable }}`` names from template content"""
+    return sorted(set(re.findall(r"\{\{\s*(\w+)\s*\}\}", content)))
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Write the template manifest: python -m ...template_index [DIR]"""
+    from fastclean.infrastructure.file_system.path_resolver import PathResolver
+    from fastclean.infrastructure.templates.jinja_engine import JinjaTemplateEngine
+
+    argv = sys.argv[1:] if argv is None else argv
+    templates_dir = Path(argv[0]) if argv else PathResolver.get_templates_dir()
+    index = TemplateIndex.build(templates_dir, JinjaTemplateEngine.PATH_MAPPINGS)
+    path = index.write_manifest()
+    print(f"Indexed {len(index)} templates -> {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
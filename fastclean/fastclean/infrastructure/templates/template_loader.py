@@ -1,29 +1,95 @@
-from ...core.entities.template import Template
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a template cache"""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0
+    max_size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
 
 
 class TemplateCache:
-    """Cache for loaded templates"""
+    """LRU cache for loaded and compiled templates
+
+    Entries can carry the source file's mtime; a lookup with a different
+    mtime drops the stale entry and counts as a miss. Safe to share between
+    rendering threads.
+    """
 
-    def __init__(self):
-        self._cache: dict[str, Template] = {}
+    DEFAULT_MAX_SIZE = 256
 
-    def get(self, key: str) -> Template | None:
-        """Get template from cache"""
-        return self._cache.get(key)
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        self._cache: OrderedDict[str, tuple[Any, float | None]] = OrderedDict()
+        self._max_size = max_size
+        self._stats = CacheStats(max_size=max_size)
+        self._lock = threading.Lock()
 
-    def set(self, key: str, template: Template) -> None:
-        """Set template in cache"""
-        self._cache[key] = template
+    def get(self, key: str, mtime: float | None = None) -> Any | None:
+        """Get entry from cache, or None on a miss"""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+
+            value, cached_mtime = entry
+            if mtime is not None and cached_mtime != mtime:
+                del self._cache[key]
+                self._stats.invalidations += 1
+                self._stats.misses += 1
+                return None
+
+            self._cache.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, mtime: float | None = None) -> None:
+        """Set entry in cache, evicting the least recently used one if full"""
+        with self._lock:
+            self._cache[key] = (value, mtime)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+                self._stats.evictions += 1
 
     def clear(self) -> None:
         """Clear cache"""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
 
     def has(self, key: str) -> bool:
         """Check if template is in cache"""
         return key in self._cache
 
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters"""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                invalidations=self._stats.invalidations,
+                size=len(self._cache),
+                max_size=self._max_size,
+            )
+
     @staticmethod
-    def make_key(template_name: str, category: str) -> str:
+    def make_key(template_name: str, category: str, content_hash: str = "") -> str:
         """Make cache key"""
-        return f"{category}:{template_name}"
+        key = f"{category}:{template_name}"
+        return f"{key}:{content_hash}" if content_hash else key
@@ -1,14 +1,34 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any, TypeVar
 
+from ...application.generation.events import GenerationEvent, drain
+from ...infrastructure.file_system.in_memory_file_system import (
+    InMemoryFileSystemService,
+)
 from ..formatters.console_formatter import ConsoleFormatter
+from ..formatters.file_tree import FileTreeFormatter
+from ..formatters.progress_bar import ProgressBar
+
+T = TypeVar("T")
 
 
 class BaseCommand(ABC):
     """Base class for CLI commands"""
 
-    def __init__(self, formatter: ConsoleFormatter = None):
+    def __init__(
+        self,
+        formatter: ConsoleFormatter = None,
+        preview: InMemoryFileSystemService | None = None,
+    ):
         self._formatter = formatter or ConsoleFormatter()
+        # Set for --dry-run: files are rendered here instead of to disk
+        self._preview = preview
+
+    @property
+    def dry_run(self) -> bool:
+        return self._preview is not None
 
     @abstractmethod
     def execute(self, args: dict[str, Any]) -> int:
@@ -29,3 +49,51 @@ class BaseCommand(ABC):
     def print_warning(self, message: str) -> None:
         """Print warning message"""
         self._formatter.warning(message)
+
+    def progress(self, message: str) -> ProgressBar:
+        """Progress indicator, animated only on interactive output"""
+        return ProgressBar(
+            message, enabled=self._formatter.interactive, formatter=self._formatter
+        )
+
+    def run_with_progress(
+        self, message: str, events: Generator[GenerationEvent, None, T]
+    ) -> T:
+        """Consume a generation event stream, showing files done out of total"""
+        with self.progress(message) as progress:
+            done = 0
+
+            def on_event(event: GenerationEvent) -> None:
+                nonlocal done
+                if event.done:
+                    done += 1
+                    progress.update(done, event.total, event.bytes_written)
+
+            response = drain(events, on_event)
+            progress.complete()
+        return response
+
+    def print_plan(self, planned: list) -> None:
+        """Print the files a command would generate, in write order"""
+        self.print_info(f"\n📋 Generation plan, {len(planned)} files:\n")
+        for job in planned:
+            after = f"  (after {', '.join(job.depends_on)})" if job.depends_on else ""
+            self.print_info(f"   {job.job.qualified_name:<32} → {job.path}{after}")
+
+    def print_preview(self, root: Path, snapshot: str | None = None) -> None:
+        """Print the files a dry run would have written"""
+        sizes = {}
+        for path, size in self._preview.sizes().items():
+            try:
+                path = path.relative_to(root)
+            except ValueError:
+                pass
+            sizes[path] = size
+
+        self.print_info("\n🔍 Dry run, nothing was written:\n")
+        for line in FileTreeFormatter().format(sizes):
+            self.print_info(line)
+
+        if snapshot:
+            self._preview.save_snapshot(Path(snapshot))
+            self.print_info(f"💾 Snapshot saved to: {snapshot}")
@@ -0,0 +1,32 @@
+from typing import Any
+
+from ...infrastructure.cache.disk_render_cache import DiskRenderCache
+from ..formatters.file_tree import FileTreeFormatter
+from .base import BaseCommand
+
+
+class CacheCommand(BaseCommand):
+    """Inspect or clear the render cache"""
+
+    def __init__(self, render_cache: DiskRenderCache, **kwargs):
+        super().__init__(**kwargs)
+        self._render_cache = render_cache
+
+    def execute(self, args: dict[str, Any]) -> int:
+        """Execute cache command"""
+        if args["action"] == "clear":
+            removed = self._render_cache.clear()
+            self.print_success(
+                f"🧹 Removed {removed.entries} cached renders "
+                f"({FileTreeFormatter.format_size(removed.size_bytes)})"
+            )
+            return 0
+
+        stats = self._render_cache.stats()
+        self.print_info(f"📦 Render cache: {stats.directory}")
+        self.print_info(f"   Entries: {stats.entries}")
+        self.print_info(
+            f"   Size:    {FileTreeFormatter.format_size(stats.size_bytes)}"
+            f" of {FileTreeFormatter.format_size(stats.max_bytes)}"
+        )
+        return 0
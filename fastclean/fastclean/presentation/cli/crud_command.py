@@ -2,25 +2,45 @@ from pathlib import Path
 from typing import Any
 
 from ...application.use_cases.generate_crud.dto import (
+    KEYSET,
     FieldDefinition,
+    GenerateCRUDBatchRequest,
+    GenerateCRUDBatchResponse,
     GenerateCRUDRequest,
     GenerateCRUDResponse,
 )
 from ...application.use_cases.generate_crud.generate_crud import GenerateCRUDUseCase
+from ...application.use_cases.generate_crud.generate_crud_batch import (
+    GenerateCRUDBatchUseCase,
+)
 from ...core.exceptions.base import DomainException
-from ..formatters.progress_bar import ProgressBar
+from ..parsers.database_schema import DatabaseSchemaParser
+from ..parsers.entity_manifest import EntityManifestParser, parse_fields
+from ..parsers.openapi_spec import OpenAPISchemaParser
 from .base import BaseCommand
 
+# Arguments naming a source of many entities: a manifest, database or spec
+BATCH_SOURCES = ("manifest", "database", "openapi")
+
 
 class CRUDCommand(BaseCommand):
     """Generate CRUD operations for an entity"""
 
-    def __init__(self, generate_crud_usecase: GenerateCRUDUseCase, **kwargs):
+    def __init__(
+        self,
+        generate_crud_usecase: GenerateCRUDUseCase,
+        generate_crud_batch_usecase: GenerateCRUDBatchUseCase | None = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self._generate_crud = generate_crud_usecase
+        self._generate_crud_batch = generate_crud_batch_usecase
 
     def execute(self, args: dict[str, Any]) -> int:
         """Execute CRUD generation"""
+        if any(args.get(source) for source in BATCH_SOURCES):
+            return self._execute_batch(args)
+
         try:
             self.print_info(f"🔧 Generating CRUD for: {args['entity']}")
 
@@ -33,14 +53,23 @@ class CRUDCommand(BaseCommand):
                 project_path=Path(args.get("path", ".")),
                 fields=fields,
                 generate_tests=args.get("tests", True),
+                pagination=args.get("pagination") or KEYSET,
             )
 
+            if args.get("plan"):
+                self.print_plan(self._generate_crud.plan(request))
+                return 0
+
             # Execute with progress
-            with ProgressBar("Generating CRUD files...") as progress:
-                response = self._generate_crud.execute(request)
-                progress.complete()
+            response = self.run_with_progress(
+                "Generating CRUD files...", self._generate_crud.stream(request)
+            )
 
             # Display results
+            if self.dry_run:
+                self.print_preview(request.project_path, args.get("snapshot"))
+                return 0
+
             self._display_results(response)
 
             return 0
@@ -53,23 +82,89 @@ class CRUDCommand(BaseCommand):
             self.print_error(f"❌ Unexpected error: {e!s}")
             return 1
 
-    def _parse_fields(self, fields_str: str) -> list[FieldDefinition]:
-        """Parse fields from string format"""
-        if not fields_str:
-            return []
+    def _execute_batch(self, args: dict[str, Any]) -> int:
+        """Execute CRUD generation for every entity of a batch source"""
+        try:
+            kind = next(kind for kind in BATCH_SOURCES if args.get(kind))
+            source = args[kind]
+            self.print_info(f"🔧 Generating CRUD from: {source}")
+
+            project_path = Path(args.get("path", "."))
+            generate_tests = args.get("tests", True)
+            if kind == "database":
+                parser = DatabaseSchemaParser()
+                entities = parser.parse(source, project_path, generate_tests)
+                for warning in parser.warnings:
+                    self.print_warning(f"⚠️  {warning}")
+            elif kind == "openapi":
+                parser = OpenAPISchemaParser()
+                entities = parser.parse(Path(source), project_path, generate_tests)
+                for warning in parser.warnings:
+                    self.print_warning(f"⚠️  {warning}")
+            else:
+                entities = EntityManifestParser().parse(
+                    Path(source), project_path, generate_tests
+                )
+            if args.get("pagination"):
+                for entity in entities:
+                    entity.pagination = args["pagination"]
+            request = GenerateCRUDBatchRequest(
+                project_path=project_path,
+                entities=entities,
+                jobs=args.get("jobs", 1),
+            )
 
-        fields = []
-        for field_def in fields_str.split(","):
-            field_def = field_def.strip()
-            if ":" in field_def:
-                name, type_str = field_def.split(":", 1)
-                fields.append(FieldDefinition(name=name.strip(), type=type_str.strip()))
+            if args.get("plan"):
+                self.print_plan(self._generate_crud_batch.plan(request))
+                return 0
 
-        return fields
+            with self.progress(
+                f"Generating CRUD for {len(request.entities)} entities..."
+            ) as progress:
+                response = self._generate_crud_batch.execute(request)
+                progress.complete()
+
+            if self.dry_run:
+                self.print_preview(project_path, args.get("snapshot"))
+                return 0
+
+            self._display_batch_results(response)
+
+            return 0
+
+        except DomainException as e:
+            self.print_error(f"❌ Error: {e.message}")
+            return 1
+
+        except Exception as e:
+            self.print_error(f"❌ Unexpected error: {e!s}")
+            return 1
+
+    def _parse_fields(self, fields_str: str) -> list[FieldDefinition]:
+        """Parse fields from string format"""
+        return parse_fields(fields_str)
 
     def _display_results(self, response: GenerateCRUDResponse) -> None:
         """Display generation results"""
         self.print_success(f"\n✅ {response.message}")
-        self.print_info("\n📝 Files created:")
+        if response.files_created:
+            self.print_info("\n📝 Files created:")
         for file_path in response.files_created:
+            reason = response.changes.get(file_path)
+            suffix = f" ({reason})" if reason else ""
+            self.print_info(f"   ✓ {file_path}{suffix}")
+        if response.files_unchanged:
+            self.print_info(f"\n💤 Files unchanged: {len(response.files_unchanged)}")
+
+    def _display_batch_results(self, response: GenerateCRUDBatchResponse) -> None:
+        """Display batch generation results"""
+        self.print_success(f"\n✅ {response.message}")
+        for result in response.results:
+            self.print_info(
+                f"   ✓ {result.entity_name}: {len(result.files_created)} files, "
+                f"{len(result.files_unchanged)} unchanged"
+            )
+        for file_path in response.shared_files:
             self.print_info(f"   ✓ {file_path}")
+        for file_path in response.shared_files_unchanged:
+            self.print_info(f"   · {file_path} (unchanged)")
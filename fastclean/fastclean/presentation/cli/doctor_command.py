@@ -0,0 +1,98 @@
+import json
+from pathlib import Path
+from typing import Any
+
+from ...application.analysis.findings import HIGH, LOW, MEDIUM, at_least
+from ...application.use_cases.diagnose_project.diagnose_project import (
+    DiagnoseProjectUseCase,
+)
+from ...application.use_cases.diagnose_project.dto import (
+    DiagnoseProjectRequest,
+    DiagnoseProjectResponse,
+)
+from ...core.exceptions.base import DomainException
+from .base import BaseCommand
+
+# Version of the --json report format
+REPORT_VERSION = 1
+
+SEVERITY_ICONS = {HIGH: "🔴", MEDIUM: "🟠", LOW: "🟡"}
+
+
+class DoctorCommand(BaseCommand):
+    """Find performance anti-patterns in an existing project"""
+
+    def __init__(self, diagnose_project: DiagnoseProjectUseCase, **kwargs):
+        super().__init__(**kwargs)
+        self._diagnose_project = diagnose_project
+
+    def execute(self, args: dict[str, Any]) -> int:
+        """Execute project analysis"""
+        try:
+            request = DiagnoseProjectRequest(
+                project_path=Path(args.get("path", ".")).resolve(),
+                include_tests=args.get("include_tests", False),
+            )
+            response = self._diagnose_project.execute(request)
+        except DomainException as e:
+            self.print_error(f"❌ Error: {e.message}")
+            return 1
+
+        report = args.get("json")
+        if report:
+            self._write_report(response, report)
+        if report != "-":
+            self._display_results(response)
+
+        fail_on = args.get("fail_on")
+        if fail_on and any(at_least(f.severity, fail_on) for f in response.findings):
+            return 1
+        return 0
+
+    def _write_report(self, response: DiagnoseProjectResponse, target: str) -> None:
+        """Write findings as JSON, to a file or stdout for '-'"""
+        root = response.project_path
+        report = json.dumps(
+            {
+                "version": REPORT_VERSION,
+                "project": str(root),
+                "files_analyzed": response.files_analyzed,
+                "findings": [finding.to_dict(root) for finding in response.findings],
+                "errors": {
+                    path.relative_to(root).as_posix(): reason
+                    for path, reason in response.errors.items()
+                },
+            },
+            indent=2,
+        )
+        if target == "-":
+            self._formatter.write(report)
+        else:
+            Path(target).write_text(report + "\n", encoding="utf-8")
+
+    def _display_results(self, response: DiagnoseProjectResponse) -> None:
+        """Display findings, most costly first"""
+        root = response.project_path
+        for finding in response.findings:
+            location = f"{finding.path.relative_to(root)}:{finding.line}"
+            self.print_info(
+                f"\n{SEVERITY_ICONS[finding.severity]} {finding.rule}"
+                f" (impact {finding.impact}) {location}"
+            )
+            self.print_info(f"   {finding.code}")
+            self.print_info(f"   {finding.message}")
+            self.print_info(f"   → {finding.suggestion}")
+        for path, reason in response.errors.items():
+            self.print_warning(f"\n⚠️  Skipped {path.relative_to(root)}: {reason}")
+
+        counts = {severity: 0 for severity in SEVERITY_ICONS}
+        for finding in response.findings:
+            counts[finding.severity] += 1
+        summary = ", ".join(f"{count} {severity}" for severity, count in counts.items())
+        if response.findings:
+            self.print_warning(
+                f"\n🩺 {len(response.findings)} findings in "
+                f"{response.files_analyzed} files: {summary}"
+            )
+        else:
+            self.print_success(f"\n🩺 No findings in {response.files_analyzed} files")
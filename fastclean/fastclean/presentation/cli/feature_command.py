@@ -1,47 +1,68 @@
+from pathlib import Path
 from typing import Any
 
+from ...application.use_cases.add_feature.add_features import AddFeaturesUseCase
+from ...application.use_cases.add_feature.dto import (
+    AddFeatureResponse,
+    AddFeaturesRequest,
+)
 from ...core.exceptions.base import DomainException
+from ...infrastructure.file_system.in_memory_file_system import (
+    InMemoryFileSystemService,
+)
+from ..formatters.console_formatter import ConsoleFormatter
 from .base import BaseCommand
 
 
 class FeatureCommand(BaseCommand):
     """Add features to existing project"""
 
+    def __init__(
+        self,
+        add_features: AddFeaturesUseCase,
+        formatter: ConsoleFormatter = None,
+        preview: InMemoryFileSystemService | None = None,
+    ):
+        super().__init__(formatter, preview)
+        self._add_features = add_features
+
     def execute(self, args: dict[str, Any]) -> int:
         """Execute feature addition"""
         try:
-            feature = args.get("feature")
-
-            if feature == "auth":
-                return self._add_authentication(args)
-            if feature == "cache":
-                return self._add_caching(args)
-            if feature == "monitoring":
-                return self._add_monitoring(args)
-            self.print_error(f"❌ Unknown feature: {feature}")
-            return 1
+            features = [
+                feature.strip()
+                for feature in args.get("features", "").split(",")
+                if feature.strip()
+            ]
+            self.print_info(f"🧩 Adding features: {', '.join(features)}")
+
+            request = AddFeaturesRequest(
+                project_path=Path(args.get("path", ".")),
+                features=features,
+                secret_key=args.get("secret_key"),
+                connection_string=args.get("redis_url"),
+            )
+            response = self._add_features.execute(request)
+
+            if self.dry_run:
+                self.print_preview(request.project_path)
+                return 0
+
+            self._display_results(response, request.project_path)
+            return 0
 
         except DomainException as e:
             self.print_error(f"❌ Error: {e.message}")
             return 1
 
-    def _add_authentication(self, args: dict[str, Any]) -> int:
-        """Add authentication"""
-        self.print_info("🔐 Adding authentication...")
-        # Implementation here
-        self.print_success("✅ Authentication added successfully!")
-        return 0
-
-    def _add_caching(self, args: dict[str, Any]) -> int:
-        """Add caching"""
-        self.print_info("⚡ Adding caching...")
-        # Implementation here
-        self.print_success("✅ Caching added successfully!")
-        return 0
-
-    def _add_monitoring(self, args: dict[str, Any]) -> int:
-        """Add monitoring"""
-        self.print_info("📊 Adding monitoring...")
-        # Implementation here
-        self.print_success("✅ Monitoring added successfully!")
-        return 0
+    def _display_results(self, response: AddFeatureResponse, root: Path) -> None:
+        """Display created and modified files"""
+        self.print_success(f"\n✅ {response.message}")
+        for label, paths in (
+            ("Created", response.files_created),
+            ("Modified", response.files_modified),
+        ):
+            if paths:
+                self.print_info(f"\n📝 {label}:")
+            for path in paths:
+                self.print_info(f"   ✓ {path.relative_to(root)}")
@@ -11,7 +11,6 @@ from ...core.value_objects.auth_type import AuthType
 from ...core.value_objects.cache_type import CacheType
 from ...core.value_objects.database_type import DatabaseType
 from ...core.value_objects.project_config import ProjectConfig
-from ..formatters.progress_bar import ProgressBar
 from .base import BaseCommand
 
 
@@ -33,15 +32,31 @@ class InitCommand(BaseCommand):
 
             # Create request
             request = CreateProjectRequest(
-                name=args["name"], path=Path(args.get("path", ".")), config=config
+                name=args["name"],
+                path=Path(args.get("path", ".")),
+                config=config,
+                jobs=args.get("jobs", 1),
+                update=args.get("update", False),
             )
 
+            if args.get("plan"):
+                self.print_plan(self._create_project.plan(request))
+                return 0
+
             # Execute with progress
-            with ProgressBar("Generating project files...") as progress:
-                response = self._create_project.execute(request)
-                progress.complete()
+            response = self.run_with_progress(
+                "Generating project files...", self._create_project.stream(request)
+            )
 
             # Display results
+            if self.dry_run:
+                self.print_preview(request.path, args.get("snapshot"))
+                return 0
+
+            if args.get("output_archive"):
+                self._display_archive(response, args["output_archive"])
+                return 0
+
             self._display_success(response)
             self._display_next_steps(response)
 
@@ -79,6 +94,14 @@ class InitCommand(BaseCommand):
         self.print_success(f"\n✅ {response.message}")
         self.print_info(f"📁 Location: {response.project_path}")
         self.print_info(f"📝 Files created: {response.files_created}")
+        if response.files_unchanged:
+            self.print_info(f"💤 Files unchanged: {response.files_unchanged}")
+
+    def _display_archive(self, response: CreateProjectResponse, archive: str) -> None:
+        """Display archive output"""
+        self.print_success(f"\n✅ {response.message}")
+        self.print_info(f"📦 Archive: {archive}")
+        self.print_info(f"📝 Files created: {response.files_created}")
 
     def _display_next_steps(self, response: CreateProjectResponse) -> None:
         """Display next steps"""
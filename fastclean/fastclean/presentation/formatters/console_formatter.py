@@ -1,5 +1,7 @@
 import sys
 
+from .file_tree import FileTreeFormatter
+
 
 class ConsoleFormatter:
     """Format console output with colors"""
@@ -17,6 +19,9 @@ class ConsoleFormatter:
         "bold": "\033[1m",
     }
 
+    # Whether animated output such as spinners may be shown
+    interactive = True
+
     def __init__(self, use_colors: bool = True):
         self._use_colors = use_colors and sys.stdout.isatty()
 
@@ -40,6 +45,23 @@ class ConsoleFormatter:
         """Print bold message"""
         self._print(message, "bold")
 
+    def write(self, message: str) -> None:
+        """Print message as is, e.g. machine readable output"""
+        print(message)
+
+    def format_progress(
+        self, done: int, total: int, elapsed: float, bytes_written: int = 0
+    ) -> str:
+        """Progress bar with counts, bytes written and estimated time left"""
+        width = 20
+        filled = width * done // total if total else width
+        parts = [f"[{'█' * filled}{'░' * (width - filled)}] {done}/{total}"]
+        if bytes_written:
+            parts.append(FileTreeFormatter.format_size(bytes_written))
+        if 0 < done < total:
+            parts.append(f"ETA {elapsed / done * (total - done):.1f}s")
+        return " · ".join(parts)
+
     def _print(self, message: str, color: str) -> None:
         """Print colored message"""
         if self._use_colors and color in self.COLORS:
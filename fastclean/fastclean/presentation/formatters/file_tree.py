@@ -0,0 +1,46 @@
+from pathlib import Path
+
+
+class FileTreeFormatter:
+    """Format a set of files as a tree with byte sizes"""
+
+    def format(self, sizes: dict[Path, int]) -> list[str]:
+        """Format files as tree lines, followed by a total"""
+        tree: dict = {}
+        for path in sizes:
+            node = tree
+            for part in path.parts:
+                node = node.setdefault(part, {})
+
+        lines: list[str] = []
+        self._format_node(tree, Path(), "", sizes, lines)
+        total = sum(sizes.values())
+        lines.append(f"\n{len(sizes)} files, {self.format_size(total)}")
+        return lines
+
+    def _format_node(
+        self, node: dict, path: Path, prefix: str, sizes: dict, lines: list
+    ) -> None:
+        # Directories first, then files, each alphabetically
+        names = sorted(node, key=lambda name: (path / name in sizes, name))
+        for i, name in enumerate(names):
+            last = i == len(names) - 1
+            child = path / name
+            branch = "└── " if last else "├── "
+            if child in sizes:
+                lines.append(
+                    f"{prefix}{branch}{name} ({self.format_size(sizes[child])})"
+                )
+            else:
+                lines.append(f"{prefix}{branch}{name}/")
+                extension = "    " if last else "│   "
+                self._format_node(node[name], child, prefix + extension, sizes, lines)
+
+    @staticmethod
+    def format_size(size: int) -> str:
+        """Human readable size"""
+        if size < 1024:
+            return f"{size} B"
+        if size < 1024 * 1024:
+            return f"{size / 1024:.1f} KB"
+        return f"{size / (1024 * 1024):.1f} MB"
@@ -0,0 +1,68 @@
+from ...application.generation.profiler import (
+    COMPILE,
+    FORMAT,
+    LOAD,
+    RENDER,
+    WRITE,
+    Profiler,
+)
+from .file_tree import FileTreeFormatter
+
+
+class ProfileFormatter:
+    """Format a profiler report as tables sorted by wall time"""
+
+    def __init__(self, top: int = 20):
+        self._top = top
+
+    def format(self, profiler: Profiler) -> list[str]:
+        """Format phase and template tables"""
+        lines = ["", "⏱️  Phases", ""]
+        lines.append(f"{'phase':<24} {'wall ms':>10} {'cpu ms':>10} {'written':>10}")
+        phases = sorted(profiler.phases.items(), key=lambda i: i[1].wall, reverse=True)
+        for name, timing in phases:
+            lines.append(
+                f"{name:<24} {timing.wall * 1000:>10.2f} {timing.cpu * 1000:>10.2f}"
+                f" {self._size(timing.bytes_written):>10}"
+            )
+
+        if profiler.counters:
+            lines += ["", "🔢 Counters", ""]
+            for name, value in profiler.counters.items():
+                lines.append(f"{name:<24} {value:>10}")
+
+        totals = profiler.template_totals()
+        if not totals:
+            return lines
+
+        lines += ["", f"📄 Templates (top {min(self._top, len(totals))} by wall)", ""]
+        # Post-processing columns only appear when a stage was measured
+        stages = [LOAD, RENDER, FORMAT, WRITE, COMPILE]
+        measured = {
+            stage for timings in profiler.templates.values() for stage in timings
+        }
+        stages = [s for s in stages if s in (LOAD, RENDER, WRITE) or s in measured]
+        lines.append(
+            f"{'template':<32} "
+            + " ".join(f"{stage + ' ms':>10}" for stage in stages)
+            + f" {'cpu ms':>8} {'written':>9} {'calls':>6}"
+        )
+        ranked = sorted(totals.items(), key=lambda i: i[1].wall, reverse=True)
+        for name, total in ranked[: self._top]:
+            timings = profiler.templates[name]
+            lines.append(
+                f"{name:<32} "
+                + " ".join(f"{self._ms(timings, stage):>10}" for stage in stages)
+                + f" {total.cpu * 1000:>8.2f}"
+                f" {self._size(total.bytes_written):>9} {total.calls:>6}"
+            )
+        return lines
+
+    @staticmethod
+    def _ms(stages: dict, stage: str) -> str:
+        timing = stages.get(stage)
+        return f"{timing.wall * 1000:.2f}" if timing else "-"
+
+    @staticmethod
+    def _size(size: int) -> str:
+        return FileTreeFormatter.format_size(size) if size else "-"
@@ -1,17 +1,38 @@
 import sys
-import threading
 import time
 
+from .console_formatter import ConsoleFormatter
+
 
 class ProgressBar:
-    """Animated progress indicator"""
+    """Progress line redrawn as work completes
+
+    Without a total it shows a spinner that advances on each update; with
+    one it shows a bar, counts, bytes written and the remaining time.
+    Redraws happen on the caller's thread, at most every REFRESH_INTERVAL
+    seconds, so there is no animation thread to wait for when stopping.
+    """
 
     SPINNER_FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+    REFRESH_INTERVAL = 0.05
 
-    def __init__(self, message: str = "Processing..."):
+    def __init__(
+        self,
+        message: str = "Processing...",
+        enabled: bool = True,
+        total: int | None = None,
+        formatter: ConsoleFormatter | None = None,
+    ):
         self.message = message
-        self._stop = False
-        self._thread: threading.Thread | None = None
+        self.enabled = enabled
+        self.total = total
+        self.done = 0
+        self.bytes_written = 0
+        self._formatter = formatter or ConsoleFormatter()
+        self._started: float | None = None
+        self._drawn_at = 0.0
+        self._frame = 0
+        self._width = 0
 
     def __enter__(self):
         """Start progress indicator"""
@@ -23,29 +44,48 @@ class ProgressBar:
         self.stop()
 
     def start(self) -> None:
-        """Start the progress animation"""
-        self._stop = False
-        self._thread = threading.Thread(target=self._animate, daemon=True)
-        self._thread.start()
+        """Show the progress line"""
+        self._started = time.perf_counter()
+        self._draw(force=True)
+
+    def update(
+        self, done: int, total: int | None = None, bytes_written: int = 0
+    ) -> None:
+        """Record progress and redraw if due"""
+        self.done = done
+        if total is not None:
+            self.total = total
+        self.bytes_written += bytes_written
+        self._draw(force=self.total is not None and done >= self.total)
 
     def stop(self) -> None:
-        """Stop the progress animation"""
-        self._stop = True
-        if self._thread:
-            self._thread.join()
-        sys.stdout.write("\r" + " " * (len(self.message) + 10) + "\r")
+        """Clear the progress line"""
+        if not self.enabled or self._started is None:
+            return
+        sys.stdout.write("\r" + " " * self._width + "\r")
         sys.stdout.flush()
+        self._started = None
 
     def complete(self) -> None:
         """Mark as complete"""
         self.stop()
 
-    def _animate(self) -> None:
-        """Animate the spinner"""
-        idx = 0
-        while not self._stop:
-            frame = self.SPINNER_FRAMES[idx % len(self.SPINNER_FRAMES)]
-            sys.stdout.write(f"\r{frame} {self.message}")
-            sys.stdout.flush()
-            time.sleep(0.1)
-            idx += 1
+    def _draw(self, force: bool = False) -> None:
+        if not self.enabled or self._started is None:
+            return
+        now = time.perf_counter()
+        if not force and now - self._drawn_at < self.REFRESH_INTERVAL:
+            return
+        self._drawn_at = now
+
+        frame = self.SPINNER_FRAMES[self._frame % len(self.SPINNER_FRAMES)]
+        self._frame += 1
+        line = f"{frame} {self.message}"
+        if self.total:
+            line += " " + self._formatter.format_progress(
+                self.done, self.total, now - self._started, self.bytes_written
+            )
+
+        sys.stdout.write("\r" + line.ljust(self._width))
+        sys.stdout.flush()
+        self._width = max(self._width, len(line))
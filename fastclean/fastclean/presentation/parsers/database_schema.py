@@ -0,0 +1,365 @@
+import keyword
+import re
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ...application.use_cases.generate_crud.dto import (
+    OFFSET,
+    FieldDefinition,
+    GenerateCRUDRequest,
+)
+from ...core.exceptions.base import ValidationException
+
+SQLITE_PREFIX = "sqlite:///"
+
+# Columns every generated model defines itself
+GENERATED_COLUMNS = ("id", "created_at")
+
+# Length of a character column type, e.g. VARCHAR(255)
+CHAR_LENGTH = re.compile(r"CHAR\s*\(\s*(\d+)\s*\)", re.IGNORECASE)
+
+# Tables that belong to tooling rather than the application
+IGNORED_TABLES = ("alembic_version",)
+
+# SQL type name fragments and the field type they map to, checked in order
+SQL_TYPES = (
+    ("INTERVAL", "str"),
+    ("BOOL", "bool"),
+    ("INT", "int"),
+    ("SERIAL", "int"),
+    ("DATE", "datetime"),
+    ("TIME", "datetime"),
+    ("REAL", "float"),
+    ("FLOA", "float"),
+    ("DOUB", "float"),
+    ("NUMERIC", "float"),
+    ("DECIMAL", "float"),
+)
+
+
+@dataclass
+class ReflectedColumn:
+    """A column of a reflected table"""
+
+    name: str
+    type: str
+    nullable: bool = True
+    primary_key: bool = False
+    unique: bool = False
+    indexed: bool = False
+    foreign_key: str | None = None
+
+
+@dataclass
+class ReflectedTable:
+    """A reflected table and its columns, in definition order"""
+
+    name: str
+    columns: list[ReflectedColumn] = field(default_factory=list)
+    # Primary key columns, in key order
+    primary_key: list[str] = field(default_factory=list)
+
+
+def field_type(sql_type: str) -> str:
+    """Map a SQL column type to a field type, "str" when unknown"""
+    upper = sql_type.upper()
+    for fragment, type_name in SQL_TYPES:
+        if fragment in upper:
+            return type_name
+    return "str"
+
+
+def max_length(sql_type: str) -> int | None:
+    """Declared length of a character column type, None when unbounded"""
+    match = CHAR_LENGTH.search(sql_type)
+    return int(match.group(1)) if match else None
+
+
+def entity_name(table_name: str) -> str:
+    """PascalCase singular entity name of a table, e.g. order_items -> OrderItem"""
+    words = [word for word in re.split(r"[^0-9A-Za-z]+", table_name) if word]
+    if words:
+        words[-1] = _singular(words[-1])
+    return "".join(word[:1].upper() + word[1:] for word in words)
+
+
+def field_alias(name: str) -> str:
+    """Python identifier for a column or property name, e.g. from -> from_"""
+    alias = re.sub(r"\W", "_", name)
+    if not alias.isidentifier():
+        alias = f"_{alias}"
+    if keyword.iskeyword(alias):
+        alias = f"{alias}_"
+    return alias
+
+
+def _singular(word: str) -> str:
+    lower = word.lower()
+    if lower.endswith("ies") and len(word) > 3:
+        return word[:-3] + ("Y" if word[-1].isupper() else "y")
+    if lower.endswith(("sses", "xes", "ches", "shes")):
+        return word[:-2]
+    if lower.endswith("s") and not lower.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+class DatabaseSchemaParser:
+    """Reflect the tables of an existing database into CRUD requests
+
+    SQLite databases (``sqlite:///path.db`` or a plain file path) are read
+    with the standard library; any other URL is reflected with SQLAlchemy.
+    Column types and lengths, nullability, single-column unique
+    constraints and indexes, and single-column foreign keys are mapped onto
+    the fields. Primary keys other than an integer ``id`` are kept as key
+    fields, and ``created_at`` is generated only for tables that have it.
+    Columns whose names are not Python identifiers are aliased, each with
+    a warning collected in ``warnings``.
+    """
+
+    def __init__(self):
+        self.warnings: list[str] = []
+
+    def parse(
+        self, url: str, project_path: Path, generate_tests: bool = True
+    ) -> list[GenerateCRUDRequest]:
+        """Reflect a database"""
+        tables = self.reflect(url)
+
+        requests = []
+        for table in tables:
+            fields = self._fields(table)
+            if not fields:
+                continue
+            request = GenerateCRUDRequest(
+                entity_name=entity_name(table.name),
+                project_path=project_path,
+                fields=fields,
+                generate_tests=generate_tests,
+                table_name=table.name,
+                has_created_at=any(
+                    column.name == "created_at" for column in table.columns
+                ),
+            )
+            if not request.supports_keyset:
+                request.pagination = OFFSET
+            requests.append(request)
+
+        if not requests:
+            raise ValidationException(f"No tables to generate found in '{url}'")
+        return requests
+
+    def reflect(self, url: str) -> list[ReflectedTable]:
+        """Reflect every application table of a database, sorted by name"""
+        path = self.sqlite_path(url)
+        if path is not None:
+            return self._reflect_sqlite(path)
+        return self._reflect_sqlalchemy(url)
+
+    @staticmethod
+    def sqlite_path(url: str) -> Path | None:
+        """The file of a SQLite URL or path, or None for other databases"""
+        if url.startswith(SQLITE_PREFIX):
+            return Path(url[len(SQLITE_PREFIX) :])
+        if "://" not in url:
+            return Path(url)
+        return None
+
+    @classmethod
+    def resolve(cls, url: str, cwd: Path) -> str:
+        """Resolve a relative SQLite path against a working directory"""
+        path = cls.sqlite_path(url)
+        if path is None or path.is_absolute():
+            return url
+        return f"{SQLITE_PREFIX}{cwd / path}"
+
+    def _reflect_sqlite(self, path: Path) -> list[ReflectedTable]:
+        if not path.is_file():
+            raise ValidationException(f"SQLite database not found: '{path}'")
+
+        try:
+            connection = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+        except sqlite3.Error as e:
+            raise ValidationException(f"Cannot open database '{path}': {e}") from e
+
+        try:
+            names = [
+                row[0]
+                for row in connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' "
+                    "AND name NOT LIKE 'sqlite_%' ORDER BY name"
+                )
+                if row[0] not in IGNORED_TABLES
+            ]
+            return [self._reflect_sqlite_table(connection, name) for name in names]
+        except sqlite3.Error as e:
+            raise ValidationException(f"Cannot reflect database '{path}': {e}") from e
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _reflect_sqlite_table(
+        connection: sqlite3.Connection, name: str
+    ) -> ReflectedTable:
+        quoted = _quote(name)
+
+        # cid, name, type, notnull, dflt_value, pk
+        rows = connection.execute(f"PRAGMA table_info({quoted})").fetchall()
+        primary_key = [row[1] for row in sorted(rows, key=lambda row: row[5]) if row[5]]
+        columns = {
+            row[1]: ReflectedColumn(
+                name=row[1],
+                type=row[2] or "",
+                nullable=not row[3],
+                primary_key=bool(row[5]),
+            )
+            for row in rows
+        }
+
+        # id, seq, table, from, to, ...; multi-column keys share an id
+        keys: dict[int, list] = {}
+        for row in connection.execute(f"PRAGMA foreign_key_list({quoted})"):
+            keys.setdefault(row[0], []).append(row)
+        for key in keys.values():
+            if len(key) == 1:
+                _, _, table, column, target = key[0][:5]
+                columns[column].foreign_key = f"{table}.{target or 'id'}"
+
+        # seq, name, unique, origin, partial
+        for index in connection.execute(f"PRAGMA index_list({quoted})").fetchall():
+            if index[3] == "pk" or index[4]:
+                continue
+            indexed = connection.execute(
+                f"PRAGMA index_info({_quote(index[1])})"
+            ).fetchall()
+            if len(indexed) == 1 and indexed[0][2] in columns:
+                column = columns[indexed[0][2]]
+                if index[2]:
+                    column.unique = True
+                else:
+                    column.indexed = True
+
+        return ReflectedTable(name, list(columns.values()), primary_key)
+
+    @staticmethod
+    def _reflect_sqlalchemy(url: str) -> list[ReflectedTable]:
+        try:
+            from sqlalchemy import create_engine, inspect
+            from sqlalchemy.exc import SQLAlchemyError
+        except ImportError:
+            raise ValidationException(
+                "SQLAlchemy is required to reflect non-SQLite databases: "
+                "pip install sqlalchemy"
+            ) from None
+
+        try:
+            engine = create_engine(url)
+        except (SQLAlchemyError, ImportError, ValueError) as e:
+            raise ValidationException(f"Cannot open database '{url}': {e}") from e
+
+        try:
+            inspector = inspect(engine)
+            tables = []
+            for name in sorted(inspector.get_table_names()):
+                if name in IGNORED_TABLES:
+                    continue
+                primary_key = inspector.get_pk_constraint(name)["constrained_columns"]
+                columns = {
+                    column["name"]: ReflectedColumn(
+                        name=column["name"],
+                        type=str(column["type"]),
+                        nullable=bool(column.get("nullable", True)),
+                        primary_key=column["name"] in primary_key,
+                    )
+                    for column in inspector.get_columns(name)
+                }
+                for key in inspector.get_foreign_keys(name):
+                    if len(key["constrained_columns"]) == 1:
+                        columns[key["constrained_columns"][0]].foreign_key = (
+                            f"{key['referred_table']}.{key['referred_columns'][0]}"
+                        )
+                for constraint in inspector.get_unique_constraints(name):
+                    if len(constraint["column_names"]) == 1:
+                        columns[constraint["column_names"][0]].unique = True
+                for index in inspector.get_indexes(name):
+                    if len(index["column_names"]) == 1:
+                        column = columns.get(index["column_names"][0])
+                        if column is None:
+                            continue
+                        if index.get("unique"):
+                            column.unique = True
+                        else:
+                            column.indexed = True
+                tables.append(ReflectedTable(name, list(columns.values()), primary_key))
+            return tables
+        except SQLAlchemyError as e:
+            raise ValidationException(f"Cannot reflect database '{url}': {e}") from e
+        finally:
+            engine.dispose()
+
+    def _fields(self, table: ReflectedTable) -> list[FieldDefinition]:
+        columns = {column.name: column for column in table.columns}
+        default_key = table.primary_key == ["id"] and (
+            field_type(columns["id"].type) == "int"
+        )
+        # Only a single integer key is generated by the database
+        generated_key = len(table.primary_key) == 1 and (
+            field_type(columns[table.primary_key[0]].type) == "int"
+        )
+
+        fields = []
+        names = set(columns)
+        for column in table.columns:
+            if column.name == "created_at" or (default_key and column.name == "id"):
+                continue
+            name = self._field_name(table, column.name, names)
+            if name is None:
+                continue
+            if column.primary_key:
+                required = not generated_key
+            else:
+                required = not column.nullable
+            fields.append(
+                FieldDefinition(
+                    name=name,
+                    type=field_type(column.type),
+                    required=required,
+                    nullable=None if column.primary_key else column.nullable,
+                    unique=column.unique,
+                    indexed=column.indexed,
+                    foreign_key=column.foreign_key,
+                    max_length=max_length(column.type),
+                    primary_key=column.primary_key,
+                    column=None if name == column.name else column.name,
+                )
+            )
+
+        # Key fields first, so the model declares them in key order
+        order = {name: position for position, name in enumerate(table.primary_key)}
+        fields.sort(key=lambda f: order.get(f.column or f.name, len(order)))
+        return fields
+
+    def _field_name(self, table: ReflectedTable, column: str, names: set) -> str | None:
+        """Python name of a column, aliased with a warning when it is not one"""
+        if column.isidentifier() and not keyword.iskeyword(column):
+            return column
+
+        alias = field_alias(column)
+        if alias in names:
+            self.warnings.append(
+                f"Skipped column '{table.name}.{column}': it is not a valid "
+                f"Python identifier and its alias '{alias}' is taken"
+            )
+            return None
+
+        names.add(alias)
+        self.warnings.append(
+            f"Column '{table.name}.{column}' is not a valid Python identifier, "
+            f"generated as '{alias}'"
+        )
+        return alias
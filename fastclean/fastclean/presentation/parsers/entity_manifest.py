@@ -0,0 +1,124 @@
+import json
+from pathlib import Path
+from typing import Any
+
+from ...application.use_cases.generate_crud.dto import (
+    KEYSET,
+    FieldDefinition,
+    GenerateCRUDRequest,
+)
+from ...core.exceptions.base import ValidationException
+
+
+def parse_fields(fields_str: str) -> list[FieldDefinition]:
+    """Parse fields from "name:type,name:type" format"""
+    if not fields_str:
+        return []
+
+    fields = []
+    for field_def in fields_str.split(","):
+        field_def = field_def.strip()
+        if ":" in field_def:
+            name, type_str = field_def.split(":", 1)
+            fields.append(FieldDefinition(name=name.strip(), type=type_str.strip()))
+
+    return fields
+
+
+class EntityManifestParser:
+    """Parse an entity manifest (JSON or YAML) into CRUD requests
+
+    Example manifest::
+
+        entities:
+          - name: Product
+            fields: "name:str,price:float"
+          - name: Order
+            tests: false
+            pagination: offset
+            fields:
+              total: float
+              note: {type: str, required: false}
+    """
+
+    def parse(
+        self, manifest_path: Path, project_path: Path, generate_tests: bool = True
+    ) -> list[GenerateCRUDRequest]:
+        """Parse manifest file"""
+        data = self._load(manifest_path)
+
+        entities = data.get("entities") if isinstance(data, dict) else data
+        if not isinstance(entities, list) or not entities:
+            raise ValidationException(
+                f"Manifest '{manifest_path}' must define a non-empty 'entities' list"
+            )
+
+        return [
+            self._parse_entity(entity, project_path, generate_tests)
+            for entity in entities
+        ]
+
+    def _load(self, manifest_path: Path) -> Any:
+        try:
+            text = manifest_path.read_text(encoding="utf-8")
+        except OSError as e:
+            raise ValidationException(
+                f"Cannot read manifest '{manifest_path}': {e}"
+            ) from e
+
+        if manifest_path.suffix.lower() in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ValidationException(
+                    "PyYAML is required for YAML manifests: pip install pyyaml"
+                ) from None
+            return yaml.safe_load(text)
+
+        try:
+            return json.loads(text)
+        except ValueError as e:
+            raise ValidationException(f"Invalid JSON in '{manifest_path}': {e}") from e
+
+    def _parse_entity(
+        self, entity: Any, project_path: Path, generate_tests: bool
+    ) -> GenerateCRUDRequest:
+        if not isinstance(entity, dict) or "name" not in entity:
+            raise ValidationException(f"Manifest entity needs a 'name': {entity!r}")
+
+        return GenerateCRUDRequest(
+            entity_name=str(entity["name"]),
+            project_path=project_path,
+            fields=self._parse_entity_fields(entity.get("fields")),
+            generate_tests=bool(entity.get("tests", generate_tests)),
+            pagination=str(entity.get("pagination", KEYSET)),
+        )
+
+    @staticmethod
+    def _parse_entity_fields(fields: Any) -> list[FieldDefinition]:
+        if isinstance(fields, str):
+            return parse_fields(fields)
+
+        if isinstance(fields, dict):
+            fields = [
+                (
+                    {"name": name, **spec}
+                    if isinstance(spec, dict)
+                    else {"name": name, "type": spec}
+                )
+                for name, spec in fields.items()
+            ]
+
+        parsed = []
+        for field in fields or []:
+            if not isinstance(field, dict) or "name" not in field:
+                raise ValidationException(f"Invalid field definition: {field!r}")
+            parsed.append(
+                FieldDefinition(
+                    name=str(field["name"]),
+                    type=str(field.get("type", "str")),
+                    required=bool(field.get("required", True)),
+                    default=field.get("default"),
+                )
+            )
+        return parsed
@@ -0,0 +1,248 @@
+import json
+import keyword
+import re
+from collections.abc import Iterator
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+from ...application.use_cases.generate_crud.dto import (
+    FieldDefinition,
+    GenerateCRUDRequest,
+)
+from ...core.exceptions.base import ValidationException
+from .database_schema import GENERATED_COLUMNS, field_alias
+
+# Where each OpenAPI version keeps its schemas, as ijson prefixes
+SCHEMA_PREFIXES = ("components.schemas", "definitions")
+
+# JSON schema type and format, or type alone, and the field type they map to
+SCHEMA_TYPES = {
+    ("string", "date-time"): "datetime",
+    ("string", "date"): "datetime",
+    "string": "str",
+    "integer": "int",
+    "number": "float",
+    "boolean": "bool",
+}
+
+
+def _snake_case(name: str) -> str:
+    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
+    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+
+
+def _entity_name(schema_name: str) -> str:
+    # Names that are not identifiers, e.g. Pet.Response, are PascalCased
+    if schema_name.isidentifier() and not keyword.iskeyword(schema_name):
+        return schema_name
+    words = re.split(r"[^0-9A-Za-z]+", schema_name)
+    return "".join(word[:1].upper() + word[1:] for word in words)
+
+
+class OpenAPISchemaParser:
+    """Parse the component schemas of an OpenAPI document into CRUD requests
+
+    Every object schema becomes an entity; JSON specs are streamed one
+    schema at a time with ijson when it is installed. Scalar properties
+    map onto fields, keeping nullability, enums, date formats and string
+    max lengths. A ``$ref`` to another schema becomes a ``<name>_id``
+    foreign key to that entity's table. Arrays, inline objects, read-only
+    properties and the columns every generated model defines itself are
+    left out.
+
+    Schema names that are not Python identifiers, such as ``Pet.Response``,
+    are PascalCased, and property names are aliased onto their real column
+    as database columns are. Each renamed or skipped name adds a warning to
+    ``warnings``.
+    """
+
+    def __init__(self):
+        self.warnings: list[str] = []
+
+    def parse(
+        self, spec_path: Path, project_path: Path, generate_tests: bool = True
+    ) -> list[GenerateCRUDRequest]:
+        """Parse OpenAPI document"""
+        requests = []
+        names: set[str] = set()
+        for name, schema in self._schemas(spec_path):
+            if not isinstance(schema, dict):
+                continue
+            fields = self._fields(name, schema)
+            entity = self._entity(name, names) if fields else None
+            if entity is None:
+                continue
+            names.add(entity)
+            requests.append(
+                GenerateCRUDRequest(
+                    entity_name=entity,
+                    project_path=project_path,
+                    fields=fields,
+                    generate_tests=generate_tests,
+                )
+            )
+
+        if not requests:
+            raise ValidationException(
+                f"No object schemas to generate found in '{spec_path}'"
+            )
+        return requests
+
+    def _schemas(self, spec_path: Path) -> Iterator[tuple[str, Any]]:
+        try:
+            if spec_path.suffix.lower() in (".yaml", ".yml"):
+                yield from self._load_yaml(spec_path)
+                return
+
+            try:
+                import ijson
+            except ImportError:
+                yield from self._load_json(spec_path)
+                return
+
+            for prefix in SCHEMA_PREFIXES:
+                found = False
+                with spec_path.open("rb") as stream:
+                    for item in ijson.kvitems(stream, prefix, use_float=True):
+                        found = True
+                        yield item
+                if found:
+                    return
+        except OSError as e:
+            raise ValidationException(f"Cannot read spec '{spec_path}': {e}") from e
+        except ValueError as e:
+            # json.JSONDecodeError and ijson.JSONError are both ValueErrors
+            raise ValidationException(f"Invalid JSON in '{spec_path}': {e}") from e
+
+    @staticmethod
+    def _load_json(spec_path: Path) -> Iterator[tuple[str, Any]]:
+        with spec_path.open(encoding="utf-8") as stream:
+            yield from OpenAPISchemaParser._find_schemas(json.load(stream))
+
+    @staticmethod
+    def _load_yaml(spec_path: Path) -> Iterator[tuple[str, Any]]:
+        try:
+            import yaml
+        except ImportError:
+            raise ValidationException(
+                "PyYAML is required for YAML specs: pip install pyyaml"
+            ) from None
+        with spec_path.open(encoding="utf-8") as stream:
+            try:
+                document = yaml.safe_load(stream)
+            except yaml.YAMLError as e:
+                raise ValidationException(f"Invalid YAML in '{spec_path}': {e}") from e
+        yield from OpenAPISchemaParser._find_schemas(document)
+
+    @staticmethod
+    def _find_schemas(document: Any) -> Iterator[tuple[str, Any]]:
+        if not isinstance(document, dict):
+            return
+        schemas = (document.get("components") or {}).get("schemas") or document.get(
+            "definitions"
+        )
+        if isinstance(schemas, dict):
+            yield from schemas.items()
+
+    def _fields(self, name: str, schema: dict) -> list[FieldDefinition]:
+        properties = schema.get("properties")
+        if not isinstance(properties, dict):
+            return []
+        required = set(schema.get("required") or [])
+
+        fields = []
+        names = set(properties)
+        for prop_name, prop in properties.items():
+            if not isinstance(prop, dict) or prop.get("readOnly"):
+                continue
+            field = self._field(prop_name, prop, prop_name in required)
+            if field is None or field.name in GENERATED_COLUMNS:
+                continue
+            alias = self._field_name(name, field.name, names)
+            if alias is None:
+                continue
+            if alias != field.name:
+                field = replace(field, name=alias, column=field.name)
+            fields.append(field)
+        return fields
+
+    def _entity(self, name: str, names: set) -> str | None:
+        """Entity name of a schema, PascalCased with a warning when needed"""
+        entity = _entity_name(name)
+        if not entity.isidentifier() or keyword.iskeyword(entity):
+            self.warnings.append(
+                f"Skipped schema '{name}': it is not a valid Python identifier"
+            )
+            return None
+        if entity in names:
+            self.warnings.append(
+                f"Skipped schema '{name}': entity '{entity}' is already generated"
+            )
+            return None
+        if entity != name:
+            self.warnings.append(
+                f"Schema '{name}' is not a valid Python identifier, "
+                f"generated as '{entity}'"
+            )
+        return entity
+
+    def _field_name(self, schema: str, prop: str, names: set) -> str | None:
+        """Python name of a property, aliased with a warning when it is not one"""
+        if prop.isidentifier() and not keyword.iskeyword(prop):
+            return prop
+
+        alias = field_alias(prop)
+        if alias in names:
+            self.warnings.append(
+                f"Skipped property '{schema}.{prop}': it is not a valid "
+                f"Python identifier and its alias '{alias}' is taken"
+            )
+            return None
+
+        names.add(alias)
+        self.warnings.append(
+            f"Property '{schema}.{prop}' is not a valid Python identifier, "
+            f"generated as '{alias}'"
+        )
+        return alias
+
+    @staticmethod
+    def _field(name: str, prop: dict, required: bool) -> FieldDefinition | None:
+        # OpenAPI 3.1 spells nullability as a "null" member of the type
+        types = prop.get("type")
+        types = types if isinstance(types, list) else [types]
+        nullable = bool(prop.get("nullable")) or "null" in types
+        type_name = next((t for t in types if t not in (None, "null")), None)
+
+        ref = prop.get("$ref")
+        all_of = prop.get("allOf")
+        if ref is None and isinstance(all_of, list) and all_of:
+            # A $ref with siblings is wrapped as allOf: [{$ref}]
+            ref = all_of[0].get("$ref") if isinstance(all_of[0], dict) else None
+        if ref:
+            target = _snake_case(_entity_name(ref.rsplit("/", 1)[-1]))
+            return FieldDefinition(
+                name=f"{name}_id",
+                type="int",
+                required=required and not nullable,
+                nullable=nullable or not required,
+                foreign_key=f"{target}s.id",
+            )
+
+        field_type = SCHEMA_TYPES.get((type_name, prop.get("format"))) or (
+            SCHEMA_TYPES.get(type_name)
+        )
+        if field_type is None:
+            return None
+
+        enum = prop.get("enum")
+        max_length = prop.get("maxLength")
+        return FieldDefinition(
+            name=name,
+            type=field_type,
+            required=required and not nullable,
+            nullable=nullable or not required,
+            enum=[value for value in enum if value is not None] if enum else None,
+            max_length=max_length if isinstance(max_length, int) else None,
+        )
@@ -0,0 +1,90 @@
+"""Thin client for ``fastclean serve``
+
+Sends the command line to a running daemon and prints its output, so a
+repeat invocation costs an interpreter start and one round trip instead of
+importing the generator and compiling templates. Without a daemon it runs
+the command in process. Deliberately imports nothing from fastclean up
+front.
+
+Usage::
+
+    fastclean-client init --name my_project --docker
+    fastclean-client --ping
+    fastclean-client --shutdown
+"""
+
+import json
+import os
+import socket
+import sys
+import tempfile
+
+SOCKET_ENV = "FASTCLEAN_SOCKET"
+
+
+def socket_path() -> str:
+    """Socket of the daemon, matching the daemon's default"""
+    if os.environ.get(SOCKET_ENV):
+        return os.environ[SOCKET_ENV]
+    uid = os.getuid() if hasattr(os, "getuid") else "user"
+    return os.path.join(tempfile.gettempdir(), f"fastclean-{uid}.sock")
+
+
+def call(method: str, params: dict | None = None, path: str | None = None) -> dict:
+    """Send one JSON-RPC request and return its result
+
+    Raises OSError when no daemon is listening and RuntimeError when the
+    daemon reports an error.
+    """
+    request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params or {}}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(path or socket_path())
+        connection.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        with connection.makefile("r", encoding="utf-8") as reader:
+            line = reader.readline()
+
+    if not line:
+        raise OSError("daemon closed the connection")
+    response = json.loads(line)
+    if "error" in response:
+        raise RuntimeError(response["error"]["message"])
+    return response["result"]
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+
+    if argv[:1] in (["--ping"], ["--shutdown"]):
+        try:
+            result = call(argv[0][2:])
+        except OSError as e:
+            print(f"❌ No daemon at {socket_path()}: {e}", file=sys.stderr)
+            return 1
+        print(json.dumps(result))
+        return 0
+
+    if not argv or argv[0] not in ("init", "crud", "feature"):
+        return _run_locally(argv)
+
+    try:
+        result = call(argv[0], {"argv": argv[1:], "cwd": os.getcwd()})
+    except (OSError, AttributeError):
+        # No daemon (or no UNIX sockets on this platform)
+        return _run_locally(argv)
+    except RuntimeError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+
+    sys.stdout.write(result["stdout"])
+    sys.stderr.write(result["stderr"])
+    return result["exit_code"]
+
+
+def _run_locally(argv: list[str]) -> int:
+    from fastclean.cli.main import main as cli_main
+
+    return cli_main(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,322 @@
+import argparse
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, TextIO
+
+from ...application.generation.executor import resolve_jobs
+from ..formatters.console_formatter import ConsoleFormatter
+from ..parsers.database_schema import DatabaseSchemaParser
+
+SOCKET_ENV = "FASTCLEAN_SOCKET"
+
+# Arguments holding paths, resolved against the client's working directory
+PATH_ARGUMENTS = (
+    "path",
+    "manifest",
+    "openapi",
+    "snapshot",
+    "output_archive",
+    "profile_json",
+    "pstats",
+)
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+
+
+def default_socket_path() -> Path:
+    """Socket used when neither --socket nor $FASTCLEAN_SOCKET is given"""
+    if os.environ.get(SOCKET_ENV):
+        return Path(os.environ[SOCKET_ENV])
+    uid = os.getuid() if hasattr(os, "getuid") else "user"
+    return Path(tempfile.gettempdir()) / f"fastclean-{uid}.sock"
+
+
+class _BufferedFormatter(ConsoleFormatter):
+    """Collect a request's output instead of printing it"""
+
+    interactive = False
+
+    def __init__(self):
+        super().__init__(use_colors=False)
+        self.lines: list[str] = []
+
+    def write(self, message: str) -> None:
+        self.lines.append(message)
+
+    def _print(self, message: str, color: str) -> None:
+        self.lines.append(message)
+
+
+class _ParserExit(Exception):
+    def __init__(self, status: int):
+        super().__init__(status)
+        self.status = status
+
+
+class _RequestOutput(threading.local):
+    """Per-thread output of the argument parser"""
+
+    stdout: list[str]
+    stderr: list[str]
+
+
+_parser_output = _RequestOutput()
+
+
+class _DaemonArgumentParser(argparse.ArgumentParser):
+    """Argument parser that reports help and errors instead of exiting"""
+
+    def _print_message(self, message: str, file: TextIO | None = None) -> None:
+        if message:
+            if file is sys.stderr:
+                _parser_output.stderr.append(message)
+            else:
+                _parser_output.stdout.append(message)
+
+    def exit(self, status: int = 0, message: str | None = None):
+        if message:
+            _parser_output.stderr.append(message)
+        raise _ParserExit(status)
+
+
+class GeneratorDaemon:
+    """Serve CLI commands from a warm process over JSON-RPC
+
+    Each request is one JSON-RPC 2.0 object per line. The method is a CLI
+    command (``init``, ``crud``, ``feature``) and ``params`` holds its
+    ``argv`` and the client's ``cwd``; the result is the command's
+    ``exit_code``, ``stdout`` and ``stderr``. ``ping`` and ``shutdown`` control the daemon.
+
+    The template engine, with its compiled template caches, and the render
+    cache are shared by all requests; the engine's template index is
+    revalidated at the start of each, so added or removed templates are
+    seen. Everything else (file system, use cases) is built per request,
+    so concurrent requests never share a transaction. Requests for
+    the same project run one at a time, as they share its lock file. At most
+    ``workers`` requests run at once and at most as many again wait, after
+    which reading from clients pauses.
+    """
+
+    def __init__(self, workers: int = 4):
+        self._workers = resolve_jobs(workers)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._workers, thread_name_prefix="fastclean-worker"
+        )
+        self._slots = threading.BoundedSemaphore(self._workers * 2)
+        self._stopped = threading.Event()
+        self._project_locks: dict[Path, threading.Lock] = {}
+        self._project_locks_guard = threading.Lock()
+
+        from ...cli.main import DependencyContainer
+        from ...infrastructure.file_system.path_resolver import PathResolver
+        from ...infrastructure.templates.jinja_engine import JinjaTemplateEngine
+
+        self._template_engine = JinjaTemplateEngine(PathResolver.get_templates_dir())
+        self._render_cache = DependencyContainer().disk_render_cache
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped.is_set()
+
+    def handle(self, request: Any) -> dict | None:
+        """Handle one decoded JSON-RPC request, returning the response"""
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return self._error(None, INVALID_REQUEST, "Invalid request")
+
+        request_id = request.get("id")
+        method = request["method"]
+        params = request.get("params") or {}
+
+        try:
+            if method == "ping":
+                result: Any = {"workers": self._workers, "pid": os.getpid()}
+            elif method == "shutdown":
+                self.stop()
+                result = {"stopping": True}
+            elif method in ("init", "crud", "feature"):
+                result = self.run_command(
+                    [method, *params.get("argv", [])], params.get("cwd")
+                )
+            else:
+                return self._error(request_id, METHOD_NOT_FOUND, f"Unknown: {method}")
+        except Exception as e:
+            return self._error(request_id, INTERNAL_ERROR, str(e))
+
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    def run_command(self, argv: list[str], cwd: str | None = None) -> dict:
+        """Run a CLI command in this process and capture its output"""
+        from ...cli.main import build_parser, create_container, execute, parse_args
+
+        _parser_output.stdout = []
+        _parser_output.stderr = []
+        formatter = _BufferedFormatter()
+
+        try:
+            parser, commands = build_parser(_DaemonArgumentParser)
+            args = parse_args(parser, commands, argv)
+            self._resolve_paths(args, Path(cwd) if cwd else Path.cwd())
+            self._template_engine.refresh_index()
+            container = create_container(
+                args,
+                template_engine=self._template_engine,
+                formatter=formatter,
+                render_cache=self._render_cache,
+            )
+            with self._project_lock(args):
+                exit_code = execute(container, args)
+        except _ParserExit as e:
+            exit_code = e.status
+
+        return {
+            "exit_code": exit_code,
+            "stdout": "".join(_parser_output.stdout)
+            + "".join(f"{line}\n" for line in formatter.lines),
+            "stderr": "".join(_parser_output.stderr),
+        }
+
+    def serve_socket(self, path: Path) -> None:
+        """Accept connections on a UNIX socket until shut down"""
+        if path.exists():
+            if self._is_alive(path):
+                raise OSError(f"A daemon is already listening on {path}")
+            path.unlink()
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(path))
+        os.chmod(path, 0o600)
+        server.listen()
+        # Wake up regularly to notice a shutdown request
+        server.settimeout(0.5)
+        try:
+            while not self.stopped:
+                try:
+                    connection, _ = server.accept()
+                except TimeoutError:
+                    continue
+                connection.settimeout(None)
+                threading.Thread(
+                    target=self._serve_connection, args=(connection,), daemon=True
+                ).start()
+        finally:
+            server.close()
+            path.unlink(missing_ok=True)
+            self._pool.shutdown(wait=True)
+
+    def serve_stream(self, reader: TextIO, writer: TextIO) -> None:
+        """Serve requests read line by line until EOF or shut down"""
+        write_lock = threading.Lock()
+        pending = []
+        for line in reader:
+            if not line.strip():
+                continue
+            pending.append(self._submit(line, writer, write_lock))
+            if self.stopped:
+                break
+        for future in pending:
+            future.result()
+        self._pool.shutdown(wait=True)
+
+    def stop(self) -> None:
+        """Stop accepting requests"""
+        self._stopped.set()
+
+    def _serve_connection(self, connection: socket.socket) -> None:
+        with connection, connection.makefile("r", encoding="utf-8") as reader:
+            writer = connection.makefile("w", encoding="utf-8")
+            write_lock = threading.Lock()
+            pending = [self._submit(line, writer, write_lock) for line in reader]
+            for future in pending:
+                future.result()
+            writer.close()
+
+    def _submit(self, line: str, writer: TextIO, write_lock: threading.Lock):
+        # Blocks reading while the pool and its queue are full
+        self._slots.acquire()
+
+        def work():
+            try:
+                try:
+                    response = self.handle(json.loads(line))
+                except ValueError as e:
+                    response = self._error(None, PARSE_ERROR, str(e))
+                with write_lock:
+                    writer.write(json.dumps(response) + "\n")
+                    writer.flush()
+            except OSError:
+                # Client went away; nothing to report to
+                pass
+            finally:
+                self._slots.release()
+
+        return self._pool.submit(work)
+
+    def _project_lock(self, args: argparse.Namespace) -> threading.Lock:
+        project = Path(args.path)
+        if args.command == "init":
+            project = project / args.name
+        project = project.resolve()
+        with self._project_locks_guard:
+            return self._project_locks.setdefault(project, threading.Lock())
+
+    @staticmethod
+    def _resolve_paths(args: argparse.Namespace, cwd: Path) -> None:
+        for name in PATH_ARGUMENTS:
+            value = getattr(args, name, None)
+            if value and value != "-":
+                setattr(args, name, str(cwd / value))
+        database = getattr(args, "database", None)
+        if database:
+            args.database = DatabaseSchemaParser.resolve(database, cwd)
+
+    @staticmethod
+    def _is_alive(path: Path) -> bool:
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(path))
+            return True
+        except OSError:
+            return False
+        finally:
+            probe.close()
+
+    @staticmethod
+    def _error(request_id: Any, code: int, message: str) -> dict:
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {"code": code, "message": message},
+        }
+
+
+def serve(args: argparse.Namespace) -> int:
+    """Entry point of ``fastclean serve``"""
+    daemon = GeneratorDaemon(args.workers)
+
+    if args.stdio:
+        # Keep stray prints from corrupting the protocol stream
+        protocol_out, sys.stdout = sys.stdout, sys.stderr
+        daemon.serve_stream(sys.stdin, protocol_out)
+        return 0
+
+    if not hasattr(socket, "AF_UNIX"):
+        print("❌ UNIX sockets are not available here, use --stdio", file=sys.stderr)
+        return 1
+
+    path = Path(args.socket) if args.socket else default_socket_path()
+    print(f"🚀 fastclean daemon listening on {path}", file=sys.stderr)
+    try:
+        daemon.serve_socket(path)
+    except KeyboardInterrupt:
+        daemon.stop()
+    return 0
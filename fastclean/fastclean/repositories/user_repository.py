@@ -17,8 +17,8 @@ class IUserRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_all(self, skip: int = 0, limit: int = 100) -> list[User]:
-        pass
+    async def get_page(self, after: int | None = None, limit: int = 100) -> list[User]:
+        """Up to limit users with an ID above after, in ID order"""
 
     @abstractmethod
     async def update(self, user: User) -> User:
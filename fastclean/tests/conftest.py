@@ -1,4 +1,5 @@
 import asyncio
+import sqlite3
 from collections.abc import Generator
 from pathlib import Path
 
@@ -13,6 +14,13 @@ def event_loop() -> Generator:
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def isolated_render_cache(tmp_path_factory, monkeypatch) -> None:
+    """Keep generated renders out of the user's cache directory."""
+    cache_dir = tmp_path_factory.mktemp("fastclean-cache")
+    monkeypatch.setenv("FASTCLEAN_CACHE_DIR", str(cache_dir))
+
+
 @pytest.fixture
 def temp_project_path(tmp_path: Path) -> Path:
     """Temporary path for project generation tests."""
@@ -38,3 +46,40 @@ def sample_entity_config() -> dict:
         "name": "Product",
         "fields": "name:str,price:float,quantity:int",
     }
+
+
+@pytest.fixture
+def database(tmp_path: Path) -> Path:
+    """Legacy SQLite database to reflect."""
+    path = tmp_path / "legacy.db"
+    connection = sqlite3.connect(path)
+    connection.executescript("""
+        CREATE TABLE customers (
+            id INTEGER PRIMARY KEY,
+            email VARCHAR(255) NOT NULL UNIQUE,
+            nickname TEXT,
+            created_at TIMESTAMP
+        );
+        CREATE TABLE order_items (
+            id INTEGER PRIMARY KEY,
+            customer_id INTEGER NOT NULL REFERENCES customers(id),
+            price NUMERIC(10, 2) NOT NULL,
+            shipped BOOLEAN,
+            shipped_at DATETIME
+        );
+        CREATE INDEX ix_order_items_shipped_at ON order_items (shipped_at);
+        CREATE TABLE orders (
+            order_no INTEGER PRIMARY KEY,
+            "from" VARCHAR(40) NOT NULL,
+            class TEXT
+        );
+        CREATE TABLE order_lines (
+            line INTEGER NOT NULL,
+            order_no INTEGER NOT NULL REFERENCES orders(order_no),
+            sku CHAR(12) NOT NULL,
+            PRIMARY KEY (order_no, line)
+        );
+        CREATE TABLE tags (id INTEGER PRIMARY KEY);
+        """)
+    connection.close()
+    return path
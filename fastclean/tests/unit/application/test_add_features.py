@@ -0,0 +1,183 @@
+from pathlib import Path
+
+import pytest
+
+from fastclean.application.use_cases.add_feature.add_caching import (
+    AddCachingUseCase,
+)
+from fastclean.application.use_cases.add_feature.add_features import (
+    FEATURES,
+    AddFeaturesUseCase,
+)
+from fastclean.application.use_cases.add_feature.dto import (
+    AddCachingRequest,
+    AddFeaturesRequest,
+)
+from fastclean.application.use_cases.add_feature.edits import (
+    FeatureEdits,
+    patch_main,
+    patch_requirements,
+)
+from fastclean.core.exceptions.base import ValidationException
+from fastclean.core.exceptions.validation import (
+    FeatureConflictException,
+    UnknownFeatureException,
+)
+from fastclean.infrastructure.file_system.in_memory_file_system import (
+    InMemoryFileSystemService,
+)
+from fastclean.infrastructure.templates.jinja_engine import JinjaTemplateEngine
+
+PROJECT = Path("/p")
+
+MAIN = """from fastapi import FastAPI
+
+from .interfaces.api.v1.routes import user
+
+app = FastAPI()
+
+app.include_router(user.router, prefix="/api/v1")
+
+@app.get("/health")
+async def health_check():
+    return {"status": "healthy"}
+"""
+
+
+class CountingFileSystem(InMemoryFileSystemService):
+    """In-memory file system counting writes per file."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes: dict[Path, int] = {}
+
+    def create_file(self, path: Path, content: str) -> None:
+        self.writes[path] = self.writes.get(path, 0) + 1
+        super().create_file(path, content)
+
+
+@pytest.fixture
+def file_system() -> CountingFileSystem:
+    file_system = CountingFileSystem()
+    file_system.create_file(PROJECT / "requirements.txt", "fastapi==0.104.1\n")
+    file_system.create_file(PROJECT / "src/main.py", MAIN)
+    file_system.create_file(
+        PROJECT / "src/infrastructure/config/settings.py",
+        "class Settings(BaseSettings):\n"
+        '    APP_NAME: str = "p"\n'
+        "\n"
+        "    class Config:\n"
+        '        env_file = ".env"\n',
+    )
+    file_system.writes.clear()
+    return file_system
+
+
+def add(file_system, features: list[str]):
+    use_case = AddFeaturesUseCase(file_system, JinjaTemplateEngine())
+    return use_case.execute(AddFeaturesRequest(PROJECT, features))
+
+
+class TestAddFeatures:
+    """Tests for adding several features in one pass."""
+
+    def test_shared_files_written_once(self, file_system):
+        """Test every shared file is patched by all features in one write."""
+        response = add(file_system, ["jwt", "redis", "prometheus"])
+
+        main = file_system.read_file(PROJECT / "src/main.py")
+        for line in (
+            "from .interfaces.api.v1.routes import auth",
+            "from .infrastructure.cache.redis_client import cache",
+            "from prometheus_client import make_asgi_app",
+            'app.include_router(auth.router, prefix="/api/v1")',
+            'app.mount("/metrics", make_asgi_app())',
+        ):
+            assert line in main
+        # Imports stay above the app, routers after the existing ones
+        assert main.index("import auth") < main.index("app = FastAPI()")
+        assert main.index("user.router") < main.index("auth.router")
+
+        settings = file_system.read_file(
+            PROJECT / "src/infrastructure/config/settings.py"
+        )
+        assert settings.index("REDIS_URL") < settings.index("class Config")
+        assert "SECRET_KEY" in settings
+
+        for path in response.files_modified:
+            assert file_system.writes[path] == 1
+        assert len(response.files_modified) == 3
+        assert PROJECT / "src/infrastructure/cache/redis_client.py" in (
+            response.files_created
+        )
+
+    def test_adding_again_changes_nothing(self, file_system):
+        """Test features already present are not added twice."""
+        add(file_system, ["jwt", "redis"])
+        requirements = file_system.read_file(PROJECT / "requirements.txt")
+
+        response = add(file_system, ["redis", "jwt", "redis"])
+
+        assert response.files_created == response.files_modified == []
+        assert file_system.read_file(PROJECT / "requirements.txt") == requirements
+        assert requirements.count("redis") == 1
+
+    def test_unknown_feature(self, file_system):
+        """Test unknown features are rejected before anything is written."""
+        with pytest.raises(UnknownFeatureException):
+            add(file_system, ["redis", "kafka"])
+
+        assert file_system.writes == {}
+        with pytest.raises(UnknownFeatureException):
+            add(file_system, ["memcached"])
+
+    def test_one_feature_per_kind(self, file_system, monkeypatch):
+        """Test two features of the same kind are rejected before writing."""
+        monkeypatch.setitem(FEATURES, "valkey", "cache")
+
+        with pytest.raises(ValidationException, match="one cache feature"):
+            add(file_system, ["redis", "valkey"])
+
+        assert file_system.writes == {}
+
+    def test_unsupported_cache_type(self, file_system):
+        """Test a cache type without an implementation fails instead of no-op."""
+        use_case = AddCachingUseCase(file_system, JinjaTemplateEngine())
+
+        with pytest.raises(ValidationException):
+            use_case.execute(AddCachingRequest(PROJECT, "memcached"))
+
+        assert file_system.writes == {}
+
+
+class TestFeatureEdits:
+    """Tests for merging and applying feature edits."""
+
+    def test_requirements_deduplicated_by_package(self):
+        """Test names are compared without extras, versions or case."""
+        content = "# Auth\nPasslib==1.7.2\n"
+
+        patched = patch_requirements(
+            content, ["passlib[bcrypt]==1.7.4", "python_multipart==0.0.6"]
+        )
+
+        assert patched == content + "python_multipart==0.0.6\n"
+
+    def test_conflicting_edits(self):
+        """Test two features pinning one package differently conflict."""
+        first = FeatureEdits(requirements=["redis==5.0.1"], settings=["A: int = 1"])
+
+        merged = first.merge(FeatureEdits(requirements=["redis==5.0.1"]))
+        assert merged.requirements == ["redis==5.0.1"]
+        with pytest.raises(FeatureConflictException):
+            first.merge(FeatureEdits(requirements=["redis==4.0.0"]))
+        with pytest.raises(FeatureConflictException):
+            first.merge(FeatureEdits(settings=["A: int = 2"]))
+
+    def test_main_after_parenthesized_import(self):
+        """Test imports are not inserted inside a multi-line import."""
+        content = "from a import (\n    b,\n)\n\napp = FastAPI()\n"
+
+        patched = patch_main(content, ["import c"], [])
+
+        assert patched == "from a import (\n    b,\n)\nimport c\n\napp = FastAPI()\n"
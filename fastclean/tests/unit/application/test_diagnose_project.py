@@ -0,0 +1,109 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from fastclean.application.analysis.findings import HIGH
+from fastclean.application.use_cases.create_project.create_project import (
+    CreateProjectUseCase,
+)
+from fastclean.application.use_cases.create_project.dto import CreateProjectRequest
+from fastclean.application.use_cases.diagnose_project.diagnose_project import (
+    DiagnoseProjectUseCase,
+)
+from fastclean.application.use_cases.diagnose_project.dto import (
+    DiagnoseProjectRequest,
+)
+from fastclean.core.exceptions.validation import InvalidPathException
+from fastclean.core.value_objects.project_config import ProjectConfig
+from fastclean.infrastructure.file_system.local_file_system import (
+    LocalFileSystemService,
+)
+from fastclean.infrastructure.templates.jinja_engine import JinjaTemplateEngine
+from fastclean.infrastructure.validators.project_validator import ProjectValidator
+from fastclean.presentation.cli.doctor_command import DoctorCommand
+
+SOURCE = """\
+import asyncio
+import time
+
+
+class Importer:
+    async def run(self, session, rows):
+        time.sleep(1)
+        for row in rows:
+            await session.merge(row)
+        await session.commit()
+
+    async def setup(self, engine, metadata):
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+
+
+def main():
+    asyncio.run(Importer().run(None, []))
+"""
+
+
+def diagnose(root: Path, include_tests: bool = False):
+    use_case = DiagnoseProjectUseCase(LocalFileSystemService())
+    return use_case.execute(DiagnoseProjectRequest(root, include_tests))
+
+
+def rules(response) -> set[str]:
+    return {finding.rule for finding in response.findings}
+
+
+class TestDiagnoseProject:
+    """Tests for the static performance analyzer."""
+
+    def test_generated_project(self, tmp_path: Path):
+        """Test the anti-patterns of a generated project are found and ranked."""
+        CreateProjectUseCase(
+            LocalFileSystemService(), JinjaTemplateEngine(), ProjectValidator()
+        ).execute(CreateProjectRequest("demo", tmp_path, ProjectConfig()))
+
+        response = diagnose(tmp_path / "demo")
+
+        assert {"sql-echo", "debug-default-true"} <= rules(response)
+        assert not response.errors
+        impacts = [finding.impact for finding in response.findings]
+        assert impacts == sorted(impacts, reverse=True)
+
+    def test_synthetic_source(self, tmp_path: Path):
+        """Test async rules fire on their patterns, and tests are skipped."""
+        (tmp_path / "importer.py").write_text(SOURCE)
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests/test_slow.py").write_text(SOURCE)
+        (tmp_path / "broken.py").write_text("def broken(:\n")
+
+        response = diagnose(tmp_path)
+
+        assert rules(response) == {
+            "blocking-call-in-async",
+            "await-in-loop",
+            "create-all-at-startup",
+        }
+        assert response.files_analyzed == 1
+        assert list(response.errors) == [tmp_path / "broken.py"]
+        assert len(diagnose(tmp_path, include_tests=True).findings) == 6
+
+    def test_missing_directory(self, tmp_path: Path):
+        """Test analyzing a missing directory fails."""
+        with pytest.raises(InvalidPathException):
+            diagnose(tmp_path / "missing")
+
+    def test_json_report_and_fail_on(self, tmp_path: Path):
+        """Test the JSON report and the --fail-on exit status."""
+        (tmp_path / "importer.py").write_text(SOURCE)
+        report = tmp_path / "report.json"
+        command = DoctorCommand(DiagnoseProjectUseCase(LocalFileSystemService()))
+        args = {"path": str(tmp_path), "json": str(report)}
+
+        assert command.execute({**args, "fail_on": HIGH}) == 1
+        assert command.execute({**args, "fail_on": None}) == 0
+
+        data = json.loads(report.read_text())
+        assert data["version"] == 1
+        assert data["findings"][0]["rule"] == "blocking-call-in-async"
+        assert data["findings"][0]["path"] == "importer.py"
@@ -0,0 +1,85 @@
+import os
+from pathlib import Path
+
+from fastclean.application.generation.directories import DirectoryPlanner
+from fastclean.application.generation.profiler import Profiler
+from fastclean.infrastructure.file_system.in_memory_file_system import (
+    InMemoryFileSystemService,
+)
+from fastclean.infrastructure.file_system.local_file_system import (
+    LocalFileSystemService,
+)
+
+FILES = [
+    Path("src/main.py"),
+    Path("src/domain/entities/user.py"),
+    Path("src/domain/entities/product.py"),
+    Path("tests/unit/test_user.py"),
+]
+
+
+class TestDirectoryPlanner:
+    """Tests for planning the directories of a generation run."""
+
+    def test_plans_only_the_deepest_directories(self):
+        """Test directories holding other planned directories are implied."""
+        plan = (
+            DirectoryPlanner(Path("/p"))
+            .add_files(FILES)
+            .add_packages([Path("src"), Path("src/domain/value_objects")])
+            .plan()
+        )
+
+        assert plan.directories == (
+            Path("/p/src/domain/entities"),
+            Path("/p/src/domain/value_objects"),
+            Path("/p/tests/unit"),
+        )
+        assert plan.markers == (
+            Path("/p/src/__init__.py"),
+            Path("/p/src/domain/value_objects/__init__.py"),
+        )
+        # Two package directories, four files and two markers
+        assert plan.unplanned_mkdir_calls == 8
+
+    def test_apply_keeps_existing_markers(self):
+        """Test markers are only written where missing, with stats."""
+        file_system = InMemoryFileSystemService()
+        file_system.create_file(Path("/p/src/__init__.py"), "# keep")
+        profiler = Profiler()
+        plan = (
+            DirectoryPlanner(Path("/p")).add_packages([Path("src"), Path(".")]).plan()
+        )
+
+        stats = plan.apply(file_system, profiler)
+
+        assert file_system.read_file(Path("/p/src/__init__.py")) == "# keep"
+        assert file_system.file_exists(Path("/p/__init__.py"))
+        assert stats.markers == 1
+        assert profiler.counters["mkdir_calls"] == stats.mkdir_calls == 1
+        assert profiler.counters["mkdir_calls_saved"] == 3
+
+    def test_local_writes_need_no_mkdir_after_planning(
+        self, tmp_path: Path, monkeypatch
+    ):
+        """Test one mkdir per new directory, and none while writing files."""
+        calls = []
+        real_mkdir = os.mkdir
+
+        def mkdir(path, *args, **kwargs):
+            calls.append(Path(path))
+            return real_mkdir(path, *args, **kwargs)
+
+        monkeypatch.setattr(os, "mkdir", mkdir)
+        file_system = LocalFileSystemService()
+        plan = DirectoryPlanner(tmp_path / "p").add_files(FILES).plan()
+
+        plan.apply(file_system)
+        created = len(calls)
+        for path in FILES:
+            file_system.create_file(tmp_path / "p" / path, "")
+
+        assert len(calls) == created
+        new = [".", "src", "src/domain", "src/domain/entities", "tests", "tests/unit"]
+        assert set(calls) == {tmp_path / "p" / directory for directory in new}
+        assert all((tmp_path / "p" / path).is_file() for path in FILES)
@@ -0,0 +1,196 @@
+import ast
+import json
+from pathlib import Path
+
+import pytest
+
+from fastclean.application.use_cases.generate_crud.dto import GenerateCRUDBatchRequest
+from fastclean.application.use_cases.generate_crud.generate_crud import (
+    GenerateCRUDUseCase,
+)
+from fastclean.application.use_cases.generate_crud.generate_crud_batch import (
+    GenerateCRUDBatchUseCase,
+)
+from fastclean.core.exceptions.base import ValidationException
+from fastclean.infrastructure.file_system.local_file_system import (
+    LocalFileSystemService,
+)
+from fastclean.infrastructure.templates.jinja_engine import JinjaTemplateEngine
+from fastclean.presentation.parsers.database_schema import DatabaseSchemaParser
+from fastclean.presentation.parsers.entity_manifest import EntityManifestParser
+
+
+@pytest.fixture
+def batch_usecase() -> GenerateCRUDBatchUseCase:
+    file_system = LocalFileSystemService()
+    engine = JinjaTemplateEngine()
+    return GenerateCRUDBatchUseCase(
+        GenerateCRUDUseCase(file_system, engine), file_system, engine
+    )
+
+
+@pytest.fixture
+def manifest(tmp_path: Path) -> Path:
+    path = tmp_path / "entities.json"
+    path.write_text(
+        json.dumps(
+            {
+                "entities": [
+                    {"name": "Product", "fields": "name:str,price:float"},
+                    {
+                        "name": "Order",
+                        "tests": False,
+                        "pagination": "offset",
+                        "fields": {"total": "float"},
+                    },
+                    {"name": "Invoice", "fields": [{"name": "number", "type": "int"}]},
+                ]
+            }
+        )
+    )
+    return path
+
+
+class TestEntityManifestParser:
+    """Tests for entity manifest parsing."""
+
+    def test_field_formats(self, manifest: Path, tmp_path: Path):
+        """Test string, mapping and list field definitions."""
+        requests = EntityManifestParser().parse(manifest, tmp_path)
+
+        assert [r.entity_name for r in requests] == ["Product", "Order", "Invoice"]
+        assert [f.name for f in requests[0].fields] == ["name", "price"]
+        assert requests[1].fields[0].type == "float"
+        assert requests[1].generate_tests is False
+        assert [r.pagination for r in requests] == ["keyset", "offset", "keyset"]
+        assert requests[2].fields[0].type == "int"
+
+    def test_missing_entities(self, tmp_path: Path):
+        """Test an empty manifest is rejected."""
+        path = tmp_path / "empty.json"
+        path.write_text("{}")
+
+        with pytest.raises(ValidationException):
+            EntityManifestParser().parse(path, tmp_path)
+
+
+class TestGenerateCRUDBatchUseCase:
+    """Tests for batch CRUD generation."""
+
+    def test_generates_all_entities(self, batch_usecase, manifest, tmp_path: Path):
+        """Test every entity is generated and shared files written once."""
+        entities = EntityManifestParser().parse(manifest, tmp_path)
+
+        response = batch_usecase.execute(
+            GenerateCRUDBatchRequest(tmp_path, entities, jobs=3)
+        )
+
+        assert [r.entity_name for r in response.results] == [
+            "Product",
+            "Order",
+            "Invoice",
+        ]
+        api = tmp_path / "src" / "interfaces" / "api"
+        dependencies = api / "dependencies.py"
+        assert response.shared_files == [dependencies, api / "registry.py"]
+        content = dependencies.read_text()
+        for name in ["product", "order", "invoice"]:
+            assert content.count(f"def get_{name}_repository(") == 1
+
+    def test_keeps_earlier_providers(self, batch_usecase, manifest, tmp_path: Path):
+        """Test a batch adds to the providers of entities generated before it."""
+        first, *rest = EntityManifestParser().parse(manifest, tmp_path)
+        batch_usecase.execute(GenerateCRUDBatchRequest(tmp_path, [first]))
+
+        batch_usecase.execute(GenerateCRUDBatchRequest(tmp_path, rest))
+
+        content = (tmp_path / "src/interfaces/api/dependencies.py").read_text()
+        for name in ["product", "order", "invoice"]:
+            assert f"def get_{name}_repository(" in content
+
+    def test_duplicate_entities(self, batch_usecase, manifest, tmp_path: Path):
+        """Test an entity defined twice is rejected before writing."""
+        entities = EntityManifestParser().parse(manifest, tmp_path)
+
+        with pytest.raises(ValidationException):
+            batch_usecase.execute(
+                GenerateCRUDBatchRequest(tmp_path, entities + entities[:1])
+            )
+        assert not (tmp_path / "src").exists()
+
+    def test_pagination_styles(self, batch_usecase, manifest, tmp_path: Path):
+        """Test lists seek past a cursor unless offset is opted into."""
+        entities = EntityManifestParser().parse(manifest, tmp_path)
+
+        batch_usecase.execute(GenerateCRUDBatchRequest(tmp_path, entities))
+
+        src = tmp_path / "src"
+        repositories = src / "infrastructure" / "database" / "repositories"
+        product = (repositories / "product_repository.py").read_text()
+        assert "async def get_page(" in product
+        assert "ProductModel.id > after" in product
+        assert ".offset(" not in product
+        assert ".offset(skip)" in (repositories / "order_repository.py").read_text()
+
+        routes = src / "interfaces" / "api" / "v1" / "routes"
+        for name in ["product", "order"]:
+            ast.parse((routes / f"{name}.py").read_text())
+            ast.parse((src / "interfaces" / "schemas" / f"{name}.py").read_text())
+        assert "response_model=ProductPage" in (routes / "product.py").read_text()
+        assert "skip: int" in (routes / "order.py").read_text()
+
+    def test_unknown_pagination(self, batch_usecase, manifest, tmp_path: Path):
+        """Test an unknown pagination style is rejected before writing."""
+        entities = EntityManifestParser().parse(manifest, tmp_path)
+        entities[0].pagination = "page"
+
+        with pytest.raises(ValidationException):
+            batch_usecase.execute(GenerateCRUDBatchRequest(tmp_path, entities))
+        assert not (tmp_path / "src").exists()
+
+    def test_keyset_needs_single_key(self, batch_usecase, database, tmp_path: Path):
+        """Test keyset pagination is rejected for a composite primary key."""
+        entities = DatabaseSchemaParser().parse(str(database), tmp_path)
+        entities[2].pagination = "keyset"
+
+        with pytest.raises(ValidationException, match="OrderLine"):
+            batch_usecase.execute(GenerateCRUDBatchRequest(tmp_path, entities))
+
+    def test_generates_database(self, batch_usecase, database, tmp_path: Path):
+        """Test a reflected database generates valid models for every table."""
+        entities = DatabaseSchemaParser().parse(str(database), tmp_path)
+
+        batch_usecase.execute(GenerateCRUDBatchRequest(tmp_path, entities, jobs=2))
+
+        models = tmp_path / "src" / "infrastructure" / "database" / "models"
+        model = (models / "order_item_model.py").read_text()
+        ast.parse(model)
+        assert '__tablename__ = "order_items"' in model
+        assert (
+            'customer_id = Column(Integer, ForeignKey("customers.id"), nullable=False)'
+            in model
+        )
+        assert "shipped_at = Column(DateTime, nullable=True, index=True)" in model
+        assert "created_at" not in model
+        assert "created_at = Column" in (models / "customer_model.py").read_text()
+
+    def test_database_models_match_tables(
+        self, batch_usecase, database, tmp_path: Path
+    ):
+        """Test reflected keys and keyword columns map onto the real columns."""
+        entities = DatabaseSchemaParser().parse(str(database), tmp_path)
+
+        batch_usecase.execute(GenerateCRUDBatchRequest(tmp_path, entities))
+
+        for path in (tmp_path / "src").rglob("*.py"):
+            ast.parse(path.read_text())
+        models = tmp_path / "src" / "infrastructure" / "database" / "models"
+        order = (models / "order_model.py").read_text()
+        assert "order_no = Column(Integer, primary_key=True)" in order
+        assert 'from_ = Column("from", String(40), nullable=False)' in order
+        assert "id = Column" not in order
+        lines = (models / "order_line_model.py").read_text()
+        assert lines.index("order_no = Column") < lines.index("line = Column")
+        repositories = tmp_path / "src" / "infrastructure" / "database" / "repositories"
+        repository = (repositories / "order_line_repository.py").read_text()
+        assert "(entity.order_no, entity.line)" in repository
@@ -0,0 +1,165 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from fastclean.application.generation.events import (
+    PLANNED,
+    RENDERED,
+    SKIPPED,
+    WRITTEN,
+    drain,
+)
+from fastclean.application.use_cases.create_project.create_project import (
+    CreateProjectUseCase,
+)
+from fastclean.application.use_cases.create_project.dto import CreateProjectRequest
+from fastclean.application.use_cases.generate_crud.dto import (
+    FieldDefinition,
+    GenerateCRUDRequest,
+)
+from fastclean.application.use_cases.generate_crud.generate_crud import (
+    GenerateCRUDUseCase,
+)
+from fastclean.core.value_objects.project_config import ProjectConfig
+from fastclean.infrastructure.file_system.local_file_system import (
+    LocalFileSystemService,
+)
+from fastclean.infrastructure.file_system.transactional_file_system import (
+    TransactionalFileSystemService,
+)
+from fastclean.infrastructure.templates.jinja_engine import JinjaTemplateEngine
+from fastclean.infrastructure.validators.project_validator import ProjectValidator
+
+
+def create_project(file_system) -> CreateProjectUseCase:
+    return CreateProjectUseCase(file_system, JinjaTemplateEngine(), ProjectValidator())
+
+
+class TestGenerationEvents:
+    """Tests for streaming per-file generation events."""
+
+    @pytest.mark.parametrize("jobs", [1, 4])
+    def test_project_stream(self, tmp_path: Path, jobs: int):
+        """Test every planned file is rendered and written, in plan order."""
+        request = CreateProjectRequest("demo", tmp_path, ProjectConfig(), jobs=jobs)
+        events = []
+
+        response = drain(
+            create_project(LocalFileSystemService()).stream(request), events.append
+        )
+
+        planned = [event for event in events if event.kind == PLANNED]
+        written = [event for event in events if event.kind == WRITTEN]
+        assert planned and events[: len(planned)] == planned
+        assert [event.path for event in written] == [event.path for event in planned]
+        assert [event.index for event in written] == list(range(1, len(planned) + 1))
+        assert sum(event.kind == RENDERED for event in events) == len(planned)
+        assert sum(event.bytes_written for event in written) == sum(
+            event.path.stat().st_size for event in written
+        )
+        assert response.files_created >= len(written)
+
+    def test_update_skips_unchanged(self, tmp_path: Path):
+        """Test regenerating an unchanged project yields only skipped files."""
+        use_case = create_project(LocalFileSystemService())
+        request = CreateProjectRequest("demo", tmp_path, ProjectConfig())
+        use_case.execute(request)
+        request.update = True
+        events = []
+
+        response = drain(use_case.stream(request), events.append)
+
+        done = [event for event in events if event.done]
+        assert done and all(event.kind == SKIPPED for event in done)
+        assert response.files_unchanged == len(done)
+
+    def test_closing_stream_rolls_back(self, tmp_path: Path):
+        """Test abandoning a stream leaves no project behind."""
+        request = CreateProjectRequest("demo", tmp_path, ProjectConfig())
+        stream = create_project(TransactionalFileSystemService()).stream(request)
+
+        next(event for event in stream if event.kind == WRITTEN)
+        stream.close()
+
+        assert not list(tmp_path.iterdir())
+
+
+class TestAsyncExecution:
+    """Tests for running use cases inside an event loop."""
+
+    def test_runs_concurrently(self, tmp_path: Path):
+        """Test several generations share one loop without blocking it."""
+        ticks = 0
+
+        async def heartbeat() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        (tmp_path / "three").mkdir()
+
+        async def scenario() -> list:
+            beating = asyncio.create_task(heartbeat())
+            file_system = TransactionalFileSystemService()
+            responses = await asyncio.gather(
+                create_project(file_system).execute_async(
+                    CreateProjectRequest("one", tmp_path, ProjectConfig())
+                ),
+                create_project(file_system).execute_async(
+                    CreateProjectRequest("two", tmp_path, ProjectConfig())
+                ),
+                GenerateCRUDUseCase(file_system, JinjaTemplateEngine()).execute_async(
+                    GenerateCRUDRequest(
+                        "Product", tmp_path / "three", [FieldDefinition("name", "str")]
+                    )
+                ),
+            )
+            beating.cancel()
+            return responses
+
+        one, two, crud = asyncio.run(scenario())
+
+        assert one.files_created == two.files_created > 0
+        assert crud.files_created
+        assert ticks > 3
+
+    def test_cancel_rolls_back(self, tmp_path: Path):
+        """Test cancelling a run leaves no project behind."""
+        request = CreateProjectRequest("demo", tmp_path, ProjectConfig())
+        use_case = create_project(TransactionalFileSystemService())
+
+        async def scenario() -> None:
+            written = asyncio.Event()
+
+            def on_event(event) -> None:
+                if event.kind == WRITTEN:
+                    written.set()
+
+            task = asyncio.create_task(use_case.execute_async(request, on_event))
+            await written.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(scenario())
+
+        assert not list(tmp_path.iterdir())
+
+    def test_runs_on_one_use_case_are_isolated(self, tmp_path: Path):
+        """Test a run's commit never publishes another run's staged files."""
+        use_case = create_project(TransactionalFileSystemService())
+        victim = use_case.stream(
+            CreateProjectRequest("victim", tmp_path, ProjectConfig())
+        )
+        next(event for event in victim if event.kind == WRITTEN)
+
+        asyncio.run(
+            use_case.execute_async(
+                CreateProjectRequest("survivor", tmp_path, ProjectConfig())
+            )
+        )
+        victim.close()
+
+        assert [path.name for path in tmp_path.iterdir()] == ["survivor"]
@@ -0,0 +1,113 @@
+from pathlib import Path
+
+import pytest
+
+from fastclean.application.generation.executor import RenderExecutor, RenderJob
+from fastclean.application.generation.plan import GenerationPlan, PlanNode
+from fastclean.application.use_cases.generate_crud.dto import GenerateCRUDRequest
+from fastclean.application.use_cases.generate_crud.generate_crud import (
+    GenerateCRUDUseCase,
+)
+from fastclean.application.use_cases.generate_crud.plan import CRUD_PLAN
+from fastclean.core.exceptions.validation import InvalidPlanException
+from fastclean.infrastructure.file_system.in_memory_file_system import (
+    InMemoryFileSystemService,
+)
+from fastclean.infrastructure.templates.jinja_engine import JinjaTemplateEngine
+
+
+def _locate(job: RenderJob) -> Path:
+    return Path(f"{job.template_name}.txt")
+
+
+def _names(plan: GenerationPlan, context: dict | None = None) -> list[str]:
+    return [job.name for job in plan.schedule(context or {}, _locate)]
+
+
+class TestGenerationPlan:
+    """Tests for declarative generation plans."""
+
+    def test_keeps_insertion_order_without_dependencies(self):
+        """Test independent nodes are scheduled in the order they were added."""
+        plan = GenerationPlan(PlanNode(name, name, "crud") for name in "cab")
+
+        assert _names(plan) == ["c", "a", "b"]
+
+    def test_dependencies_are_scheduled_first(self):
+        """Test a node comes after everything it depends on."""
+        plan = GenerationPlan(
+            [
+                PlanNode("routes", "routes", "crud", depends_on=("schemas",)),
+                PlanNode("schemas", "schemas", "crud", depends_on=("entity",)),
+                PlanNode("entity", "entity", "crud"),
+            ]
+        )
+
+        assert _names(plan) == ["entity", "schemas", "routes"]
+
+    def test_conditions_drop_nodes_and_their_edges(self):
+        """Test nodes whose condition is false are left out."""
+        plan = GenerationPlan(
+            [
+                PlanNode("tests", "tests", "crud", condition="has_tests"),
+                PlanNode("entity", "entity", "crud", depends_on=("tests",)),
+            ]
+        )
+
+        assert _names(plan, {"has_tests": False}) == ["entity"]
+        assert _names(plan, {"has_tests": True}) == ["tests", "entity"]
+
+    def test_shared_outputs_are_deduplicated(self):
+        """Test nodes writing one file with one template become one job."""
+        plan = GenerationPlan(
+            [
+                PlanNode("a", "deps", "crud", "shared.py"),
+                PlanNode("b", "deps", "crud", "shared.py"),
+                PlanNode("c", "entity", "crud", depends_on=("b",)),
+            ]
+        )
+
+        planned = plan.schedule({}, _locate)
+
+        assert [job.name for job in planned] == ["a", "c"]
+        assert planned[1].depends_on == ("a",)
+
+    def test_conflicting_outputs_are_rejected(self):
+        """Test two templates cannot write the same file."""
+        plan = GenerationPlan(
+            [
+                PlanNode("a", "one", "crud", "{name}.py"),
+                PlanNode("b", "two", "crud", "{name}.py"),
+            ]
+        )
+
+        with pytest.raises(InvalidPlanException, match="both write x.py"):
+            plan.schedule({"name": "x"}, _locate)
+
+    def test_cycles_are_rejected(self):
+        """Test a dependency cycle is reported with its path."""
+        plan = GenerationPlan(
+            [
+                PlanNode("a", "a", "crud", depends_on=("b",)),
+                PlanNode("b", "b", "crud", depends_on=("a",)),
+            ]
+        )
+
+        with pytest.raises(InvalidPlanException, match="a -> b -> a"):
+            plan.schedule({}, _locate)
+
+    def test_crud_plan_runs_through_executor(self):
+        """Test the CRUD plan renders every file it schedules."""
+        file_system = InMemoryFileSystemService()
+        engine = JinjaTemplateEngine()
+        executor = RenderExecutor(file_system, engine, jobs=4)
+        context = GenerateCRUDUseCase(file_system, engine).build_context(
+            GenerateCRUDRequest("Product", Path("/p"), [], generate_tests=False)
+        )
+
+        planned = executor.plan(CRUD_PLAN, context)
+        results = executor.run_plan(CRUD_PLAN, context, Path("/p"))
+
+        assert [r.path for r in results] == [Path("/p") / job.path for job in planned]
+        assert all(file_system.file_exists(r.path) for r in results)
+        assert not any("tests" in job.path.parts for job in planned)
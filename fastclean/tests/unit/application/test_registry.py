@@ -0,0 +1,162 @@
+import ast
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from fastclean.application.generation.lock import GenerationLock
+from fastclean.application.use_cases.create_project.create_project import (
+    CreateProjectUseCase,
+)
+from fastclean.application.use_cases.create_project.dto import CreateProjectRequest
+from fastclean.application.use_cases.generate_crud.dto import (
+    FieldDefinition,
+    GenerateCRUDRequest,
+)
+from fastclean.application.use_cases.generate_crud.generate_crud import (
+    GenerateCRUDUseCase,
+)
+from fastclean.core.exceptions.base import ValidationException
+from fastclean.core.value_objects.project_config import ProjectConfig
+from fastclean.infrastructure.file_system.local_file_system import (
+    LocalFileSystemService,
+)
+from fastclean.infrastructure.file_system.transactional_file_system import (
+    TransactionalFileSystemService,
+)
+from fastclean.infrastructure.templates.jinja_engine import JinjaTemplateEngine
+from fastclean.infrastructure.validators.project_validator import ProjectValidator
+
+# dependencies.py of a project generated before .fastclean.lock, as the old
+# generator appended it, one provider per run
+PRE_LOCK_DEPENDENCIES = """from fastapi import Depends
+from ...infrastructure.database.repositories.customer_repository import CustomerRepository
+
+def get_customer_repository(session=Depends(get_db)) -> CustomerRepository:
+    return CustomerRepository(session)
+
+
+from ...infrastructure.database.repositories.line_item_repository import LineItemRepository
+
+def get_line_item_repository(session=Depends(get_db)) -> LineItemRepository:
+    return LineItemRepository(session)
+"""
+
+
+def create_project(tmp_path: Path) -> Path:
+    CreateProjectUseCase(
+        LocalFileSystemService(), JinjaTemplateEngine(), ProjectValidator()
+    ).execute(CreateProjectRequest("demo", tmp_path, ProjectConfig()))
+    return tmp_path / "demo"
+
+
+def generate_crud(root: Path, entity: str):
+    use_case = GenerateCRUDUseCase(LocalFileSystemService(), JinjaTemplateEngine())
+    return use_case.execute(
+        GenerateCRUDRequest(entity, root, [FieldDefinition("name", "str")])
+    )
+
+
+def generate_crud_transactional(root: Path, entity: str) -> None:
+    use_case = GenerateCRUDUseCase(
+        TransactionalFileSystemService(durable=False), JinjaTemplateEngine()
+    )
+    use_case.execute(
+        GenerateCRUDRequest(entity, root, [FieldDefinition("name", "str")])
+    )
+
+
+def registry(root: Path) -> str:
+    return (root / "src/interfaces/api/registry.py").read_text()
+
+
+class TestRouteRegistry:
+    """Tests for the registry rebuilt from the generation lock."""
+
+    def test_new_project(self, tmp_path: Path):
+        """Test a new project's app includes every registered router."""
+        root = create_project(tmp_path)
+
+        assert "from .interfaces.api.registry import ROUTERS" in (
+            (root / "src/main.py").read_text()
+        )
+        assert "user.router," in registry(root)
+        assert not (root / "src/interfaces/api/dependencies.py").exists()
+
+    def test_separate_runs_accumulate(self, tmp_path: Path):
+        """Test each CRUD run registers all entities generated so far."""
+        root = create_project(tmp_path)
+
+        generate_crud(root, "Product")
+        generate_crud(root, "Order")
+
+        content = registry(root)
+        ast.parse(content)
+        for name in ("order", "product", "user"):
+            assert f"    {name}.router,\n" in content
+        assert '"product": get_product_repository' in content
+        dependencies = (root / "src/interfaces/api/dependencies.py").read_text()
+        assert "def get_product_repository(" in dependencies
+        assert "def get_order_repository(" in dependencies
+        lock = GenerationLock.load(LocalFileSystemService(), root)
+        assert lock.entities == {"Order": "order", "Product": "product"}
+
+    def test_rerun_leaves_registry_unchanged(self, tmp_path: Path):
+        """Test regenerating an entity does not rewrite the registry."""
+        root = create_project(tmp_path)
+        generate_crud(root, "Product")
+        content = registry(root)
+
+        response = generate_crud(root, "Product")
+
+        assert registry(root) == content
+        assert root / "src/interfaces/api/registry.py" in response.files_unchanged
+
+    def test_pre_lock_providers_kept(self, tmp_path: Path):
+        """Test providers appended before the lock existed survive a rebuild."""
+        dependencies = tmp_path / "src/interfaces/api/dependencies.py"
+        dependencies.parent.mkdir(parents=True)
+        dependencies.write_text(PRE_LOCK_DEPENDENCIES)
+
+        generate_crud(tmp_path, "Product")
+
+        content = dependencies.read_text()
+        for name in ("customer", "line_item", "product"):
+            assert f"def get_{name}_repository(" in content
+            assert f"    {name}.router,\n" in registry(tmp_path)
+        lock = GenerationLock.load(LocalFileSystemService(), tmp_path)
+        assert lock.entities == {
+            "Customer": "customer",
+            "LineItem": "line_item",
+            "Product": "product",
+        }
+
+    def test_unknown_pre_lock_provider(self, tmp_path: Path):
+        """Test a provider whose entity is unknown is never deleted."""
+        dependencies = tmp_path / "src/interfaces/api/dependencies.py"
+        dependencies.parent.mkdir(parents=True)
+        content = "def get_audit_repository():\n    return AuditLog()\n"
+        dependencies.write_text(content)
+
+        with pytest.raises(ValidationException):
+            generate_crud(tmp_path, "Product")
+
+        assert dependencies.read_text() == content
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(),
+        reason="needs fork",
+    )
+    def test_concurrent_processes_keep_every_entity(self, tmp_path: Path):
+        """Test parallel runs on one project all land in the lock and registry."""
+        names = [f"Entity{i}" for i in range(6)]
+        with ProcessPoolExecutor(
+            len(names), mp_context=multiprocessing.get_context("fork")
+        ) as pool:
+            list(pool.map(generate_crud_transactional, [tmp_path] * len(names), names))
+
+        lock = GenerationLock.load(LocalFileSystemService(), tmp_path)
+        assert sorted(lock.entities) == names
+        for i in range(len(names)):
+            assert f"    entity{i}.router,\n" in registry(tmp_path)
@@ -0,0 +1,162 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from fastclean.application.generation.executor import (
+    CREATED,
+    UNCHANGED,
+    UPDATED,
+    RenderExecutor,
+    RenderJob,
+)
+from fastclean.application.generation.lock import LOCK_FILE_NAME, GenerationLock
+from fastclean.application.generation.profiler import LOAD, RENDER, WRITE, Profiler
+from fastclean.core.exceptions.validation import TemplateRenderException
+from fastclean.infrastructure.file_system.in_memory_file_system import (
+    InMemoryFileSystemService,
+)
+from fastclean.infrastructure.file_system.local_file_system import (
+    LocalFileSystemService,
+)
+from fastclean.infrastructure.file_system.profiling_file_system import (
+    ProfilingFileSystemService,
+)
+from fastclean.infrastructure.templates.jinja_engine import JinjaTemplateEngine
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> JinjaTemplateEngine:
+    templates_dir = tmp_path / "templates" / "crud"
+    templates_dir.mkdir(parents=True)
+    for i in range(8):
+        (templates_dir / f"file{i}.py.j2").write_text(f"# {i} {{{{ name }}}}\n")
+    (templates_dir / "broken.py.j2").write_text("{{ name.missing.attr }}")
+    return JinjaTemplateEngine(tmp_path / "templates")
+
+
+class TestRenderExecutor:
+    """Tests for parallel template rendering."""
+
+    @pytest.mark.parametrize("jobs", [1, 4])
+    def test_output_is_deterministic(self, engine, tmp_path: Path, jobs: int):
+        """Test parallel runs write the same files in job order."""
+        render_jobs = [
+            RenderJob(f"file{i}", "crud", Path(f"out/file{i}.py")) for i in range(8)
+        ]
+        file_system = InMemoryFileSystemService()
+        executor = RenderExecutor(file_system, engine, jobs=jobs)
+
+        results = executor.run(render_jobs, {"name": "demo"}, tmp_path)
+
+        written = [result.path for result in results]
+        assert written == [tmp_path / "out" / f"file{i}.py" for i in range(8)]
+        assert file_system.read_file(written[3]) == "# 3 demo\n"
+
+    def test_failure_names_template(self, engine, tmp_path: Path):
+        """Test the first failing template is reported by name."""
+        render_jobs = [
+            RenderJob("file0", "crud", Path("a.py")),
+            RenderJob("broken", "crud", Path("b.py")),
+            RenderJob("file1", "crud", Path("c.py")),
+        ]
+        executor = RenderExecutor(InMemoryFileSystemService(), engine, jobs=4)
+
+        with pytest.raises(TemplateRenderException) as exc_info:
+            executor.run(render_jobs, {"name": "demo"}, tmp_path)
+
+        assert exc_info.value.template_name == "crud/broken"
+
+    def test_bytes_written_are_utf8(self, engine, tmp_path: Path):
+        """Test written events count encoded bytes, not characters."""
+        executor = RenderExecutor(InMemoryFileSystemService(), engine)
+
+        events = list(
+            executor.stream(
+                [RenderJob("file0", "crud", Path("a.py"))], {"name": "café"}, tmp_path
+            )
+        )
+
+        assert events[-1].bytes_written == len("# 0 café\n".encode())
+
+
+class TestIncrementalRendering:
+    """Tests for lock-driven incremental regeneration."""
+
+    def _run(self, engine, root: Path, context: dict) -> list:
+        file_system = LocalFileSystemService()
+        lock = GenerationLock.load(file_system, root)
+        render_jobs = [
+            RenderJob(f"file{i}", "crud", Path(f"out/file{i}.py")) for i in range(3)
+        ]
+        results = RenderExecutor(file_system, engine, lock=lock).run(
+            render_jobs, context, root
+        )
+        lock.save(file_system)
+        return results
+
+    def test_second_run_is_unchanged(self, engine, tmp_path: Path):
+        """Test an identical run writes nothing."""
+        first = self._run(engine, tmp_path, {"name": "demo"})
+        mtime = first[0].path.stat().st_mtime_ns
+
+        second = self._run(engine, tmp_path, {"name": "demo"})
+
+        assert [r.status for r in first] == [CREATED] * 3
+        assert [r.status for r in second] == [UNCHANGED] * 3
+        assert first[0].path.stat().st_mtime_ns == mtime
+        assert (tmp_path / LOCK_FILE_NAME).exists()
+
+    def test_changes_are_reported(self, engine, tmp_path: Path):
+        """Test template and context changes rewrite with a reason."""
+        self._run(engine, tmp_path, {"name": "demo"})
+        template = tmp_path / "templates" / "crud" / "file1.py.j2"
+        template.write_text("# changed {{ name }}\n")
+        stat = template.stat()
+        os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        results = self._run(engine, tmp_path, {"name": "demo"})
+
+        assert [r.status for r in results] == [UNCHANGED, UPDATED, UNCHANGED]
+        assert results[1].reason == "template changed"
+
+        results = self._run(engine, tmp_path, {"name": "other"})
+
+        assert {r.reason for r in results} == {"context changed"}
+
+    def test_lock_lists_a_file_per_line(self, engine, tmp_path: Path):
+        """Test the lock is JSON with each generated file on its own line."""
+        self._run(engine, tmp_path, {"name": "demo"})
+
+        content = (tmp_path / LOCK_FILE_NAME).read_text()
+
+        assert json.loads(content)["files"]["out/file0.py"]["template"] == (
+            "crud/file0"
+        )
+        lines = [line for line in content.splitlines() if '"out/' in line]
+        assert len(lines) == 3
+        assert all('"output_hash": ' in line for line in lines)
+        assert len(GenerationLock.load(LocalFileSystemService(), tmp_path)) == 3
+
+
+class TestProfiling:
+    """Tests for per-template profiling hooks."""
+
+    def test_stages_and_bytes_recorded(self, engine, tmp_path: Path):
+        """Test load, render and write are timed and bytes attributed."""
+        profiler = Profiler()
+        file_system = ProfilingFileSystemService(InMemoryFileSystemService(), profiler)
+        executor = RenderExecutor(file_system, engine, jobs=2, profiler=profiler)
+
+        with profiler.phase("generate"):
+            executor.run(
+                [RenderJob(f"file{i}", "crud", Path(f"f{i}.py")) for i in range(3)],
+                {"name": "demo"},
+                tmp_path,
+            )
+
+        assert set(profiler.templates["crud/file1"]) == {LOAD, RENDER, WRITE}
+        assert profiler.templates["crud/file1"][WRITE].bytes_written == 9
+        assert profiler.phases["generate"].bytes_written == 27
+        assert profiler.template_totals()["crud/file0"].calls == 1
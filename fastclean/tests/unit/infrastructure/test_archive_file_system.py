@@ -0,0 +1,54 @@
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from fastclean.core.exceptions.base import ValidationException
+from fastclean.infrastructure.file_system.archive_file_system import (
+    ArchiveFileSystemService,
+)
+
+
+class TestArchiveFileSystemService:
+    """Tests for streaming output into archives."""
+
+    @pytest.mark.parametrize("name", ["out.tar.gz", "out.zip"])
+    def test_commit_writes_archive(self, tmp_path: Path, name: str):
+        """Test files are archived relative to root and published on commit."""
+        archive = tmp_path / name
+        file_system = ArchiveFileSystemService(archive, tmp_path)
+        file_system.create_file(tmp_path / "demo" / "src" / "main.py", "app = 1\n")
+
+        assert file_system.directory_exists(tmp_path / "demo" / "src")
+        assert not archive.exists()
+        file_system.commit()
+
+        if name.endswith(".zip"):
+            with zipfile.ZipFile(archive) as zf:
+                names = zf.namelist()
+                content = zf.read("demo/src/main.py")
+        else:
+            with tarfile.open(archive) as tf:
+                names = tf.getnames()
+                content = tf.extractfile("demo/src/main.py").read()
+
+        assert sorted(n.rstrip("/") for n in names) == [
+            "demo",
+            "demo/src",
+            "demo/src/main.py",
+        ]
+        assert content == b"app = 1\n"
+
+    def test_rollback_leaves_nothing(self, tmp_path: Path):
+        """Test a rolled back archive is removed."""
+        file_system = ArchiveFileSystemService(tmp_path / "out.tar", tmp_path)
+        file_system.create_file(tmp_path / "a.py", "")
+        file_system.rollback()
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unsupported_format(self, tmp_path: Path):
+        """Test unknown archive suffixes are rejected."""
+        with pytest.raises(ValidationException):
+            ArchiveFileSystemService(tmp_path / "out.rar")
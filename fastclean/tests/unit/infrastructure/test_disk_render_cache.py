@@ -0,0 +1,105 @@
+import os
+from pathlib import Path
+
+from fastclean.application.generation.executor import RenderExecutor, RenderJob
+from fastclean.infrastructure.cache.disk_render_cache import DiskRenderCache
+from fastclean.infrastructure.file_system.in_memory_file_system import (
+    InMemoryFileSystemService,
+)
+from fastclean.infrastructure.templates.jinja_engine import JinjaTemplateEngine
+
+
+class _CountingEngine(JinjaTemplateEngine):
+    renders = 0
+
+    def render(self, template, context):
+        self.renders += 1
+        return super().render(template, context)
+
+
+class TestDiskRenderCache:
+    """Tests for the persistent render cache."""
+
+    def test_round_trip_across_instances(self, tmp_path: Path):
+        """Test renders stored by one run are served to the next."""
+        DiskRenderCache(tmp_path).set("key", "content ✓")
+
+        cache = DiskRenderCache(tmp_path)
+
+        assert cache.get("key") == "content ✓"
+        assert cache.get("other") is None
+        assert (cache.stats().hits, cache.stats().misses) == (1, 1)
+
+    def test_namespaces_are_isolated(self, tmp_path: Path):
+        """Test another generator version never sees these renders."""
+        DiskRenderCache(tmp_path, namespace="v1").set("key", "old")
+
+        assert DiskRenderCache(tmp_path, namespace="v2").get("key") is None
+
+    def test_evicts_least_recently_used(self, tmp_path: Path):
+        """Test the size bound drops the entries used longest ago."""
+        cache = DiskRenderCache(tmp_path, max_bytes=250)
+        for i, key in enumerate(["a", "b"]):
+            cache.set(key, "x" * 100)
+            path = cache._path(key)
+            os.utime(path, (i, i))
+        cache.get("a")
+
+        cache.set("c", "x" * 100)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats().evictions == 1
+
+    def test_overwrite_keeps_size(self, tmp_path: Path):
+        """Test rewriting an entry counts only its new size."""
+        cache = DiskRenderCache(tmp_path, max_bytes=250)
+        cache.set("a", "x" * 100)
+        for _ in range(5):
+            cache.set("b", "x" * 100)
+
+        assert cache.get("a") is not None
+        assert cache.stats().evictions == 0
+
+    def test_hit_survives_utime_failure(self, tmp_path: Path, monkeypatch):
+        """Test content read successfully is served even if utime fails."""
+        cache = DiskRenderCache(tmp_path)
+        cache.set("key", "content")
+
+        def fail(*args, **kwargs):
+            raise PermissionError("read-only")
+
+        monkeypatch.setattr(os, "utime", fail)
+
+        assert cache.get("key") == "content"
+        assert cache.stats().hits == 1
+
+    def test_clear(self, tmp_path: Path):
+        """Test clear removes every entry and reports them."""
+        cache = DiskRenderCache(tmp_path)
+        cache.set("a", "12345")
+
+        removed = cache.clear()
+
+        assert (removed.entries, removed.size_bytes) == (1, 5)
+        assert cache.stats().entries == 0
+
+    def test_warm_run_skips_rendering(self, tmp_path: Path):
+        """Test a cached render is written without rendering its template."""
+        jobs = [RenderJob("entity", "crud", Path("entity.py"))]
+        context = {"entity_name": "Product", "fields": []}
+        outputs = []
+        for _ in range(2):
+            engine = _CountingEngine()
+            file_system = InMemoryFileSystemService()
+            executor = RenderExecutor(
+                file_system, engine, render_cache=DiskRenderCache(tmp_path)
+            )
+            executor.run(jobs, context, Path("/p"))
+            outputs.append(
+                (engine.renders, file_system.read_file(Path("/p/entity.py")))
+            )
+
+        assert outputs[0][0] == 1
+        assert outputs[1][0] == 0
+        assert outputs[0][1] == outputs[1][1]
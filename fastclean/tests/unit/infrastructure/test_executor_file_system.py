@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+from fastclean.application.use_cases.generate_crud.dto import (
+    FieldDefinition,
+    GenerateCRUDRequest,
+)
+from fastclean.application.use_cases.generate_crud.generate_crud import (
+    GenerateCRUDUseCase,
+)
+from fastclean.infrastructure.file_system.executor_file_system import (
+    ExecutorFileSystemService,
+)
+from fastclean.infrastructure.file_system.in_memory_file_system import (
+    InMemoryFileSystemService,
+)
+from fastclean.infrastructure.file_system.transactional_file_system import (
+    TransactionalFileSystemService,
+)
+from fastclean.infrastructure.templates.jinja_engine import JinjaTemplateEngine
+
+
+def crud_request(root: Path, name: str = "Product") -> GenerateCRUDRequest:
+    return GenerateCRUDRequest(name, root, [FieldDefinition("name", "str")])
+
+
+class SlowFileSystem(InMemoryFileSystemService):
+    """In-memory file system recording how many writes overlap."""
+
+    def __init__(self):
+        super().__init__()
+        self.active = 0
+        self.max_active = 0
+        self._counter = threading.Lock()
+
+    def create_file(self, path: Path, content: str) -> None:
+        with self._counter:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01)
+        super().create_file(path, content)
+        with self._counter:
+            self.active -= 1
+
+
+class TestExecutorFileSystemService:
+    """Tests for the thread pool backed async file system."""
+
+    def test_round_trip(self, tmp_path: Path):
+        """Test writes are visible to reads and listings."""
+
+        async def scenario() -> tuple:
+            async with ExecutorFileSystemService() as file_system:
+                await file_system.create_directories([tmp_path / "src"])
+                await file_system.create_file(tmp_path / "src" / "main.py", "x = 1\n")
+                return (
+                    await file_system.read_file(tmp_path / "src" / "main.py"),
+                    await file_system.file_exists(tmp_path / "src" / "main.py"),
+                    await file_system.list_files(tmp_path / "src", "*.py"),
+                )
+
+        content, exists, files = asyncio.run(scenario())
+
+        assert content == "x = 1\n"
+        assert exists
+        assert files == [tmp_path / "src" / "main.py"]
+
+    def test_pending_writes_are_bounded(self):
+        """Test no more than max_pending_writes writes run at once."""
+        slow = SlowFileSystem()
+
+        async def scenario() -> None:
+            async with ExecutorFileSystemService(
+                slow, max_workers=8, max_pending_writes=2
+            ) as file_system:
+                await asyncio.gather(
+                    *(
+                        file_system.create_file(Path(f"/p/file{i}.py"), "")
+                        for i in range(12)
+                    )
+                )
+
+        asyncio.run(scenario())
+
+        assert slow.max_active == 2
+        assert len(slow.list_files(Path("/p"))) == 12
+
+    def test_bounds_use_case_writes(self):
+        """Test concurrent runs given the file system share its write bound."""
+        slow = SlowFileSystem()
+        roots = [Path(f"/p{i}") for i in range(3)]
+        for root in roots:
+            slow.create_directory(root)
+        use_case = GenerateCRUDUseCase(slow, JinjaTemplateEngine())
+
+        async def scenario() -> None:
+            async with ExecutorFileSystemService(
+                slow, max_workers=8, max_pending_writes=1
+            ) as file_system:
+                await asyncio.gather(
+                    *(
+                        use_case.execute_async(
+                            crud_request(root), file_system=file_system
+                        )
+                        for root in roots
+                    )
+                )
+
+        asyncio.run(scenario())
+
+        assert slow.max_active == 1
+        for root in roots:
+            assert slow.file_exists(root / "src/domain/entities/product.py")
+
+    def test_use_case_commits_through_sessions(self, tmp_path: Path):
+        """Test each run commits its own transaction of the wrapped file system."""
+        use_case = GenerateCRUDUseCase(
+            TransactionalFileSystemService(durable=False), JinjaTemplateEngine()
+        )
+
+        async def scenario() -> list:
+            async with ExecutorFileSystemService(
+                TransactionalFileSystemService(durable=False)
+            ) as file_system:
+                return await asyncio.gather(
+                    *(
+                        use_case.execute_async(
+                            crud_request(tmp_path, name), file_system=file_system
+                        )
+                        for name in ("Product", "Order")
+                    )
+                )
+
+        product, order = asyncio.run(scenario())
+
+        assert all(path.is_file() for path in product.files_created)
+        assert all(path.is_file() for path in order.files_created)
+        registry = (tmp_path / "src/interfaces/api/registry.py").read_text()
+        assert "order.router" in registry and "product.router" in registry
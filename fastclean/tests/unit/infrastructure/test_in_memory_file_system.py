@@ -0,0 +1,71 @@
+from pathlib import Path
+
+from fastclean.infrastructure.file_system.in_memory_file_system import (
+    InMemoryFileSystemService,
+)
+from fastclean.infrastructure.file_system.local_file_system import (
+    LocalFileSystemService,
+)
+from fastclean.presentation.formatters.file_tree import FileTreeFormatter
+
+
+class TestInMemoryFileSystemService:
+    """Tests for the in-memory file system."""
+
+    def test_files_and_directories(self):
+        """Test writes create parent directories and can be listed."""
+        file_system = InMemoryFileSystemService()
+        file_system.create_file(Path("demo/src/main.py"), "app = 1\n")
+        file_system.create_file(Path("demo/src/models.py"), "")
+
+        assert file_system.directory_exists(Path("demo"))
+        assert file_system.read_file(Path("demo/src/main.py")) == "app = 1\n"
+        assert file_system.list_files(Path("demo/src"), "*.py") == [
+            Path("demo/src/main.py"),
+            Path("demo/src/models.py"),
+        ]
+        assert file_system.list_files(Path("demo"), "**/main.py") == [
+            Path("demo/src/main.py")
+        ]
+        assert file_system.sizes()[Path("demo/src/main.py")] == 8
+
+    def test_read_through(self, tmp_path: Path):
+        """Test unwritten paths fall back to disk, which is never modified."""
+        (tmp_path / "existing.py").write_text("old\n")
+        file_system = InMemoryFileSystemService(read_through=True)
+
+        assert file_system.read_file(tmp_path / "existing.py") == "old\n"
+        file_system.create_file(tmp_path / "existing.py", "new\n")
+
+        assert file_system.read_file(tmp_path / "existing.py") == "new\n"
+        assert (tmp_path / "existing.py").read_text() == "old\n"
+
+    def test_snapshot_export(self, tmp_path: Path):
+        """Test a saved snapshot can be exported to disk later."""
+        file_system = InMemoryFileSystemService()
+        file_system.create_file(Path("demo/a.py"), "a\n")
+        file_system.save_snapshot(tmp_path / "snapshot.json")
+
+        restored = InMemoryFileSystemService.load_snapshot(tmp_path / "snapshot.json")
+        count = restored.export(LocalFileSystemService(), tmp_path / "out")
+
+        assert count == 1
+        assert (tmp_path / "out" / "demo" / "a.py").read_text() == "a\n"
+
+
+class TestFileTreeFormatter:
+    """Tests for the dry-run file tree."""
+
+    def test_format(self):
+        """Test directories are listed before files with sizes and a total."""
+        lines = FileTreeFormatter().format(
+            {Path("demo/README.md"): 2048, Path("demo/src/main.py"): 10}
+        )
+
+        assert lines == [
+            "└── demo/",
+            "    ├── src/",
+            "    │   └── main.py (10 B)",
+            "    └── README.md (2.0 KB)",
+            "\n2 files, 2.0 KB",
+        ]
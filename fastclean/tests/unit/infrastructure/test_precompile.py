@@ -0,0 +1,68 @@
+from pathlib import Path
+
+from jinja2 import FileSystemLoader
+
+from fastclean.infrastructure.templates.jinja_engine import JinjaTemplateEngine
+from fastclean.infrastructure.templates.precompile import (
+    PrecompiledTemplates,
+    precompile_templates,
+)
+
+
+def _precompile(tmp_path: Path) -> tuple[Path, Path]:
+    templates_dir = tmp_path / "templates"
+    compiled_dir = tmp_path / "compiled"
+    (templates_dir / "crud").mkdir(parents=True)
+    (templates_dir / "crud" / "entity.py.j2").write_text(
+        "class {{ entity_name|pascal_case }}:\n"
+    )
+    environment = JinjaTemplateEngine.create_environment(
+        FileSystemLoader(str(templates_dir))
+    )
+    precompile_templates(templates_dir, compiled_dir, environment)
+
+    # Mark the module's output, so renders show which side served them
+    (module,) = compiled_dir.glob("tmpl_*.py")
+    module.write_text(module.read_text().replace("'class '", "'module '"))
+    return templates_dir, compiled_dir
+
+
+class TestPrecompiledTemplates:
+    """Tests for build-time template compilation."""
+
+    def test_manifest_records_sources(self, tmp_path: Path):
+        """Test every template is compiled and hashed."""
+        _, compiled_dir = _precompile(tmp_path)
+
+        precompiled = PrecompiledTemplates.load(compiled_dir)
+        assert len(precompiled) == 1
+        assert len(list(compiled_dir.glob("tmpl_*.py"))) == 1
+
+    def test_engine_renders_from_modules(self, tmp_path: Path):
+        """Test unchanged sources render through the ModuleLoader."""
+        templates_dir, compiled_dir = _precompile(tmp_path)
+        engine = JinjaTemplateEngine(templates_dir, compiled_dir=compiled_dir)
+
+        template = engine.load_template("entity", "crud")
+        assert engine.render(template, {"entity_name": "order_item"}) == (
+            "module OrderItem:\n"
+        )
+
+    def test_edited_source_falls_back(self, tmp_path: Path):
+        """Test a template edited after the build is compiled from source."""
+        templates_dir, compiled_dir = _precompile(tmp_path)
+        (templates_dir / "crud" / "entity.py.j2").write_text("edited {{ entity_name }}")
+        engine = JinjaTemplateEngine(templates_dir, compiled_dir=compiled_dir)
+
+        template = engine.load_template("entity", "crud")
+        assert engine.render(template, {"entity_name": "Order"}) == "edited Order"
+
+    def test_without_modules_compiles_sources(self, tmp_path: Path):
+        """Test the engine renders from source when nothing was precompiled."""
+        templates_dir, _ = _precompile(tmp_path)
+        engine = JinjaTemplateEngine(templates_dir, compiled_dir=tmp_path / "none")
+
+        template = engine.load_template("entity", "crud")
+        assert engine.render(template, {"entity_name": "order_item"}) == (
+            "class OrderItem:\n"
+        )
@@ -0,0 +1,133 @@
+import marshal
+import os
+from pathlib import Path
+
+import pytest
+
+from fastclean.application.generation.executor import (
+    UNCHANGED,
+    UPDATED,
+    RenderExecutor,
+    RenderJob,
+)
+from fastclean.application.generation.lock import GenerationLock
+from fastclean.application.generation.profiler import COMPILE, FORMAT, Profiler
+from fastclean.infrastructure.file_system.local_file_system import (
+    LocalFileSystemService,
+)
+from fastclean.infrastructure.post_processing.python_post_processor import (
+    PythonPostProcessor,
+    compile_bytecode,
+    format_source,
+    normalize_whitespace,
+)
+from fastclean.infrastructure.templates.jinja_engine import JinjaTemplateEngine
+
+SOURCE = "import os   \n\n\n\n\n\nclass A:\n    \n    x = 1\n\n\n"
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> JinjaTemplateEngine:
+    templates_dir = tmp_path / "templates" / "crud"
+    templates_dir.mkdir(parents=True)
+    (templates_dir / "model.py.j2").write_text(SOURCE + "# {{ name }}\n")
+    (templates_dir / "notes.md.j2").write_text("{{ name }}   \n")
+    return JinjaTemplateEngine(tmp_path / "templates")
+
+
+class TestPythonPostProcessor:
+    """Tests for formatting and precompiling generated Python."""
+
+    def test_normalize_whitespace(self):
+        """Test trailing whitespace and blank line runs are removed."""
+        assert normalize_whitespace(SOURCE) == (
+            "import os\n\n\nclass A:\n\n    x = 1\n"
+        )
+
+    def test_process_pool_matches_in_process(self):
+        """Test formatting in worker processes gives the in-process result."""
+        post_processor = PythonPostProcessor(max_workers=2)
+        try:
+            formatted = post_processor.format(Path("a.py"), SOURCE)
+        finally:
+            post_processor.close()
+
+        assert formatted == format_source(SOURCE)
+        assert post_processor.format(Path("a.md"), SOURCE) == SOURCE
+
+    def test_run_formats_and_compiles(self, engine, tmp_path: Path):
+        """Test Python renders are formatted, compiled and timed per file."""
+        root = tmp_path / "out"
+        file_system = LocalFileSystemService()
+        profiler = Profiler()
+        lock = GenerationLock(root)
+        executor = RenderExecutor(
+            file_system,
+            engine,
+            lock=lock,
+            profiler=profiler,
+            post_processor=PythonPostProcessor(compile_bytecode=True),
+        )
+        jobs = [
+            RenderJob("model", "crud", Path("model.py")),
+            RenderJob("notes", "crud", Path("notes.md")),
+        ]
+
+        results = executor.run(jobs, {"name": "demo"}, root)
+        executor.compile([result.path for result in results])
+
+        assert (root / "model.py").read_text() == format_source(SOURCE + "# demo\n")
+        assert (root / "notes.md").read_text() == "demo   \n"
+        assert list((root / "__pycache__").glob("model.*.pyc"))
+        assert {FORMAT, COMPILE} <= set(profiler.templates["crud/model"])
+
+    def test_compiles_in_process_pool(self, engine, tmp_path: Path):
+        """Test files compile in worker processes when run with jobs."""
+        root = tmp_path / "out"
+        post_processor = PythonPostProcessor(
+            format_code=False, compile_bytecode=True, max_workers=2
+        )
+        executor = RenderExecutor(
+            LocalFileSystemService(), engine, jobs=2, post_processor=post_processor
+        )
+        jobs = [RenderJob("model", "crud", Path(f"m{i}.py")) for i in range(4)]
+        try:
+            results = executor.run(jobs, {"name": "demo"}, root)
+            executor.compile([result.path for result in results])
+        finally:
+            post_processor.close()
+
+        assert len(list((root / "__pycache__").glob("m*.pyc"))) == 4
+
+    def test_rewrite_in_same_second_recompiles(self, tmp_path: Path):
+        """Test a file rewritten with the same mtime gets fresh bytecode."""
+        path = tmp_path / "mod.py"
+        path.write_text("x = 1\n")
+        assert compile_bytecode(path)
+        mtime = path.stat().st_mtime_ns
+        path.write_text("x = 2\n")
+        os.utime(path, ns=(mtime, mtime))
+
+        assert compile_bytecode(path)
+
+        namespace = {}
+        pyc = next((tmp_path / "__pycache__").glob("mod.*.pyc"))
+        exec(marshal.loads(pyc.read_bytes()[16:]), namespace)
+        assert namespace["x"] == 2
+
+    def test_switching_formatting_rerenders(self, engine, tmp_path: Path):
+        """Test turning formatting on rewrites files rendered without it."""
+        root = tmp_path / "out"
+        file_system = LocalFileSystemService()
+        lock = GenerationLock(root)
+        jobs = [RenderJob("model", "crud", Path("model.py"))]
+
+        RenderExecutor(file_system, engine, lock=lock).run(jobs, {"name": "a"}, root)
+        executor = RenderExecutor(
+            file_system, engine, lock=lock, post_processor=PythonPostProcessor()
+        )
+        first = executor.run(jobs, {"name": "a"}, root)
+        second = executor.run(jobs, {"name": "a"}, root)
+
+        assert [r.status for r in first] == [UPDATED]
+        assert [r.status for r in second] == [UNCHANGED]
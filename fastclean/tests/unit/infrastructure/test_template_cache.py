@@ -0,0 +1,61 @@
+from pathlib import Path
+
+from fastclean.infrastructure.templates.jinja_engine import JinjaTemplateEngine
+from fastclean.infrastructure.templates.template_loader import TemplateCache
+
+
+class TestTemplateCache:
+    """Tests for the LRU template cache."""
+
+    def test_hit_and_miss_counters(self):
+        """Test lookups are counted."""
+        cache = TemplateCache()
+        assert cache.get("base:main") is None
+        cache.set("base:main", "compiled")
+        assert cache.get("base:main") == "compiled"
+
+        stats = cache.stats
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.hit_rate == 0.5
+
+    def test_lru_eviction(self):
+        """Test least recently used entry is evicted."""
+        cache = TemplateCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.has("a")
+        assert not cache.has("b")
+        assert cache.stats.evictions == 1
+
+    def test_mtime_invalidation(self):
+        """Test entry with a different mtime is dropped."""
+        cache = TemplateCache()
+        cache.set("crud:entity", "old", mtime=1.0)
+
+        assert cache.get("crud:entity", mtime=1.0) == "old"
+        assert cache.get("crud:entity", mtime=2.0) is None
+        assert not cache.has("crud:entity")
+        assert cache.stats.invalidations == 1
+
+
+class TestJinjaTemplateEngineCache:
+    """Tests for compiled template reuse in the Jinja engine."""
+
+    def test_render_compiles_once(self, tmp_path: Path):
+        """Test repeated renders reuse the compiled template."""
+        (tmp_path / "crud").mkdir()
+        (tmp_path / "crud" / "entity.py.j2").write_text("class {{ entity_name }}:")
+        engine = JinjaTemplateEngine(tmp_path)
+
+        for name in ["Product", "Order", "Invoice"]:
+            template = engine.load_template("entity", "crud")
+            assert engine.render(template, {"entity_name": name}) == f"class {name}:"
+
+        stats = engine.cache_stats()
+        assert stats["compiled"].misses == 1
+        assert stats["compiled"].hits == 2
+        assert stats["templates"].hits == 2
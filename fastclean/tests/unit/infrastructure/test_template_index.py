@@ -0,0 +1,60 @@
+import os
+from pathlib import Path
+
+from fastclean.infrastructure.templates.template_index import TemplateIndex
+
+MAPPINGS = {"main": "src/main.py"}
+
+
+def _make_templates(root: Path) -> Path:
+    (root / "base").mkdir(parents=True)
+    (root / "base" / "main.py.j2").write_text("app = '{{ project_name }}'")
+    (root / "base" / "env.j2").write_text("DEBUG={{ debug }}")
+    return root
+
+
+class TestTemplateIndex:
+    """Tests for the template index."""
+
+    def test_build_maps_names_to_files(self, tmp_path: Path):
+        """Test index resolves names, output paths and variables."""
+        index = TemplateIndex.build(_make_templates(tmp_path), MAPPINGS)
+
+        entry = index.get("main", "base")
+        assert entry.filename == "main.py.j2"
+        assert entry.output_path == "src/main.py"
+        assert entry.variables == ["project_name"]
+        assert index.names("base") == ["env", "main"]
+        assert index.get("missing", "base") is None
+
+    def test_manifest_round_trip(self, tmp_path: Path):
+        """Test a current manifest is loaded instead of rebuilt."""
+        root = _make_templates(tmp_path)
+        TemplateIndex.build(root, MAPPINGS).write_manifest()
+        (root / "base" / "main.py.j2").write_text("changed")
+
+        index = TemplateIndex.load(root, MAPPINGS)
+        assert index.get("main", "base").variables == ["project_name"]
+
+    def test_stale_manifest_is_rebuilt(self, tmp_path: Path):
+        """Test a manifest not matching the files on disk is ignored."""
+        root = _make_templates(tmp_path)
+        TemplateIndex.build(root, MAPPINGS).write_manifest()
+        (root / "base" / "readme.md.j2").write_text("# {{ project_name }}")
+
+        index = TemplateIndex.load(root, MAPPINGS)
+        assert index.names("base") == ["env", "main", "readme"]
+
+    def test_process_index_follows_directory_changes(self, tmp_path: Path):
+        """Test the shared index is reused until a template is added."""
+        root = _make_templates(tmp_path)
+        first = TemplateIndex.for_directory(root, MAPPINGS)
+        assert TemplateIndex.for_directory(root, MAPPINGS) is first
+
+        (root / "base" / "readme.md.j2").write_text("# {{ project_name }}")
+        # Make the change visible on file systems with coarse mtimes
+        stat = (root / "base").stat()
+        os.utime(root / "base", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        index = TemplateIndex.for_directory(root, MAPPINGS)
+        assert index.names("base") == ["env", "main", "readme"]
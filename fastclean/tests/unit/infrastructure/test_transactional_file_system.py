@@ -0,0 +1,85 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from fastclean.infrastructure.file_system.transactional_file_system import (
+    TransactionalFileSystemService,
+)
+
+
+@pytest.fixture
+def file_system() -> TransactionalFileSystemService:
+    return TransactionalFileSystemService(durable=False)
+
+
+class TestTransactionalFileSystemService:
+    """Tests for staged, all-or-nothing writes."""
+
+    def test_new_tree_published_on_commit(self, file_system, tmp_path: Path):
+        """Test nothing is visible before commit and everything after."""
+        project = tmp_path / "demo"
+        file_system.create_directory(project / "src")
+        file_system.create_file(project / "src" / "main.py", "app = 1\n")
+
+        assert not project.exists()
+        assert file_system.directory_exists(project)
+        assert file_system.read_file(project / "src" / "main.py") == "app = 1\n"
+
+        file_system.commit()
+
+        assert (project / "src" / "main.py").read_text() == "app = 1\n"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["demo"]
+
+    def test_existing_files_replaced(self, file_system, tmp_path: Path):
+        """Test files in existing directories replace their targets."""
+        target = tmp_path / "main.py"
+        target.write_text("old\n")
+
+        file_system.create_file(target, "new\n")
+        file_system.create_file(tmp_path / "pkg" / "mod.py", "x = 1\n")
+
+        assert target.read_text() == "old\n"
+        file_system.commit()
+        assert target.read_text() == "new\n"
+        assert (tmp_path / "pkg" / "mod.py").exists()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["main.py", "pkg"]
+
+    def test_rollback_discards_everything(self, file_system, tmp_path: Path):
+        """Test rollback leaves the destination untouched."""
+        target = tmp_path / "main.py"
+        target.write_text("old\n")
+
+        file_system.create_file(target, "new\n")
+        file_system.create_file(tmp_path / "demo" / "a.py", "")
+        file_system.rollback()
+
+        assert target.read_text() == "old\n"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["main.py"]
+
+    def test_failed_commit_is_undone(self, file_system, tmp_path: Path):
+        """Test a commit failing halfway restores the previous state."""
+        first = tmp_path / "a.py"
+        first.write_text("old\n")
+        file_system.create_file(first, "new\n")
+        file_system.create_file(tmp_path / "b.py", "b\n")
+        # Make publishing the second file fail
+        next(iter(reversed(file_system._replacements.values()))).unlink()
+
+        with pytest.raises(OSError):
+            file_system.commit()
+
+        assert first.read_text() == "old\n"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["a.py"]
+
+    def test_concurrent_lookups(self, file_system, tmp_path: Path):
+        """Test directory lookups are safe while other threads stage files."""
+        project = tmp_path / "demo"
+
+        def stage(index: int) -> bool:
+            file_system.create_file(project / f"pkg{index}" / "mod.py", "x = 1\n")
+            return file_system.directory_exists(project / f"pkg{index}")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert all(pool.map(stage, range(200)))
+        assert len(file_system.list_files(project, "**/*.py")) == 200
@@ -0,0 +1,56 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from fastclean.presentation.server.daemon import GeneratorDaemon
+
+
+@pytest.fixture(scope="module")
+def daemon():
+    return GeneratorDaemon(workers=2)
+
+
+class TestGeneratorDaemon:
+    """Tests for the JSON-RPC generator daemon."""
+
+    def test_runs_commands_relative_to_client(self, daemon, tmp_path: Path):
+        """Test commands run in the client's cwd with captured output."""
+        response = daemon.handle(
+            {
+                "jsonrpc": "2.0",
+                "id": 7,
+                "method": "init",
+                "params": {"argv": ["--name", "demo"], "cwd": str(tmp_path)},
+            }
+        )
+
+        assert response["id"] == 7
+        assert response["result"]["exit_code"] == 0
+        assert "created successfully" in response["result"]["stdout"]
+        assert (tmp_path / "demo" / "src" / "main.py").exists()
+
+    def test_argument_errors_are_returned(self, daemon, tmp_path: Path):
+        """Test parse errors are reported instead of exiting the daemon."""
+        result = daemon.run_command(["crud"], str(tmp_path))
+
+        assert result["exit_code"] == 2
+        assert "ENTITY and --fields are required" in result["stderr"]
+
+    def test_stream_transport(self, tmp_path: Path):
+        """Test line-delimited JSON-RPC over streams, including bad input."""
+        requests = io.StringIO(
+            '{"jsonrpc": "2.0", "id": 1, "method": "ping"}\n'
+            "not json\n"
+            '{"jsonrpc": "2.0", "id": 2, "method": "nope"}\n'
+        )
+        output = io.StringIO()
+        GeneratorDaemon(workers=1).serve_stream(requests, output)
+
+        responses = {
+            r["id"]: r for r in map(json.loads, output.getvalue().splitlines())
+        }
+        assert responses[1]["result"]["workers"] == 1
+        assert responses[None]["error"]["code"] == -32700
+        assert responses[2]["error"]["code"] == -32601
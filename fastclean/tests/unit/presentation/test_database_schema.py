@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import pytest
+
+from fastclean.core.exceptions.base import ValidationException
+from fastclean.presentation.parsers.database_schema import (
+    DatabaseSchemaParser,
+    entity_name,
+    max_length,
+)
+
+
+class TestDatabaseSchemaParser:
+    """Tests for reflecting a database schema."""
+
+    def test_reflects_sqlite(self, database: Path, tmp_path: Path):
+        """Test types, nullability, indexes and foreign keys become fields."""
+        requests = DatabaseSchemaParser().parse(f"sqlite:///{database}", tmp_path)
+
+        assert [(r.entity_name, r.table_name) for r in requests] == [
+            ("Customer", "customers"),
+            ("OrderItem", "order_items"),
+            ("OrderLine", "order_lines"),
+            ("Order", "orders"),
+        ]
+        email, nickname = requests[0].fields
+        assert (email.name, email.type, email.required, email.unique) == (
+            "email",
+            "str",
+            True,
+            True,
+        )
+        assert email.max_length == 255
+        assert nickname.required is False and nickname.nullable is True
+        customer_id, price, shipped, shipped_at = requests[1].fields
+        assert customer_id.foreign_key == "customers.id"
+        assert (price.type, shipped.type, shipped_at.type) == (
+            "float",
+            "bool",
+            "datetime",
+        )
+        assert shipped_at.indexed and not shipped_at.unique
+
+    def test_primary_keys(self, database: Path, tmp_path: Path):
+        """Test keys other than an integer id are kept, in key order."""
+        customers, order_items, order_lines, orders = DatabaseSchemaParser().parse(
+            str(database), tmp_path
+        )
+
+        assert customers.key_fields[0].name == "id"
+        assert not any(f.primary_key for f in customers.fields)
+        order_no = orders.fields[0]
+        assert (order_no.name, order_no.primary_key, order_no.required) == (
+            "order_no",
+            True,
+            False,
+        )
+        assert [f.name for f in order_lines.key_fields] == ["order_no", "line"]
+        assert all(f.required for f in order_lines.key_fields)
+        assert order_lines.fields[2].max_length == 12
+        assert [r.pagination for r in (customers, order_lines, orders)] == [
+            "keyset",
+            "offset",
+            "keyset",
+        ]
+
+    def test_created_at_only_when_present(self, database: Path, tmp_path: Path):
+        """Test only tables with a created_at column get one generated."""
+        requests = DatabaseSchemaParser().parse(str(database), tmp_path)
+
+        assert [r.has_created_at for r in requests] == [True, False, False, False]
+        assert all(f.name != "created_at" for r in requests for f in r.fields)
+
+    def test_keyword_columns_aliased(self, database: Path, tmp_path: Path):
+        """Test keyword columns are aliased with a warning, not rejected."""
+        parser = DatabaseSchemaParser()
+
+        orders = parser.parse(str(database), tmp_path)[-1]
+
+        assert [(f.name, f.column) for f in orders.fields[1:]] == [
+            ("from_", "from"),
+            ("class_", "class"),
+        ]
+        assert len(parser.warnings) == 2
+        assert "'orders.from'" in parser.warnings[0]
+
+    def test_max_length(self):
+        """Test character lengths are read from the column type."""
+        assert max_length("VARCHAR(255)") == 255
+        assert max_length("nchar (8)") == 8
+        assert max_length("TEXT") is None
+        assert max_length("NUMERIC(10, 2)") is None
+
+    def test_entity_names(self):
+        """Test table names become singular PascalCase entity names."""
+        assert entity_name("categories") == "Category"
+        assert entity_name("order_items") == "OrderItem"
+        assert entity_name("addresses") == "Address"
+        assert entity_name("status") == "Status"
+
+    def test_missing_database(self, tmp_path: Path):
+        """Test a missing SQLite file is rejected."""
+        with pytest.raises(ValidationException):
+            DatabaseSchemaParser().parse(str(tmp_path / "missing.db"), tmp_path)
@@ -0,0 +1,170 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from fastclean.core.exceptions.base import ValidationException
+from fastclean.presentation.parsers.openapi_spec import OpenAPISchemaParser
+
+
+@pytest.fixture
+def spec(tmp_path: Path) -> Path:
+    path = tmp_path / "openapi.json"
+    path.write_text(
+        json.dumps(
+            {
+                "openapi": "3.1.0",
+                "components": {
+                    "schemas": {
+                        "Status": {"type": "string", "enum": ["open", "paid"]},
+                        "Customer": {
+                            "type": "object",
+                            "required": ["email"],
+                            "properties": {
+                                "id": {"type": "integer", "readOnly": True},
+                                "email": {"type": "string", "maxLength": 120},
+                                "tags": {"type": "array", "items": {}},
+                            },
+                        },
+                        "Order": {
+                            "type": "object",
+                            "required": ["customer", "status", "note"],
+                            "properties": {
+                                "customer": {"$ref": "#/components/schemas/Customer"},
+                                "status": {"type": "string", "enum": ["open", "paid"]},
+                                "note": {"type": ["string", "null"]},
+                                "placed_at": {"type": "string", "format": "date-time"},
+                            },
+                        },
+                    }
+                },
+            }
+        )
+    )
+    return path
+
+
+class TestOpenAPISchemaParser:
+    """Tests for parsing OpenAPI component schemas."""
+
+    def test_object_schemas(self, spec: Path, tmp_path: Path):
+        """Test object schemas become entities with constrained fields."""
+        requests = OpenAPISchemaParser().parse(spec, tmp_path)
+
+        assert [r.entity_name for r in requests] == ["Customer", "Order"]
+        (email,) = requests[0].fields
+        assert (email.type, email.max_length, email.required) == ("str", 120, True)
+        customer, status, note, placed_at = requests[1].fields
+        assert (customer.name, customer.foreign_key) == (
+            "customer_id",
+            "customers.id",
+        )
+        assert status.enum == ["open", "paid"]
+        assert note.required is False and note.nullable is True
+        assert placed_at.type == "datetime" and placed_at.nullable is True
+
+    def test_streaming_matches_json_load(self, spec: Path, tmp_path: Path, monkeypatch):
+        """Test schemas streamed with ijson parse like the loaded document."""
+        pytest.importorskip("ijson")
+        streamed = OpenAPISchemaParser().parse(spec, tmp_path)
+
+        monkeypatch.setitem(sys.modules, "ijson", None)
+        loaded = OpenAPISchemaParser().parse(spec, tmp_path)
+
+        assert streamed == loaded
+
+    def test_json_fallback(self, spec: Path, tmp_path: Path, monkeypatch):
+        """Test documents are loaded whole when ijson is unavailable."""
+        monkeypatch.setitem(sys.modules, "ijson", None)
+
+        requests = OpenAPISchemaParser().parse(spec, tmp_path)
+
+        assert [len(r.fields) for r in requests] == [1, 4]
+
+    def test_definitions(self, tmp_path: Path):
+        """Test Swagger 2 definitions are read when there are no components."""
+        path = tmp_path / "swagger.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "swagger": "2.0",
+                    "definitions": {
+                        "Tag": {
+                            "type": "object",
+                            "properties": {"label": {"type": "string"}},
+                        }
+                    },
+                }
+            )
+        )
+
+        requests = OpenAPISchemaParser().parse(path, tmp_path)
+
+        assert [(r.entity_name, r.fields[0].name) for r in requests] == [
+            ("Tag", "label")
+        ]
+
+    def test_names_normalized_with_warnings(self, tmp_path: Path):
+        """Test non-identifier schema and property names are renamed."""
+        path = tmp_path / "openapi.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "openapi": "3.0.0",
+                    "components": {
+                        "schemas": {
+                            "Pet.Response": {
+                                "type": "object",
+                                "properties": {
+                                    "from": {"type": "string"},
+                                    "e-mail": {"type": "string"},
+                                    "e_mail": {"type": "string"},
+                                },
+                            },
+                            "User-Profile": {
+                                "type": "object",
+                                "properties": {
+                                    "pet": {"$ref": "#/components/schemas/Pet.Response"}
+                                },
+                            },
+                            "1st": {
+                                "type": "object",
+                                "properties": {"name": {"type": "string"}},
+                            },
+                        }
+                    },
+                }
+            )
+        )
+
+        parser = OpenAPISchemaParser()
+        requests = parser.parse(path, tmp_path)
+
+        assert [r.entity_name for r in requests] == ["PetResponse", "UserProfile"]
+        assert [(f.name, f.column) for f in requests[0].fields] == [
+            ("from_", "from"),
+            ("e_mail", None),
+        ]
+        assert requests[1].fields[0].foreign_key == "pet_responses.id"
+        assert len(parser.warnings) == 5
+        assert parser.warnings[0].startswith("Property 'Pet.Response.from'")
+        assert parser.warnings[2].startswith("Schema 'Pet.Response'")
+        assert "'1st'" in parser.warnings[-1]
+
+    def test_invalid_yaml(self, tmp_path: Path):
+        """Test a malformed YAML spec is rejected as a validation error."""
+        pytest.importorskip("yaml")
+        path = tmp_path / "openapi.yaml"
+        path.write_text("components: [unclosed\n")
+
+        with pytest.raises(ValidationException):
+            OpenAPISchemaParser().parse(path, tmp_path)
+
+    def test_no_object_schemas(self, tmp_path: Path):
+        """Test a spec without object schemas is rejected."""
+        path = tmp_path / "empty.json"
+        path.write_text('{"openapi": "3.0.0", "paths": {}}')
+
+        with pytest.raises(ValidationException):
+            OpenAPISchemaParser().parse(path, tmp_path)
@@ -0,0 +1,15 @@
+from fastclean.presentation.formatters.progress_bar import ProgressBar
+
+
+class TestProgressBar:
+    """Tests for the determinate progress bar."""
+
+    def test_shows_counts_and_clears(self, capsys):
+        """Test the final count is drawn and the line cleared on exit."""
+        with ProgressBar("Generating...", total=3) as progress:
+            for done in range(1, 4):
+                progress.update(done, bytes_written=512)
+
+        output = capsys.readouterr().out
+        assert "3/3 · 1.5 KB" in output
+        assert output.endswith("\r")
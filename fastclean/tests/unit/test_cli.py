@@ -1,5 +1,9 @@
+import subprocess
+import sys
 from pathlib import Path
 
+import pytest
+
 
 class TestCLIInit:
     """Tests for init command."""
@@ -39,3 +43,65 @@ class TestProjectGeneration:
         """Test temp path fixture."""
         assert temp_project_path is not None
         assert isinstance(temp_project_path, Path)
+
+
+class TestCLIArguments:
+    """Cross-checks between command-line options."""
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["init", "--name", "demo", "--compile", "--dry-run"],
+            ["init", "--name", "demo", "--compile", "--output-archive", "demo.zip"],
+        ],
+    )
+    def test_compile_needs_files_on_disk(self, argv, capsys):
+        """Test --compile is rejected where nothing is written to disk."""
+        from fastclean.cli.main import build_parser, parse_args
+
+        with pytest.raises(SystemExit):
+            parse_args(*build_parser(), argv)
+
+        assert "--compile cannot be combined" in capsys.readouterr().err
+
+
+def _import_times(*args: str) -> dict[str, int]:
+    """Cumulative import time in microseconds per module, via -X importtime"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).resolve().parents[2],
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestCLIStartup:
+    """Import-time budget of the CLI entry point."""
+
+    # Generous so slow CI machines pass; a regression to eager imports costs
+    # several times this
+    BUDGET_US = 100_000
+
+    HEAVY_MODULES = ["jinja2", "fastclean.application", "fastclean.infrastructure"]
+
+    def test_import_is_light(self):
+        """Test importing the CLI loads no use cases, templates or Jinja."""
+        times = _import_times("-c", "import fastclean.cli.main")
+
+        assert times["fastclean.cli.main"] < self.BUDGET_US
+        for heavy in self.HEAVY_MODULES:
+            assert not [name for name in times if name.startswith(heavy)]
+
+    def test_help_is_light(self):
+        """Test --help and argument errors build no services."""
+        for args in (["--help"], ["crud"]):
+            times = _import_times("-m", "fastclean.cli.main", *args)
+
+            assert not [name for name in times if name.startswith("jinja2")]